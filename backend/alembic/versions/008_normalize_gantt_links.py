@@ -0,0 +1,66 @@
+"""normalize stored gantt links
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18
+"""
+
+import json
+from uuid import NAMESPACE_URL, uuid5
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "008"
+down_revision = "007"
+branch_labels = None
+depends_on = None
+
+projects = sa.table(
+    "projects",
+    sa.column("id", sa.Integer),
+    sa.column("settings", sa.JSON().with_variant(postgresql.JSONB(), "postgresql")),
+)
+
+
+def _normalize_links(links_raw: list) -> list[dict]:
+    # Same id scheme as ProjectService so ids already shown to clients stay valid
+    normalized = []
+    for link in links_raw:
+        if not isinstance(link, dict):
+            continue
+        source = link.get("source")
+        target = link.get("target")
+        if not source or not target:
+            continue
+        source, target = str(source), str(target)
+        link_id = link.get("id") or uuid5(NAMESPACE_URL, f"gantt-link:{source}->{target}").hex
+        normalized.append({"id": str(link_id), "source": source, "target": target, "type": link.get("type") or "e2s"})
+    return normalized
+
+
+def upgrade():
+    connection = op.get_bind()
+    rows = connection.execute(sa.select(projects.c.id, projects.c.settings)).fetchall()
+
+    for row in rows:
+        settings = row.settings
+        if isinstance(settings, str):
+            settings = json.loads(settings)
+        if not isinstance(settings, dict) or not settings.get("gantt_links"):
+            continue
+
+        links = _normalize_links(settings["gantt_links"])
+        if links == settings["gantt_links"]:
+            continue
+        connection.execute(
+            projects.update().where(projects.c.id == row.id).values(settings={**settings, "gantt_links": links})
+        )
+
+
+def downgrade():
+    # Normalized links are a superset of the legacy shape; nothing to undo.
+    pass
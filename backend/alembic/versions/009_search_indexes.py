@@ -0,0 +1,64 @@
+"""search indexes
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "009"
+down_revision = "008"
+branch_labels = None
+depends_on = None
+
+# Full-text GIN indexes; the expressions must match SearchRepository's queries
+_FTS_INDEXES = {
+    "ix_transcriptions_full_text_fts": ("transcriptions", "full_text"),
+    "ix_transcriptions_summary_fts": ("transcriptions", "summary"),
+}
+
+# Trigram GIN indexes so the remaining substring ILIKE searches avoid sequential scans
+_TRGM_INDEXES = {
+    "ix_meetings_filename_trgm": ("meetings", "filename"),
+    "ix_meetings_notes_trgm": ("meetings", "notes"),
+    "ix_action_items_task_trgm": ("action_items", "task"),
+    "ix_action_items_owner_trgm": ("action_items", "owner"),
+    "ix_action_items_notes_trgm": ("action_items", "notes"),
+}
+
+
+def upgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # The models declare the same indexes for fresh installs, hence if_not_exists
+    for name, (table, column) in _FTS_INDEXES.items():
+        op.create_index(
+            name,
+            table,
+            [sa.text(f"to_tsvector('english'::regconfig, {column})")],
+            postgresql_using="gin",
+            if_not_exists=True,
+        )
+    for name, (table, column) in _TRGM_INDEXES.items():
+        op.create_index(
+            name,
+            table,
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+            if_not_exists=True,
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for name, (table, _) in {**_FTS_INDEXES, **_TRGM_INDEXES}.items():
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,37 @@
+"""meeting tags trigram index
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "010"
+down_revision = "009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    # Serves the search tag prefilter: lower(tags) LIKE '%tag%'. pg_trgm is enabled by 009.
+    op.create_index(
+        "ix_meetings_tags_lower_trgm",
+        "meetings",
+        [sa.text("lower(tags) gin_trgm_ops")],
+        postgresql_using="gin",
+        if_not_exists=True,
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_index("ix_meetings_tags_lower_trgm", table_name="meetings")
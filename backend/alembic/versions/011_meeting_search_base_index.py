@@ -0,0 +1,32 @@
+"""meeting search base index
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "011"
+down_revision = "010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Serves the search base filter: completed meetings by folder and date range.
+    # Partial on PostgreSQL, where other statuses are never searched.
+    op.create_index(
+        "ix_meetings_search_base",
+        "meetings",
+        ["folder", "meeting_date"],
+        postgresql_where=sa.text("status = 'completed'"),
+        if_not_exists=True,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_meetings_search_base", table_name="meetings")
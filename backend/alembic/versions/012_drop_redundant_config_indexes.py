@@ -0,0 +1,31 @@
+"""drop redundant configuration indexes
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "012"
+down_revision = "011"
+branch_labels = None
+depends_on = None
+
+# Single-column indexes that are leftmost prefixes of idx_model_config_provider_active
+# and idx_embedding_provider_active respectively
+_REDUNDANT_INDEXES = (
+    ("ix_model_configurations_chat_provider", "model_configurations", "chat_provider"),
+    ("ix_embedding_configurations_provider", "embedding_configurations", "provider"),
+)
+
+
+def upgrade():
+    for name, table, _column in _REDUNDANT_INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
+
+
+def downgrade():
+    for name, table, column in _REDUNDANT_INDEXES:
+        op.create_index(name, table, [column], if_not_exists=True)
@@ -0,0 +1,38 @@
+"""reorder model configuration default index
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "013"
+down_revision = "012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The default-configuration lookup filters on is_default alone, so the composite
+    # leads with it and the standalone is_default index becomes redundant.
+    op.create_index(
+        "idx_model_config_default_provider",
+        "model_configurations",
+        ["is_default", "chat_provider"],
+        if_not_exists=True,
+    )
+    op.drop_index("idx_model_config_provider_active", table_name="model_configurations", if_exists=True)
+    op.drop_index("ix_model_configurations_is_default", table_name="model_configurations", if_exists=True)
+
+
+def downgrade():
+    op.create_index("ix_model_configurations_is_default", "model_configurations", ["is_default"], if_not_exists=True)
+    op.create_index(
+        "idx_model_config_provider_active",
+        "model_configurations",
+        ["chat_provider", "is_default"],
+        if_not_exists=True,
+    )
+    op.drop_index("idx_model_config_default_provider", table_name="model_configurations", if_exists=True)
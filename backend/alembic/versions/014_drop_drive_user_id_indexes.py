@@ -0,0 +1,31 @@
+"""drop google drive user_id indexes
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "014"
+down_revision = "013"
+branch_labels = None
+depends_on = None
+
+# google_drive_credentials.user_id is the primary key, which is already indexed.
+# google_drive_sync_config.user_id holds the same "default" value in every row.
+_REDUNDANT_INDEXES = (
+    ("ix_google_drive_credentials_user_id", "google_drive_credentials"),
+    ("ix_google_drive_sync_config_user_id", "google_drive_sync_config"),
+)
+
+
+def upgrade():
+    for name, table in _REDUNDANT_INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
+
+
+def downgrade():
+    for name, table in _REDUNDANT_INDEXES:
+        op.create_index(name, table, ["user_id"], if_not_exists=True)
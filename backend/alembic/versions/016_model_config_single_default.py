@@ -0,0 +1,39 @@
+"""enforce a single default model configuration
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "016"
+down_revision = "015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keep the oldest default if several rows claim it, so the unique index can be built
+    op.execute(
+        sa.text(
+            "UPDATE model_configurations SET is_default = false "
+            "WHERE is_default AND id <> (SELECT min(id) FROM model_configurations WHERE is_default)"
+        )
+    )
+    op.create_index(
+        "uq_model_config_single_default",
+        "model_configurations",
+        ["is_default"],
+        unique=True,
+        postgresql_where=sa.text("is_default"),
+        sqlite_where=sa.text("is_default"),
+        if_not_exists=True,
+    )
+
+
+def downgrade():
+    op.drop_index("uq_model_config_single_default", table_name="model_configurations", if_exists=True)
@@ -110,6 +110,10 @@ class DatabaseConfig:
 
     url: str
     echo: bool = False
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_timeout: int = 30
+    pool_recycle: int = 1800
 
 
 @dataclass
@@ -197,6 +201,10 @@ def get_database_config() -> DatabaseConfig:
     return DatabaseConfig(
         url=os.getenv("DATABASE_URL", "sqlite:///./app.db"),
         echo=os.getenv("DATABASE_ECHO", "false").lower() == "true",
+        pool_size=int(os.getenv("DATABASE_POOL_SIZE", "10")),
+        max_overflow=int(os.getenv("DATABASE_MAX_OVERFLOW", "20")),
+        pool_timeout=int(os.getenv("DATABASE_POOL_TIMEOUT", "30")),
+        pool_recycle=int(os.getenv("DATABASE_POOL_RECYCLE", "1800")),
     )
 
 
@@ -1,9 +1,10 @@
-import json
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 # Optional imports for export formats
@@ -27,8 +28,14 @@ def export_to_json(data: dict[str, Any], filename: str) -> Path:
     path = Path(filename)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+    # Datetimes are passed through to default=str so the output matches the json module's
+    path.write_bytes(
+        orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+    )
 
     logger.info(f"Exported meeting data to JSON: {path}")
     return path
@@ -2,9 +2,27 @@ from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
-from .core.config import config
+from .core.config import DatabaseConfig, config
 
-engine = create_engine(config.database.url, echo=config.database.echo)
+
+def _engine_options(database: DatabaseConfig) -> dict:
+    """Connection pool options for ``create_engine``.
+
+    Pooled connections are pinged on checkout so stale sockets are replaced
+    instead of failing the request. SQLite keeps SQLAlchemy's default pool.
+    """
+    options = {"echo": database.echo, "pool_pre_ping": True}
+    if not database.url.startswith("sqlite"):
+        options.update(
+            pool_size=database.pool_size,
+            max_overflow=database.max_overflow,
+            pool_timeout=database.pool_timeout,
+            pool_recycle=database.pool_recycle,
+        )
+    return options
+
+
+engine = create_engine(config.database.url, **_engine_options(config.database))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
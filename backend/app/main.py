@@ -56,6 +56,14 @@ else:
     except Exception as exc:  # pragma: no cover - best effort for non-Postgres setups
         logger.warning("Could not ensure pgvector extension: %s", exc)
 
+    # pg_trgm backs the trigram search indexes declared on the meetings models
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            connection.commit()
+    except Exception as exc:  # pragma: no cover - best effort for non-Postgres setups
+        logger.warning("Could not ensure pg_trgm extension: %s", exc)
+
     # Create all tables in the database (for new installations)
     Base.metadata.create_all(bind=engine)
 
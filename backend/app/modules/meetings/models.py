@@ -1,13 +1,23 @@
 import enum
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import JSON, Boolean, Column, DateTime, Float, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import JSON, Boolean, Column, DateTime, Float, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from ...database import Base
 
 
+def _search_index(name: str, expression: str, trigram: bool = True) -> Index:
+    """PostgreSQL-only GIN index backing the search module (see migrations 009/010).
+
+    ``trigram`` indexes serve ``ILIKE '%q%'`` on ``expression`` via pg_trgm;
+    otherwise ``expression`` is expected to be a tsvector for full-text search.
+    """
+    opclass = " gin_trgm_ops" if trigram else ""
+    return Index(name, text(expression + opclass), postgresql_using="gin").ddl_if(dialect="postgresql")
+
+
 class MeetingStatus(enum.Enum):
     PENDING = "pending"
     PROCESSING = "processing"
@@ -70,6 +80,16 @@ class Meeting(Base):
         Index("idx_meeting_folder_status", "folder", "status"),
         Index("idx_meeting_date_status", "meeting_date", "status"),
         Index("idx_meeting_embeddings", "embeddings_computed", "embeddings_updated_at"),
+        # Search only ever looks at completed meetings, filtered by folder and date
+        Index(
+            "ix_meetings_search_base",
+            "folder",
+            "meeting_date",
+            postgresql_where=text("status = 'completed'"),
+        ),
+        _search_index("ix_meetings_filename_trgm", "filename"),
+        _search_index("ix_meetings_notes_trgm", "notes"),
+        _search_index("ix_meetings_tags_lower_trgm", "lower(tags)"),
     )
 
 
@@ -99,6 +119,11 @@ class Transcription(Base):
     meeting = relationship("Meeting", back_populates="transcription")
     action_items = relationship("ActionItem", back_populates="transcription", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        _search_index("ix_transcriptions_full_text_fts", "to_tsvector('english'::regconfig, full_text)", trigram=False),
+        _search_index("ix_transcriptions_summary_fts", "to_tsvector('english'::regconfig, summary)", trigram=False),
+    )
+
 
 class ActionItem(Base):
     __tablename__ = "action_items"
@@ -119,6 +144,12 @@ class ActionItem(Base):
 
     transcription = relationship("Transcription", back_populates="action_items")
 
+    __table_args__ = (
+        _search_index("ix_action_items_task_trgm", "task"),
+        _search_index("ix_action_items_owner_trgm", "owner"),
+        _search_index("ix_action_items_notes_trgm", "notes"),
+    )
+
 
 class Speaker(Base):
     __tablename__ = "speakers"
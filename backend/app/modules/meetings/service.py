@@ -589,6 +589,15 @@ class MeetingService:
             enriched.append(schemas.ActionItemWithMeeting(**item_dict))
         return enriched
 
+    def ensure_transcription_for_meeting(self, meeting_id: int) -> models.Transcription:
+        """Return the meeting's transcription, creating an empty one to hold manual action items."""
+        transcription = self.transcription_repo.get_by_meeting(meeting_id)
+        if transcription is None:
+            transcription = self.transcription_repo.create(
+                obj_in={"meeting_id": meeting_id, "summary": "", "full_text": ""}
+            )
+        return transcription
+
     def add_action_item(self, transcription_id: int, item_data: schemas.ActionItemCreate) -> models.ActionItem:
         return self.action_item_repo.create_action_item(
             transcription_id=transcription_id, item_data=item_data, is_manual=True
@@ -12,6 +12,7 @@ from sqlalchemy import (
     UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -34,7 +35,8 @@ class Project(Base):
     actual_end_date = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
-    settings = Column(JSONB, nullable=False, default={}, server_default="{}")
+    # MutableDict tracks in-place key assignments, so writers need not reassign the dict
+    settings = Column(MutableDict.as_mutable(JSONB), nullable=False, default=dict, server_default="{}")
     tags = Column(JSONB, nullable=False, default=list, server_default="[]")
 
     # Relationships
@@ -4,8 +4,8 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import and_, func, or_, select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import Select, and_, case, exists, func, insert, literal, or_, select, union_all
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.models import ActionItem, DiarizationTiming, Meeting, MeetingStatus, Speaker, Transcription
 
@@ -27,6 +27,7 @@ class ProjectRepository:
 
     def __init__(self, db: Session):
         self.db = db
+        self._meeting_ids_subqueries: dict[int, Select] = {}
 
     def get(self, project_id: int) -> Project | None:
         """Get project by ID."""
@@ -39,6 +40,13 @@ class ProjectRepository:
             query = query.filter(Project.status == status)
         return query.order_by(Project.created_at.desc()).all()
 
+    def list_tags(self, status: str | None = None) -> list[tuple[int, list | str | None]]:
+        """Return ``(project_id, tags)`` pairs without loading full Project rows."""
+        query = self.db.query(Project.id, Project.tags)
+        if status:
+            query = query.filter(Project.status == status)
+        return [(row[0], row[1]) for row in query.all()]
+
     def create(self, data: dict, meeting_ids: list[int]) -> Project:
         """Create a new project with associated meetings."""
         project_data = {k: v for k, v in data.items() if k != "meeting_ids"}
@@ -46,8 +54,9 @@ class ProjectRepository:
         self.db.add(project)
         self.db.flush()
 
-        for meeting_id in meeting_ids:
-            self.db.add(ProjectMeeting(project_id=project.id, meeting_id=meeting_id))
+        self.bulk_add_meeting_links(
+            [{"project_id": project.id, "meeting_id": mid} for mid in dict.fromkeys(meeting_ids)]
+        )
 
         self.db.commit()
         self.db.refresh(project)
@@ -95,8 +104,15 @@ class ProjectRepository:
 
         Uses the modern ``select()`` construct so that ``.in_()`` works
         consistently on both PostgreSQL and SQLite (SQLAlchemy 2.x).
+
+        The construct is immutable and only evaluated when the enclosing
+        statement runs, so it is built once per project and reused.
         """
-        return select(ProjectMeeting.meeting_id).where(ProjectMeeting.project_id == project_id)
+        subquery = self._meeting_ids_subqueries.get(project_id)
+        if subquery is None:
+            subquery = select(ProjectMeeting.meeting_id).where(ProjectMeeting.project_id == project_id)
+            self._meeting_ids_subqueries[project_id] = subquery
+        return subquery
 
     def get_meeting_ids_list(self, project_id: int) -> list[int]:
         """Return a plain list of meeting IDs for a project."""
@@ -127,14 +143,21 @@ class ProjectRepository:
 
     def validate_meeting_ids(self, meeting_ids: list[int]) -> set[int]:
         """Return the subset of meeting_ids that actually exist in the DB."""
-        rows = self.db.query(Meeting.id).filter(Meeting.id.in_(meeting_ids)).all()
-        return {row[0] for row in rows}
+        return set(self.db.scalars(select(Meeting.id).where(Meeting.id.in_(meeting_ids))))
 
     def delete_meetings_by_ids(self, meeting_ids) -> None:
         """Bulk-delete meetings matching a list/subquery of IDs."""
         self.db.query(Meeting).filter(Meeting.id.in_(meeting_ids)).delete(synchronize_session=False)
         self.db.commit()
 
+    def project_exists(self, project_id: int) -> bool:
+        """Return True if a project with this ID exists, without loading it."""
+        return bool(self.db.query(exists().where(Project.id == project_id)).scalar())
+
+    def meeting_exists(self, meeting_id: int) -> bool:
+        """Return True if a meeting with this ID exists, without loading it."""
+        return bool(self.db.query(exists().where(Meeting.id == meeting_id)).scalar())
+
     def get_meeting_by_id(self, meeting_id: int) -> Meeting | None:
         """Get a single Meeting record by primary key."""
         return self.db.query(Meeting).filter(Meeting.id == meeting_id).first()
@@ -150,35 +173,74 @@ class ProjectRepository:
         sort_by: str = "date",
         sort_order: str = "desc",
     ) -> list[Meeting]:
-        """Get project meetings with optional status filter and sorting."""
+        """Get project meetings with optional status filter and sorting.
+
+        Speakers and transcription action items are selectin-loaded because
+        the meeting payload reads both for every row.
+        """
         meeting_ids = self.get_meeting_ids_subquery(project_id)
-        query = self.db.query(Meeting).filter(Meeting.id.in_(meeting_ids))
+        query = (
+            self.db.query(Meeting)
+            .options(
+                selectinload(Meeting.speakers),
+                selectinload(Meeting.transcription).selectinload(Transcription.action_items),
+            )
+            .filter(Meeting.id.in_(meeting_ids))
+        )
         if status:
             query = query.filter(Meeting.status == status)
         order_col = Meeting.meeting_date if sort_by == "date" else Meeting.created_at
         query = query.order_by(order_col.desc()) if sort_order == "desc" else query.order_by(order_col.asc())
         return query.all()
 
-    def get_dated_meetings_by_project(self, project_id: int) -> list[Meeting]:
-        """Get project meetings that have a meeting_date set, ordered by date asc."""
+    def get_dated_meeting_rows_by_project(self, project_id: int) -> list:
+        """Get the Gantt columns of project meetings that have a meeting_date set, ordered by date asc.
+
+        Rows carry ``id``, ``filename``, ``meeting_date``, ``estimated_duration``,
+        ``folder`` and ``status`` only, so no full Meeting objects are loaded.
+        """
         meeting_ids = self.get_meeting_ids_subquery(project_id)
-        return (
-            self.db.query(Meeting)
-            .filter(Meeting.id.in_(meeting_ids), Meeting.meeting_date.isnot(None))
+        query = (
+            select(
+                Meeting.id,
+                Meeting.filename,
+                Meeting.meeting_date,
+                Meeting.estimated_duration,
+                Meeting.folder,
+                Meeting.status,
+            )
+            .where(Meeting.id.in_(meeting_ids), Meeting.meeting_date.isnot(None))
             .order_by(Meeting.meeting_date)
-            .all()
         )
+        return self.db.execute(query).all()
+
+    def get_recent_activity_rows(self, project_id: int, limit: int = 50) -> list:
+        """Return the newest ``limit`` activity rows for a project.
 
-    def get_recent_meetings_by_project(self, project_id: int, limit: int = 50) -> list[Meeting]:
-        """Get most recently created meetings in a project."""
+        Meeting additions and milestone completions are merged with a single
+        ``UNION ALL ... ORDER BY timestamp DESC LIMIT`` query. Each branch is
+        limited first as well, so the merge only ever sees ``2 * limit`` rows.
+        Each row has ``type``, ``timestamp``, ``entity_id`` and ``name`` columns.
+        """
         meeting_ids = self.get_meeting_ids_subquery(project_id)
-        return (
-            self.db.query(Meeting)
-            .filter(Meeting.id.in_(meeting_ids))
-            .order_by(Meeting.created_at.desc())
-            .limit(limit)
-            .all()
-        )
+        meetings = select(
+            literal("meeting_added").label("type"),
+            Meeting.created_at.label("timestamp"),
+            Meeting.id.label("entity_id"),
+            Meeting.filename.label("name"),
+        ).where(Meeting.id.in_(meeting_ids), Meeting.created_at.isnot(None))
+        meetings = meetings.order_by(Meeting.created_at.desc()).limit(limit).subquery()
+        milestones = select(
+            literal("milestone_completed").label("type"),
+            ProjectMilestone.completed_at.label("timestamp"),
+            ProjectMilestone.id.label("entity_id"),
+            ProjectMilestone.name.label("name"),
+        ).where(ProjectMilestone.project_id == project_id, ProjectMilestone.completed_at.isnot(None))
+        milestones = milestones.order_by(ProjectMilestone.completed_at.desc()).limit(limit).subquery()
+        # Branch subqueries keep ORDER BY/LIMIT legal inside the compound select on SQLite too
+        activity = union_all(select(meetings), select(milestones)).subquery()
+        query = select(activity).order_by(activity.c.timestamp.desc()).limit(limit)
+        return self.db.execute(query).all()
 
     def get_project_meetings_query(self, project_id: int, data_meeting_id: int | None = None) -> Meeting | None:
         """Get the best meeting for a project action item creation."""
@@ -203,6 +265,29 @@ class ProjectRepository:
             .first()
         )
 
+    def bulk_add_meeting_links(self, rows: list[dict]) -> None:
+        """Insert many project–meeting links in a single multi-row INSERT (no commit)."""
+        if rows:
+            self.db.execute(insert(ProjectMeeting), rows)
+
+    def meeting_in_project(self, project_id: int, meeting_id: int) -> bool:
+        """Return True if the meeting is linked to the project, without loading the link."""
+        return bool(
+            self.db.query(
+                exists().where(ProjectMeeting.project_id == project_id, ProjectMeeting.meeting_id == meeting_id)
+            ).scalar()
+        )
+
+    def remove_meeting_from_projects(self, meeting_id: int, project_ids: list[int]) -> int:
+        """Bulk-delete a meeting's links to the given projects (no commit)."""
+        if not project_ids:
+            return 0
+        return (
+            self.db.query(ProjectMeeting)
+            .filter(ProjectMeeting.meeting_id == meeting_id, ProjectMeeting.project_id.in_(project_ids))
+            .delete(synchronize_session=False)
+        )
+
     def remove_meeting_link(self, project_id: int, meeting_id: int) -> int:
         """Delete a project–meeting link. Returns number of deleted rows."""
         result = (
@@ -216,14 +301,16 @@ class ProjectRepository:
         self.db.commit()
         return result
 
-    def sync_meetings(self, project: Project, meeting_ids: list[int]) -> None:
-        """Synchronise project meetings to exactly the given list."""
+    def sync_meetings(self, project: Project, meeting_ids: list[int]) -> set[int]:
+        """Synchronise project meetings to exactly the given list.
+
+        Returns the IDs of meetings that were newly linked.
+        """
         existing_ids = set(self.get_meeting_ids_list(project.id))
         desired_ids = set(meeting_ids)
         to_add = desired_ids - existing_ids
         to_remove = existing_ids - desired_ids
-        for mid in to_add:
-            self.db.add(ProjectMeeting(project_id=project.id, meeting_id=mid))
+        self.bulk_add_meeting_links([{"project_id": project.id, "meeting_id": mid} for mid in to_add])
         if to_remove:
             (
                 self.db.query(ProjectMeeting)
@@ -234,7 +321,7 @@ class ProjectRepository:
                 .delete(synchronize_session=False)
             )
         self.db.commit()
-        self.db.refresh(project)
+        return to_add
 
     # -------------------------------------------------------------------------
     # Cross-module analytics
@@ -257,6 +344,24 @@ class ProjectRepository:
             query = query.filter(ActionItem.status == status)
         return query.scalar() or 0
 
+    def get_project_counts(self, project_id: int) -> tuple[int, int, int, int]:
+        """Return ``(meetings, action_items, completed_action_items, members)`` for a project in one query."""
+        meeting_ids = self.get_meeting_ids_subquery(project_id)
+        action_items = (
+            select(func.count(ActionItem.id))
+            .join(Transcription, ActionItem.transcription_id == Transcription.id)
+            .where(Transcription.meeting_id.in_(meeting_ids))
+        )
+        row = self.db.execute(
+            select(
+                select(func.count(Meeting.id)).where(Meeting.id.in_(meeting_ids)).scalar_subquery(),
+                action_items.scalar_subquery(),
+                action_items.where(ActionItem.status == "completed").scalar_subquery(),
+                select(func.count(ProjectMember.id)).where(ProjectMember.project_id == project_id).scalar_subquery(),
+            )
+        ).one()
+        return tuple(value or 0 for value in row)
+
     def count_distinct_speakers_by_project(self, project_id: int) -> int:
         """Count distinct speaker names across all project meetings."""
         meeting_ids = self.get_meeting_ids_subquery(project_id)
@@ -268,6 +373,87 @@ class ProjectRepository:
             or 0
         )
 
+    def get_meeting_totals_by_project(self, project_id: int) -> tuple[int, float]:
+        """Return ``(meeting_count, total_duration_minutes)`` for a project in one query.
+
+        A meeting's duration is its ``estimated_duration`` (minutes) when positive,
+        otherwise the audio duration of its most recent diarization timing.
+        """
+        meeting_ids = self.get_meeting_ids_subquery(project_id)
+        latest_audio_seconds = (
+            select(DiarizationTiming.audio_duration_seconds)
+            .where(DiarizationTiming.meeting_id == Meeting.id)
+            .order_by(DiarizationTiming.created_at.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        duration_minutes = case(
+            (Meeting.estimated_duration > 0, Meeting.estimated_duration),
+            (latest_audio_seconds > 0, latest_audio_seconds / 60.0),
+            else_=None,
+        )
+        count, total = (
+            self.db.query(func.count(Meeting.id), func.sum(duration_minutes)).filter(Meeting.id.in_(meeting_ids)).one()
+        )
+        return count or 0, float(total or 0.0)
+
+    def count_meetings_by_month(self, project_id: int) -> dict[str, int]:
+        """Count project meetings per ``YYYY-MM`` month of ``meeting_date`` (falling back to ``created_at``)."""
+        meeting_ids = self.get_meeting_ids_subquery(project_id)
+        date_value = func.coalesce(Meeting.meeting_date, Meeting.created_at)
+        dialect_name = self.db.bind.dialect.name if self.db.bind is not None else ""
+        month = func.strftime("%Y-%m", date_value) if dialect_name == "sqlite" else func.to_char(date_value, "YYYY-MM")
+        rows = (
+            self.db.query(month, func.count(Meeting.id))
+            .filter(Meeting.id.in_(meeting_ids), date_value.isnot(None))
+            .group_by(month)
+            .all()
+        )
+        return {row[0]: row[1] for row in rows}
+
+    def _project_action_items_query(self, project_id: int, *entities):
+        meeting_ids = self.get_meeting_ids_subquery(project_id)
+        return (
+            self.db.query(*entities)
+            .select_from(ActionItem)
+            .join(Transcription, ActionItem.transcription_id == Transcription.id)
+            .filter(Transcription.meeting_id.in_(meeting_ids))
+        )
+
+    def count_action_items_by_status(self, project_id: int) -> dict[str, int]:
+        """Count project action items grouped by status (missing status counts as pending)."""
+        status = func.coalesce(ActionItem.status, "pending")
+        rows = self._project_action_items_query(project_id, status, func.count(ActionItem.id)).group_by(status).all()
+        return {row[0]: row[1] for row in rows}
+
+    def count_action_items_by_owner(self, project_id: int, limit: int = 10) -> list[tuple[str, int]]:
+        """Return the top ``limit`` owners by action item count (blank owners are 'Unassigned')."""
+        owner = func.coalesce(func.nullif(func.trim(ActionItem.owner), ""), "Unassigned")
+        count = func.count(ActionItem.id)
+        rows = (
+            self._project_action_items_query(project_id, owner, count)
+            .group_by(owner)
+            .order_by(count.desc(), owner)
+            .limit(limit)
+            .all()
+        )
+        return [(row[0], row[1]) for row in rows]
+
+    def get_open_action_item_due_dates(self, project_id: int) -> list[str]:
+        """Return raw ``due_date`` values of non-completed project action items.
+
+        Due dates are free-form strings, so they are returned for parsing by the caller.
+        """
+        rows = (
+            self._project_action_items_query(project_id, ActionItem.due_date)
+            .filter(
+                ActionItem.due_date.isnot(None),
+                or_(ActionItem.status.is_(None), ActionItem.status != "completed"),
+            )
+            .all()
+        )
+        return [row[0] for row in rows]
+
     def get_all_action_items_by_project(self, project_id: int) -> list[ActionItem]:
         """Get all action items from meetings in a project."""
         meeting_ids = self.get_meeting_ids_subquery(project_id)
@@ -290,10 +476,15 @@ class ProjectRepository:
     def get_project_linked_action_items(
         self, project_id: int, status: str | None = None, owner: str | None = None
     ) -> list[ActionItem]:
-        """Get action items linked to a project via ProjectActionItem."""
+        """Get action items linked to a project via ProjectActionItem.
+
+        Eager-loads ``transcription`` and its ``meeting`` so callers can read meeting
+        info per item without issuing extra queries.
+        """
         query = (
             self.db.query(ActionItem)
             .join(ProjectActionItem, ProjectActionItem.action_item_id == ActionItem.id)
+            .options(joinedload(ActionItem.transcription).joinedload(Transcription.meeting))
             .filter(ProjectActionItem.project_id == project_id)
         )
         if status:
@@ -302,6 +493,36 @@ class ProjectRepository:
             query = query.filter(ActionItem.owner.ilike(f"%{owner}%"))
         return query.all()
 
+    def iter_gantt_action_item_rows(self, project_id: int):
+        """Yield the Gantt columns of a project's linked action items as rows.
+
+        Each row carries the action item fields plus ``meeting_id``,
+        ``meeting_date`` and ``meeting_title`` from its meeting (``None`` when the
+        item has no transcription), fetched in one joined SELECT without
+        building ORM objects.
+        """
+        query = (
+            select(
+                ActionItem.id,
+                ActionItem.task,
+                ActionItem.owner,
+                ActionItem.status,
+                ActionItem.priority,
+                ActionItem.notes,
+                ActionItem.start_date,
+                ActionItem.due_date,
+                Meeting.id.label("meeting_id"),
+                Meeting.meeting_date,
+                Meeting.filename.label("meeting_title"),
+            )
+            .select_from(ProjectActionItem)
+            .join(ActionItem, ActionItem.id == ProjectActionItem.action_item_id)
+            .outerjoin(Transcription, Transcription.id == ActionItem.transcription_id)
+            .outerjoin(Meeting, Meeting.id == Transcription.meeting_id)
+            .where(ProjectActionItem.project_id == project_id)
+        )
+        yield from self.db.execute(query)
+
     def get_speaker_names_by_project(self, project_id: int) -> list[str]:
         """Get distinct non-null speaker names from a project's meetings."""
         meeting_ids = self.get_meeting_ids_subquery(project_id)
@@ -357,6 +578,23 @@ class ProjectMilestoneRepository:
             .all()
         )
 
+    def count_progress_by_project(self, project_id: int, now: datetime) -> tuple[int, int, int]:
+        """Return ``(total, completed, missed)`` milestone counts for a project.
+
+        A milestone is missed when it is not completed and its due date is before ``now``.
+        """
+        is_completed = ProjectMilestone.status == "completed"
+        total, completed, missed = (
+            self.db.query(
+                func.count(ProjectMilestone.id),
+                func.count(case((is_completed, 1))),
+                func.count(case((and_(~is_completed, ProjectMilestone.due_date < now), 1))),
+            )
+            .filter(ProjectMilestone.project_id == project_id)
+            .one()
+        )
+        return total or 0, completed or 0, missed or 0
+
     def create(self, project_id: int, data: dict) -> ProjectMilestone:
         """Create a new milestone."""
         milestone = ProjectMilestone(project_id=project_id, **data)
@@ -439,6 +677,27 @@ class ProjectMemberRepository:
         self.db.delete(member)
         self.db.commit()
 
+    def replace_auto_detected(self, project_id: int, names: list[str]) -> list[ProjectMember]:
+        """Replace a project's auto-detected members with ``names`` in one transaction.
+
+        Names that clash with a manually added member are skipped. The new rows are
+        written with a single multi-row INSERT and returned.
+        """
+        self.db.query(ProjectMember).filter(
+            and_(ProjectMember.project_id == project_id, ProjectMember.is_auto_detected == True)
+        ).delete(synchronize_session=False)
+        manual_names = {
+            row[0] for row in self.db.query(ProjectMember.name).filter(ProjectMember.project_id == project_id).all()
+        }
+        rows = [
+            {"project_id": project_id, "name": name, "is_auto_detected": True}
+            for name in dict.fromkeys(names)
+            if name not in manual_names
+        ]
+        members = list(self.db.scalars(insert(ProjectMember).returning(ProjectMember), rows)) if rows else []
+        self.db.commit()
+        return members
+
     def delete_auto_detected(self, project_id: int) -> None:
         """Delete all auto-detected members for a project."""
         self.db.query(ProjectMember).filter(
@@ -537,6 +796,16 @@ class ProjectNoteRepository:
             .all()
         )
 
+    def list_by_project_with_attachments(self, project_id: int) -> list[ProjectNote]:
+        """List a project's notes with their attachments loaded in one extra query."""
+        return (
+            self.db.query(ProjectNote)
+            .options(selectinload(ProjectNote.attachments))
+            .filter(ProjectNote.project_id == project_id)
+            .order_by(ProjectNote.pinned.desc(), ProjectNote.updated_at.desc())
+            .all()
+        )
+
     def create(self, project_id: int, data: dict) -> ProjectNote:
         """Create a new note."""
         note = ProjectNote(project_id=project_id, **data)
@@ -608,6 +877,47 @@ class ProjectActionItemRepository:
         """Return the link if it exists, else None."""
         return self.db.query(ProjectActionItem).filter_by(project_id=project_id, action_item_id=action_item_id).first()
 
+    def link_exists(self, project_id: int, action_item_id: int) -> bool:
+        """Return True if the link exists, without loading it."""
+        return bool(
+            self.db.query(
+                exists().where(
+                    ProjectActionItem.project_id == project_id,
+                    ProjectActionItem.action_item_id == action_item_id,
+                )
+            ).scalar()
+        )
+
+    def get_linked_pairs(self, project_ids: list[int], action_item_ids: list[int]) -> set[tuple[int, int]]:
+        """Return the existing ``(project_id, action_item_id)`` pairs among the given projects and action items."""
+        if not project_ids or not action_item_ids:
+            return set()
+        rows = self.db.execute(
+            select(ProjectActionItem.project_id, ProjectActionItem.action_item_id).where(
+                ProjectActionItem.project_id.in_(project_ids),
+                ProjectActionItem.action_item_id.in_(action_item_ids),
+            )
+        )
+        return {(row[0], row[1]) for row in rows}
+
+    def bulk_create(self, rows: list[dict]) -> None:
+        """Insert many project–action-item links in a single multi-row INSERT (no commit)."""
+        if rows:
+            self.db.execute(insert(ProjectActionItem), rows)
+
+    def delete_for_projects(self, project_ids: list[int], action_item_ids: list[int]) -> int:
+        """Bulk-delete links between the given projects and action items (no commit)."""
+        if not project_ids or not action_item_ids:
+            return 0
+        return (
+            self.db.query(ProjectActionItem)
+            .filter(
+                ProjectActionItem.project_id.in_(project_ids),
+                ProjectActionItem.action_item_id.in_(action_item_ids),
+            )
+            .delete(synchronize_session=False)
+        )
+
     def create(self, project_id: int, action_item_id: int) -> ProjectActionItem:
         """Create a project–action-item link."""
         pai = ProjectActionItem(project_id=project_id, action_item_id=action_item_id)
@@ -620,6 +930,16 @@ class ProjectActionItemRepository:
         self.db.delete(pai)
         self.db.commit()
 
+    def delete_link(self, project_id: int, action_item_id: int) -> int:
+        """Delete a project–action-item link by key. Returns number of deleted rows."""
+        result = (
+            self.db.query(ProjectActionItem)
+            .filter_by(project_id=project_id, action_item_id=action_item_id)
+            .delete(synchronize_session=False)
+        )
+        self.db.commit()
+        return result
+
     def get_action_item(self, action_item_id: int) -> ActionItem | None:
         """Convenience: get the ActionItem by primary key."""
         return self.db.query(ActionItem).filter(ActionItem.id == action_item_id).first()
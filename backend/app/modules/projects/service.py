@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import re
 import shutil
 import time
-from collections import Counter, defaultdict
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from uuid import uuid4
+from typing import Any, TypedDict
+from uuid import NAMESPACE_URL, uuid4, uuid5
 
+from dateutil.parser import parse as parse_date_string
 from fastapi import HTTPException, UploadFile
 from sqlalchemy.orm import Session
 
@@ -34,6 +37,133 @@ from .repository import (
     ProjectRepository,
 )
 
+_UNSET = object()
+
+# Project columns copied onto the schemas.Project response, in table order.
+_PROJECT_FIELDS = tuple(c.name for c in Project.__table__.columns if c.name in schemas.Project.model_fields)
+# JSON columns that the response renders as an empty container when unset.
+_PROJECT_FIELD_DEFAULTS = {"tags": list, "settings": dict}
+# ProjectMember columns exposed on schemas.ProjectMember (every schema field is a column).
+_MEMBER_FIELDS = tuple(schemas.ProjectMember.model_fields)
+
+
+class MilestoneExport(TypedDict):
+    """Milestone row in a project export payload."""
+
+    id: int
+    name: str
+    description: str | None
+    due_date: datetime | None
+    completed_at: datetime | None
+    status: str
+    color: str | None
+    created_at: datetime
+    updated_at: datetime
+
+
+class MemberExport(TypedDict):
+    """Member row in a project export payload."""
+
+    id: int
+    name: str
+    email: str | None
+    role: str
+    is_auto_detected: bool
+    added_at: datetime
+
+
+class AttachmentExport(TypedDict):
+    """Note attachment row in a project export payload."""
+
+    id: int
+    filename: str
+    description: str | None
+    file_size: int | None
+    uploaded_at: datetime
+
+
+class NoteExport(TypedDict):
+    """Note row, with its attachments, in a project export payload."""
+
+    id: int
+    title: str
+    content: str
+    pinned: bool
+    created_at: datetime
+    updated_at: datetime
+    attachments: list[AttachmentExport]
+
+
+def _legacy_gantt_link_id(source: str, target: str) -> str:
+    """Stable id for a stored link that predates link ids.
+
+    Deterministic so the read path and the deferred normalization write agree
+    on the id the client sees.
+    """
+    return uuid5(NAMESPACE_URL, f"gantt-link:{source}->{target}").hex
+
+
+def _normalize_gantt_links(links_raw: list) -> tuple[list[dict], dict[str, list[str]], bool]:
+    """Normalize stored gantt links.
+
+    Returns the cleaned links, a map of target item id to the ids it depends
+    on, and whether any stored link lacked an id or type.
+    """
+    normalized_links: list[dict] = []
+    dependency_map: dict[str, list[str]] = {}
+    changed = False
+    for link in links_raw:
+        if not isinstance(link, dict):
+            continue
+        source = link.get("source")
+        target = link.get("target")
+        if not source or not target:
+            continue
+        source, target = str(source), str(target)
+        link_id = link.get("id") or _legacy_gantt_link_id(source, target)
+        link_type = link.get("type") or "e2s"
+        if link_id != link.get("id") or link_type != link.get("type"):
+            changed = True
+        normalized_links.append({"id": str(link_id), "source": source, "target": target, "type": link_type})
+        dependency_map.setdefault(target, []).append(source)
+    return normalized_links, dependency_map, changed
+
+
+def _widen_date_range(
+    bounds: tuple[datetime, datetime] | None, start: datetime | None, end: datetime | None
+) -> tuple[datetime, datetime] | None:
+    """Return ``bounds`` extended to cover ``start`` and ``end`` (either may be None)."""
+    for value in (start, end):
+        if value is None:
+            continue
+        if bounds is None:
+            bounds = (value, value)
+        elif value < bounds[0]:
+            bounds = (value, bounds[1])
+        elif value > bounds[1]:
+            bounds = (bounds[0], value)
+    return bounds
+
+
+@lru_cache(maxsize=1024)
+def _parse_datetime_string(value: str) -> datetime | None:
+    """Parse a stored date string into an aware datetime (UTC when no offset is given).
+
+    ISO-8601 strings take the stdlib fast path; other formats fall back to dateutil.
+    A trailing ``Z`` (as sent by browsers) is rewritten first because
+    ``fromisoformat`` only accepts it from Python 3.11.
+    """
+    if value.endswith(("Z", "z")):
+        value = value[:-1] + "+00:00"
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            parsed = parse_date_string(value)
+        except (ValueError, OverflowError):
+            return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
 
 class ProjectService:
     """Service for project operations."""
@@ -49,19 +179,19 @@ class ProjectService:
         self.attachment_repository = ProjectNoteAttachmentRepository(db)
         self.pai_repo = ProjectActionItemRepository(db)
         self.meeting_service = MeetingService(db)
+        self._project_tag_index: dict[str, set[int]] | None = None
+        self._default_model_config = _UNSET
 
     def link_action_item_to_project(self, project_id: int, action_item_id: int) -> None:
         """Link an existing action item to a project. Raises ValueError if already linked."""
-        if self.pai_repo.get(project_id, action_item_id):
+        if self.pai_repo.link_exists(project_id, action_item_id):
             raise ValueError("Action item already linked to project.")
         self.pai_repo.create(project_id, action_item_id)
 
     def unlink_action_item_from_project(self, project_id: int, action_item_id: int) -> None:
         """Unlink an action item from a project. Raises ValueError if not linked."""
-        pai = self.pai_repo.get(project_id, action_item_id)
-        if not pai:
+        if not self.pai_repo.delete_link(project_id, action_item_id):
             raise ValueError("Action item not linked to project.")
-        self.pai_repo.delete(pai)
 
     def list_projects(self, status: str | None = None) -> list[schemas.Project]:
         """List all projects with computed metrics."""
@@ -71,47 +201,44 @@ class ProjectService:
         for project in projects:
             meeting_ids = self._get_project_meeting_ids_list(project.id)
 
-            project_dict = {
-                "id": project.id,
-                "meeting_ids": meeting_ids,
-                "tags": project.tags or [],
-                "name": project.name,
-                "description": project.description,
-                "status": project.status,
-                "color": project.color,
-                "icon": project.icon,
-                "start_date": project.start_date,
-                "target_end_date": project.target_end_date,
-                "actual_end_date": project.actual_end_date,
-                "created_at": project.created_at,
-                "updated_at": project.updated_at,
-                "settings": project.settings or {},
-            }
-
-            # Compute metrics
             metrics = self._compute_project_metrics(project.id)
-            project_dict.update(metrics)
-
-            result.append(schemas.Project(**project_dict))
+            result.append(self._to_project_schema(project, meeting_ids, metrics))
 
         return result
 
     def create_project(self, data: schemas.ProjectCreate) -> schemas.Project:
         """Create a new project from meeting links."""
-        if data.meeting_ids:
-            existing_ids = self.repository.validate_meeting_ids(data.meeting_ids)
-            missing_ids = set(data.meeting_ids) - existing_ids
-            if missing_ids:
-                raise HTTPException(status_code=404, detail=f"Meetings not found: {sorted(missing_ids)}")
-
+        self._ensure_meetings_exist(data.meeting_ids)
         project_data = data.model_dump(exclude={"meeting_ids"})
         project = self.repository.create(project_data, data.meeting_ids)
+        self._project_tag_index = None
 
         # Auto-sync members from meetings
-        self.sync_project_members(project.id)
+        members = self.sync_project_members(project.id)
+
+        # A fresh project's metrics follow from its inputs; only action item
+        # counts need a query, and only when meetings were linked.
+        meeting_ids = list(dict.fromkeys(data.meeting_ids))
+        metrics = {
+            "meeting_count": len(meeting_ids),
+            "action_item_count": 0,
+            "completed_action_items": 0,
+            "member_count": len(members),
+        }
+        if meeting_ids:
+            metrics["action_item_count"] = self.repository.count_action_items_by_project(project.id)
+            metrics["completed_action_items"] = self.repository.count_action_items_by_project(
+                project.id, status="completed"
+            )
+        return self._to_project_schema(project, meeting_ids, metrics)
 
-        # Return with metrics
-        return self.get_project(project.id)
+    def _ensure_meetings_exist(self, meeting_ids: list[int]) -> None:
+        """Raise 404 listing any of meeting_ids that do not exist."""
+        if not meeting_ids:
+            return
+        missing_ids = set(meeting_ids) - self.repository.validate_meeting_ids(meeting_ids)
+        if missing_ids:
+            raise HTTPException(status_code=404, detail=f"Meetings not found: {sorted(missing_ids)}")
 
     def get_project(self, project_id: int) -> schemas.Project:
         """Get project by ID with metrics."""
@@ -120,28 +247,25 @@ class ProjectService:
             raise HTTPException(status_code=404, detail="Project not found")
 
         meeting_ids = self._get_project_meeting_ids_list(project.id)
+        metrics = self._compute_project_metrics(project.id)
+        return self._to_project_schema(project, meeting_ids, metrics)
 
-        project_dict = {
-            "id": project.id,
-            "meeting_ids": meeting_ids,
-            "tags": project.tags or [],
-            "name": project.name,
-            "description": project.description,
-            "status": project.status,
-            "color": project.color,
-            "icon": project.icon,
-            "start_date": project.start_date,
-            "target_end_date": project.target_end_date,
-            "actual_end_date": project.actual_end_date,
-            "created_at": project.created_at,
-            "updated_at": project.updated_at,
-            "settings": project.settings or {},
-        }
+    def _ensure_project_exists(self, project_id: int) -> None:
+        """Raise 404 unless the project exists; a cheap EXISTS for handlers that only need the check."""
+        if not self.repository.project_exists(project_id):
+            raise HTTPException(status_code=404, detail="Project not found")
 
-        metrics = self._compute_project_metrics(project.id)
-        project_dict.update(metrics)
+    def _to_project_schema(self, project: Project, meeting_ids: list[int], metrics: dict) -> schemas.Project:
+        """Build the Project response from an ORM row, its meeting IDs and computed metrics.
 
-        return schemas.Project(**project_dict)
+        Every value comes from typed columns or server-side counts, so the
+        schema is constructed without re-running validation on each row.
+        """
+        data = {field: getattr(project, field) for field in _PROJECT_FIELDS}
+        for field, factory in _PROJECT_FIELD_DEFAULTS.items():
+            if not data[field]:
+                data[field] = factory()
+        return schemas.Project.model_construct(**data, meeting_ids=meeting_ids, **metrics)
 
     def get_project_with_details(self, project_id: int) -> schemas.ProjectWithDetails:
         """Get project with full details."""
@@ -149,7 +273,9 @@ class ProjectService:
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
 
-        project_data = self.get_project(project_id).model_dump()
+        meeting_ids = [pm.meeting_id for pm in project.project_meetings]
+        metrics = self._compute_project_metrics(project.id)
+        project_data = self._to_project_schema(project, meeting_ids, metrics).model_dump()
 
         # Add relationships
         project_data["milestones"] = [schemas.ProjectMilestone.model_validate(m) for m in project.milestones]
@@ -166,18 +292,23 @@ class ProjectService:
 
         update_data = data.model_dump(exclude_unset=True)
         meeting_ids = update_data.pop("meeting_ids", None)
+        settings = update_data.get("settings")
+        if settings and settings.get("gantt_links"):
+            # Validate links at write time so stored links always carry an id and type
+            settings["gantt_links"], _, _ = _normalize_gantt_links(settings["gantt_links"])
         project = self.repository.update(project, update_data)
+        self._project_tag_index = None
 
         if meeting_ids is not None:
-            if meeting_ids:
-                existing_ids = self.repository.validate_meeting_ids(meeting_ids)
-                missing_ids = set(meeting_ids) - existing_ids
-                if missing_ids:
-                    raise HTTPException(status_code=404, detail=f"Meetings not found: {sorted(missing_ids)}")
-
+            self._ensure_meetings_exist(meeting_ids)
             self._sync_project_meetings(project, meeting_ids)
+            meeting_ids = list(dict.fromkeys(meeting_ids))
+        else:
+            meeting_ids = self._get_project_meeting_ids_list(project.id)
 
-        return self.get_project(project_id)
+        # Reuse the already-loaded project instead of re-fetching it via get_project
+        metrics = self._compute_project_metrics(project.id)
+        return self._to_project_schema(project, meeting_ids, metrics)
 
     def delete_project(self, project_id: int, delete_meetings: bool = False) -> None:
         """Delete project and optionally its meetings."""
@@ -190,6 +321,7 @@ class ProjectService:
             self.repository.delete_meetings_by_ids(meeting_ids)
 
         self.repository.delete(project)
+        self._project_tag_index = None
 
     def get_project_meetings(
         self, project_id: int, status: str | None = None, sort_by: str = "date", sort_order: str = "desc"
@@ -210,12 +342,10 @@ class ProjectService:
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
 
-        meeting = self.repository.get_meeting_by_id(meeting_id)
-        if not meeting:
+        if not self.repository.meeting_exists(meeting_id):
             raise HTTPException(status_code=404, detail="Meeting not found")
 
-        existing = self.repository.check_meeting_in_project(project_id, meeting_id)
-        if existing:
+        if self.repository.meeting_in_project(project_id, meeting_id):
             raise HTTPException(status_code=409, detail="Meeting already linked to project")
 
         self.db.add(ProjectMeeting(project_id=project_id, meeting_id=meeting_id))
@@ -242,34 +372,32 @@ class ProjectService:
             raise HTTPException(status_code=404, detail="Project not found")
 
         action_items = self.repository.get_project_linked_action_items(project_id, status=status, owner=owner)
+        return [self._action_item_to_dict(item) for item in action_items]
+
+    def _action_item_to_dict(self, item: ActionItem) -> dict:
+        """Serialize a linked action item, adding meeting info from its eager-loaded transcription."""
+        item_dict = {
+            "id": item.id,
+            "transcription_id": item.transcription_id,
+            "owner": item.owner,
+            "task": item.task,
+            "start_date": item.start_date,
+            "due_date": item.due_date,
+            "status": item.status,
+            "priority": item.priority,
+            "notes": item.notes,
+        }
 
-        # Add meeting info to each action item (if available)
-        result = []
-        for item in action_items:
-            item_dict = {
-                "id": item.id,
-                "transcription_id": item.transcription_id,
-                "owner": item.owner,
-                "task": item.task,
-                "start_date": item.start_date,
-                "due_date": item.due_date,
-                "status": item.status,
-                "priority": item.priority,
-                "notes": item.notes,
-            }
-
-            # Get meeting info through transcription
-            if item.transcription:
-                meeting = item.transcription.meeting
-                if meeting:
-                    item_dict["meeting_id"] = meeting.id
-                    item_dict["meeting_filename"] = meeting.filename
-                    item_dict["meeting_title"] = meeting.filename  # Frontend expects meeting_title
-                    item_dict["meeting_date"] = meeting.meeting_date
-
-            result.append(item_dict)
+        # Get meeting info through transcription
+        if item.transcription:
+            meeting = item.transcription.meeting
+            if meeting:
+                item_dict["meeting_id"] = meeting.id
+                item_dict["meeting_filename"] = meeting.filename
+                item_dict["meeting_title"] = meeting.filename  # Frontend expects meeting_title
+                item_dict["meeting_date"] = meeting.meeting_date
 
-        return result
+        return item_dict
 
     def get_project_analytics(self, project_id: int) -> schemas.ProjectAnalytics:
         """Get analytics metrics for a project."""
@@ -277,46 +405,33 @@ class ProjectService:
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
 
-        meetings = self.repository.get_meetings_by_project(project_id)
-        total_meetings = len(meetings)
-
-        total_duration_minutes = 0.0
-        for meeting in meetings:
-            duration_minutes = self._get_meeting_duration_minutes(meeting)
-            if duration_minutes and duration_minutes > 0:
-                total_duration_minutes += float(duration_minutes)
-
+        total_meetings, total_duration_minutes = self.repository.get_meeting_totals_by_project(project_id)
         total_duration_hours = round(total_duration_minutes / 60.0, 2)
 
-        action_items = self.repository.get_all_action_items_by_project(project_id)
-        total_action_items = len(action_items)
-        status_counts = Counter([item.status or "pending" for item in action_items])
-        completed_action_items = status_counts.get("completed", 0)
+        action_items_by_status = self.repository.count_action_items_by_status(project_id)
+        total_action_items = sum(action_items_by_status.values())
+        completed_action_items = action_items_by_status.get("completed", 0)
         pending_action_items = total_action_items - completed_action_items
 
         now = datetime.now(timezone.utc)
         overdue_action_items = 0
-        owner_counts: Counter[str] = Counter()
-        for item in action_items:
-            owner_label = (item.owner or "Unassigned").strip() or "Unassigned"
-            owner_counts[owner_label] += 1
-            if item.status == "completed":
-                continue
-            due_date = self._parse_datetime(item.due_date)
+        for due_date_raw in self.repository.get_open_action_item_due_dates(project_id):
+            due_date = self._parse_datetime(due_date_raw)
             if due_date and due_date < now:
                 overdue_action_items += 1
 
         unique_participants = self.repository.count_distinct_speakers_by_project(project_id)
 
-        meetings_by_month = self._group_meetings_by_month(meetings)
-        action_items_by_status = dict(status_counts)
+        monthly_counts = self.repository.count_meetings_by_month(project_id)
+        meetings_by_month = self._group_meetings_by_month(monthly_counts)
 
-        action_items_by_owner = [{"owner": owner, "count": count} for owner, count in owner_counts.most_common(10)]
+        action_items_by_owner = [
+            {"owner": owner, "count": count} for owner, count in self.repository.count_action_items_by_owner(project_id)
+        ]
 
-        milestones = self.milestone_repository.list_by_project(project_id)
-        milestone_total = len(milestones)
-        milestone_completed = len([m for m in milestones if m.status == "completed"])
-        milestone_missed = len([m for m in milestones if m.status != "completed" and m.due_date and m.due_date < now])
+        milestone_total, milestone_completed, milestone_missed = self.milestone_repository.count_progress_by_project(
+            project_id, now
+        )
         milestone_pending = milestone_total - milestone_completed
 
         milestone_progress = {
@@ -327,7 +442,7 @@ class ProjectService:
             "completion_rate": round((milestone_completed / milestone_total) * 100, 2) if milestone_total else 0.0,
         }
 
-        activity_trend = self._build_activity_trend(meetings)
+        activity_trend = self._build_activity_trend(monthly_counts, now)
 
         return schemas.ProjectAnalytics(
             project_id=project_id,
@@ -373,11 +488,12 @@ class ProjectService:
             session = self.chat_repository.create_session(project_id, title=title or "New chat")
             session_id = session.id
 
-        if session.title in (None, "", "New chat"):
-            existing_messages = self.chat_repository.list_messages(session_id)
-            if not existing_messages:
-                title_candidate = await self._generate_chat_title(request.message)
-                self.chat_repository.update_session(session, title=title_candidate)
+        # Resolve the model config up front so the concurrent title task below
+        # only hits the LLM provider and never shares the DB session.
+        model_config = self._get_default_model_config()
+
+        # A new session gets a generated title; checked before the user message is stored
+        needs_title = session.title in (None, "", "New chat") and not self.chat_repository.list_messages(session_id)
 
         # Persist user message first
         self.chat_repository.create_message(session_id, role="user", content=request.message)
@@ -386,7 +502,6 @@ class ProjectService:
         history_messages = self.chat_repository.list_messages(session_id)
         chat_history = [{"role": message.role, "content": message.content} for message in history_messages[-6:]]
 
-        model_config = SettingsService(self.db).get_default_model_configuration()
         llm_config = None
         if model_config:
             llm_config = llm_chat.model_config_to_llm_config(model_config, use_analysis=False)
@@ -397,16 +512,28 @@ class ProjectService:
         else:
             system_prompt_override = None
 
-        response_text, sources, follow_ups = await rag.generate_project_rag_response(
-            self.db,
-            query=request.message,
-            project_id=project_id,
-            meeting_ids=meeting_ids,
-            chat_history=chat_history,
-            top_k=5,
-            llm_config=llm_config,
-            system_prompt_override=system_prompt_override,
-        )
+        # Generate the session title concurrently with the RAG response; nothing
+        # downstream needs it until the end of the request. It is started right
+        # before the call so any failure from here on cancels it.
+        title_task = asyncio.create_task(self._generate_chat_title(request.message)) if needs_title else None
+        try:
+            response_text, sources, follow_ups = await rag.generate_project_rag_response(
+                self.db,
+                query=request.message,
+                project_id=project_id,
+                meeting_ids=meeting_ids,
+                chat_history=chat_history,
+                top_k=5,
+                llm_config=llm_config,
+                system_prompt_override=system_prompt_override,
+            )
+        except BaseException:
+            if title_task is not None:
+                title_task.cancel()
+            raise
+
+        if title_task is not None:
+            self.chat_repository.update_session(session, title=await title_task)
 
         self.chat_repository.create_message(
             session_id,
@@ -422,6 +549,12 @@ class ProjectService:
             follow_up_suggestions=follow_ups or [],
         )
 
+    def _get_default_model_config(self):
+        """Return the default model configuration, queried at most once per service instance."""
+        if self._default_model_config is _UNSET:
+            self._default_model_config = SettingsService(self.db).get_default_model_configuration()
+        return self._default_model_config
+
     async def _generate_chat_title(self, message: str) -> str:
         title_fallback = (message or "").strip()
         if not title_fallback:
@@ -430,7 +563,7 @@ class ProjectService:
             title_fallback = f"{title_fallback[:57]}..."
 
         try:
-            model_config = SettingsService(self.db).get_default_model_configuration()
+            model_config = self._get_default_model_config()
             llm_config = None
             if model_config:
                 llm_config = llm_chat.model_config_to_llm_config(model_config, use_analysis=False)
@@ -468,9 +601,7 @@ class ProjectService:
         return self.repository.get_completed_meeting_ids(project.id)
 
     def _sync_project_meetings(self, project: Project, meeting_ids: list[int]) -> None:
-        existing_ids = set(self.repository.get_meeting_ids_list(project.id))
-        self.repository.sync_meetings(project, meeting_ids)
-        new_ids = set(meeting_ids) - existing_ids
+        new_ids = self.repository.sync_meetings(project, meeting_ids)
         if new_ids:
             self._apply_project_tags_to_meetings(project, list(new_ids))
 
@@ -498,43 +629,43 @@ class ProjectService:
         if isinstance(value, datetime):
             return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
         if isinstance(value, str):
-            try:
-                from dateutil.parser import parse
-
-                parsed = parse(value)
-                return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
-            except Exception:
-                return None
+            return _parse_datetime_string(value)
         return None
 
-    def _group_meetings_by_month(self, meetings: list[Meeting]) -> list[dict]:
-        counts: dict[str, int] = defaultdict(int)
-        for meeting in meetings:
-            date_value = meeting.meeting_date or meeting.created_at
-            if not date_value:
-                continue
-            key = date_value.strftime("%Y-%m")
-            counts[key] += 1
-        return [{"month": month, "count": counts[month]} for month in sorted(counts.keys())]
-
-    def _build_activity_trend(self, meetings: list[Meeting]) -> list[dict]:
-        """Build a 6-month rolling activity trend based on meetings."""
-        counts = defaultdict(int)
-        now = datetime.now(timezone.utc)
-        for meeting in meetings:
-            date_value = meeting.meeting_date or meeting.created_at
-            if not date_value:
-                continue
-            month_key = date_value.strftime("%Y-%m")
-            counts[month_key] += 1
+    def _group_meetings_by_month(self, monthly_counts: dict[str, int]) -> list[dict]:
+        return [{"month": month, "count": monthly_counts[month]} for month in sorted(monthly_counts.keys())]
 
+    def _build_activity_trend(self, monthly_counts: dict[str, int], now: datetime) -> list[dict]:
+        """Build a 6-month rolling activity trend ending at ``now`` from per-month meeting counts."""
         trend = []
         for i in range(5, -1, -1):
             month_date = now.replace(day=1) - timedelta(days=30 * i)
             month_key = month_date.strftime("%Y-%m")
-            trend.append({"month": month_key, "count": counts.get(month_key, 0)})
+            trend.append({"month": month_key, "count": monthly_counts.get(month_key, 0)})
         return trend
 
+    def _get_project_tag_index(self) -> dict[str, set[int]]:
+        """Map each normalized (stripped, lower-cased) active project tag to its project IDs.
+
+        Built once per service instance so batches of tag syncs share it; project
+        writes through this service reset it.
+        """
+        if self._project_tag_index is None:
+            index: dict[str, set[int]] = {}
+            for project_id, tags in self.repository.list_tags(status="active"):
+                # Project tags are stored as a JSON array
+                if isinstance(tags, list):
+                    normalized = {str(t).strip().lower() for t in tags if t}
+                elif isinstance(tags, str):
+                    normalized = {tags.strip().lower()}
+                else:
+                    continue
+                for tag in normalized:
+                    if tag:
+                        index.setdefault(tag, set()).add(project_id)
+            self._project_tag_index = index
+        return self._project_tag_index
+
     def sync_meeting_to_projects_by_tags(self, meeting_id: int) -> None:
         """Auto-link a meeting to projects based on matching tags and sync action items.
 
@@ -562,56 +693,48 @@ class ProjectService:
 
         logger.info(f"Syncing meeting {meeting_id} with tags {meeting_tags} to projects")
 
-        # Determine which projects should be linked based on exact tag match
-        all_projects = self.repository.list(status="active")
+        # Determine which projects should be linked based on exact tag match.
+        # Exact case-insensitive match only - avoid false positives from substring matching
+        tag_index = self._get_project_tag_index()
         projects_to_link: set[int] = set()
-
-        for project in all_projects:
-            if not project.tags:
-                continue
-
-            # Parse project tags - stored as JSON array
-            project_tags: set[str] = set()
-            if isinstance(project.tags, list):
-                project_tags = {str(t).strip().lower() for t in project.tags if t}
-            elif isinstance(project.tags, str):
-                project_tags = {project.tags.strip().lower()}
-
-            if not project_tags:
-                continue
-
-            # Exact case-insensitive match only - avoid false positives from substring matching
-            if meeting_tags & project_tags:
-                projects_to_link.add(project.id)
+        for tag in meeting_tags:
+            projects_to_link.update(tag_index.get(tag, ()))
 
         # Get projects currently linked to this meeting
         currently_linked_ids = set(self.repository.get_project_ids_for_meeting(meeting_id))
+        new_project_ids = projects_to_link - currently_linked_ids
+        stale_project_ids = currently_linked_ids - projects_to_link
+
+        action_item_ids = [item.id for item in self.repository.get_action_items_by_meeting(meeting_id)]
+        existing_pairs = self.pai_repo.get_linked_pairs(list(new_project_ids), action_item_ids)
 
-        # Add new links
-        action_items = self.repository.get_action_items_by_meeting(meeting_id)
-        for project_id in projects_to_link - currently_linked_ids:
-            self.db.add(ProjectMeeting(project_id=project_id, meeting_id=meeting_id))
+        # Add new links with one multi-row INSERT per junction table
+        self.repository.bulk_add_meeting_links(
+            [{"project_id": project_id, "meeting_id": meeting_id} for project_id in new_project_ids]
+        )
+        self.pai_repo.bulk_create(
+            [
+                {"project_id": project_id, "action_item_id": action_item_id}
+                for project_id in new_project_ids
+                for action_item_id in action_item_ids
+                if (project_id, action_item_id) not in existing_pairs
+            ]
+        )
+        for project_id in new_project_ids:
             logger.info(f"Created project_meeting link: project {project_id} <-> meeting {meeting_id}")
-            for action_item in action_items:
-                existing_ai = self.pai_repo.get(project_id, action_item.id)
-                if not existing_ai:
-                    self.db.add(ProjectActionItem(project_id=project_id, action_item_id=action_item.id))
 
         # Remove stale links (projects no longer matching meeting tags)
-        for project_id in currently_linked_ids - projects_to_link:
-            self.repository.remove_meeting_link(project_id, meeting_id)
+        self.repository.remove_meeting_from_projects(meeting_id, list(stale_project_ids))
+        for project_id in stale_project_ids:
             logger.info(f"Removed stale project_meeting link: project {project_id} <-> meeting {meeting_id}")
-            # Also unlink action items from that project
-            for action_item in action_items:
-                existing_ai = self.pai_repo.get(project_id, action_item.id)
-                if existing_ai:
-                    self.db.delete(existing_ai)
+        # Also unlink the meeting's action items from those projects
+        self.pai_repo.delete_for_projects(list(stale_project_ids), action_item_ids)
 
         self.db.commit()
         logger.info(
             f"Tag sync complete for meeting {meeting_id}: "
             f"linked to {len(projects_to_link)} projects, "
-            f"removed {len(currently_linked_ids - projects_to_link)} stale links"
+            f"removed {len(stale_project_ids)} stale links"
         )
 
     def sync_project_members(self, project_id: int) -> list[schemas.ProjectMember]:
@@ -624,35 +747,27 @@ class ProjectService:
             # Get all unique speakers from project meetings
             speakers = self.repository.get_speaker_names_by_project(project_id)
 
-            # Remove old auto-detected members
-            self.member_repository.delete_auto_detected(project_id)
-
-            # Add new auto-detected members
-            members = []
-            for speaker_name in speakers:
-                if speaker_name and speaker_name.strip():
-                    try:
-                        member = self.member_repository.create(
-                            project_id, {"name": speaker_name, "is_auto_detected": True}
-                        )
-                        members.append(schemas.ProjectMember.model_validate(member))
-                    except Exception:
-                        # Skip duplicates
-                        pass
-
-            return members
+            # Replace old auto-detected members
+            members = self.member_repository.replace_auto_detected(
+                project_id, [name for name in speakers if name and name.strip()]
+            )
+            return [self._to_member_schema(member) for member in members]
         except HTTPException:
             raise
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to sync members: {str(e)}")
 
     def get_project_members(self, project_id: int) -> list[schemas.ProjectMember]:
-        self.get_project(project_id)
+        self._ensure_project_exists(project_id)
         members = self.member_repository.list_by_project(project_id)
-        return [schemas.ProjectMember.model_validate(member) for member in members]
+        return [self._to_member_schema(member) for member in members]
+
+    def _to_member_schema(self, member: ProjectMember) -> schemas.ProjectMember:
+        """Build the member response from a DB row without re-validating its typed columns."""
+        return schemas.ProjectMember.model_construct(**{field: getattr(member, field) for field in _MEMBER_FIELDS})
 
     def add_project_member(self, project_id: int, member: schemas.ProjectMemberCreate) -> schemas.ProjectMember:
-        self.get_project(project_id)
+        self._ensure_project_exists(project_id)
         member_data = member.model_dump()
         member_data["is_auto_detected"] = False
         new_member = self.member_repository.create(project_id, member_data)
@@ -661,7 +776,7 @@ class ProjectService:
     def update_project_member(
         self, project_id: int, member_id: int, update: schemas.ProjectMemberUpdate
     ) -> schemas.ProjectMember:
-        self.get_project(project_id)
+        self._ensure_project_exists(project_id)
         member = self.member_repository.get(member_id)
         if not member or member.project_id != project_id:
             raise HTTPException(status_code=404, detail="Member not found")
@@ -669,26 +784,26 @@ class ProjectService:
         return schemas.ProjectMember.model_validate(updated_member)
 
     def remove_project_member(self, project_id: int, member_id: int) -> None:
-        self.get_project(project_id)
+        self._ensure_project_exists(project_id)
         member = self.member_repository.get(member_id)
         if not member or member.project_id != project_id:
             raise HTTPException(status_code=404, detail="Member not found")
         self.member_repository.delete(member)
 
     def get_project_milestones(self, project_id: int) -> list[schemas.ProjectMilestone]:
-        self.get_project(project_id)
+        self._ensure_project_exists(project_id)
         milestones = self.milestone_repository.list_by_project(project_id)
         return [schemas.ProjectMilestone.model_validate(milestone) for milestone in milestones]
 
     def create_milestone(self, project_id: int, milestone: schemas.ProjectMilestoneCreate) -> schemas.ProjectMilestone:
-        self.get_project(project_id)
+        self._ensure_project_exists(project_id)
         new_milestone = self.milestone_repository.create(project_id, milestone.model_dump())
         return schemas.ProjectMilestone.model_validate(new_milestone)
 
     def update_milestone(
         self, project_id: int, milestone_id: int, update: schemas.ProjectMilestoneUpdate
     ) -> schemas.ProjectMilestone:
-        self.get_project(project_id)
+        self._ensure_project_exists(project_id)
         milestone = self.milestone_repository.get(milestone_id)
         if not milestone or milestone.project_id != project_id:
             raise HTTPException(status_code=404, detail="Milestone not found")
@@ -696,7 +811,7 @@ class ProjectService:
         return schemas.ProjectMilestone.model_validate(updated_milestone)
 
     def complete_milestone(self, project_id: int, milestone_id: int) -> schemas.ProjectMilestone:
-        self.get_project(project_id)
+        self._ensure_project_exists(project_id)
         milestone = self.milestone_repository.get(milestone_id)
         if not milestone or milestone.project_id != project_id:
             raise HTTPException(status_code=404, detail="Milestone not found")
@@ -704,14 +819,14 @@ class ProjectService:
         return schemas.ProjectMilestone.model_validate(completed_milestone)
 
     def delete_milestone(self, project_id: int, milestone_id: int) -> None:
-        self.get_project(project_id)
+        self._ensure_project_exists(project_id)
         milestone = self.milestone_repository.get(milestone_id)
         if not milestone or milestone.project_id != project_id:
             raise HTTPException(status_code=404, detail="Milestone not found")
         self.milestone_repository.delete(milestone)
 
     def get_chat_sessions(self, project_id: int) -> list[schemas.ProjectChatSession]:
-        self.get_project(project_id)
+        self._ensure_project_exists(project_id)
         sessions = self.chat_repository.list_sessions(project_id)
         result = []
         for session in sessions:
@@ -731,7 +846,7 @@ class ProjectService:
     def create_chat_session(
         self, project_id: int, session_data: schemas.ProjectChatSessionCreate
     ) -> schemas.ProjectChatSession:
-        self.get_project(project_id)
+        self._ensure_project_exists(project_id)
         session = self.chat_repository.create_session(project_id, session_data.title)
         return schemas.ProjectChatSession(
             id=session.id,
@@ -745,7 +860,7 @@ class ProjectService:
     def update_chat_session(
         self, project_id: int, session_id: int, payload: schemas.ProjectChatSessionUpdate
     ) -> schemas.ProjectChatSession:
-        self.get_project(project_id)
+        self._ensure_project_exists(project_id)
         session = self.chat_repository.get_session(session_id)
         if not session or session.project_id != project_id:
             raise HTTPException(status_code=404, detail="Chat session not found")
@@ -761,7 +876,7 @@ class ProjectService:
         )
 
     def get_chat_messages(self, project_id: int, session_id: int) -> list[schemas.ProjectChatMessage]:
-        self.get_project(project_id)
+        self._ensure_project_exists(project_id)
         session = self.chat_repository.get_session(session_id)
         if not session or session.project_id != project_id:
             raise HTTPException(status_code=404, detail="Chat session not found")
@@ -769,26 +884,26 @@ class ProjectService:
         return [schemas.ProjectChatMessage.model_validate(message) for message in messages]
 
     def delete_chat_session(self, project_id: int, session_id: int) -> None:
-        self.get_project(project_id)
+        self._ensure_project_exists(project_id)
         session = self.chat_repository.get_session(session_id)
         if not session or session.project_id != project_id:
             raise HTTPException(status_code=404, detail="Chat session not found")
         self.chat_repository.delete_session(session)
 
     def get_project_notes(self, project_id: int) -> list[schemas.ProjectNote]:
-        self.get_project(project_id)
+        self._ensure_project_exists(project_id)
         notes = self.note_repository.list_by_project(project_id)
         return [schemas.ProjectNote.model_validate(note) for note in notes]
 
     def get_project_note(self, project_id: int, note_id: int):
-        self.get_project(project_id)
+        self._ensure_project_exists(project_id)
         note = self.note_repository.get(note_id)
         if not note or note.project_id != project_id:
             raise HTTPException(status_code=404, detail="Note not found")
         return note
 
     def create_note(self, project_id: int, note: schemas.ProjectNoteCreate) -> schemas.ProjectNote:
-        self.get_project(project_id)
+        self._ensure_project_exists(project_id)
         new_note = self.note_repository.create(project_id, note.model_dump())
         try:
             from ...tasks import index_project_note
@@ -897,10 +1012,9 @@ class ProjectService:
 
     def _compute_project_metrics(self, project_id: int) -> dict:
         """Compute metrics for a project."""
-        meeting_count = self.repository.count_meetings_by_project(project_id)
-        action_item_count = self.repository.count_action_items_by_project(project_id)
-        completed_action_items = self.repository.count_action_items_by_project(project_id, status="completed")
-        member_count = len(self.member_repository.list_by_project(project_id))
+        meeting_count, action_item_count, completed_action_items, member_count = self.repository.get_project_counts(
+            project_id
+        )
 
         return {
             "meeting_count": meeting_count,
@@ -912,51 +1026,50 @@ class ProjectService:
     def _get_recent_activity(self, project_id: int, limit: int = 50) -> list[schemas.ActivityItem]:
         """Generate recent activity feed."""
         activities = []
-
-        # Recent meetings
-        recent_meetings = self.repository.get_recent_meetings_by_project(project_id, limit=limit)
-
-        for meeting in recent_meetings:
-            activities.append(
-                schemas.ActivityItem(
-                    type="meeting_added",
-                    timestamp=meeting.created_at,
-                    description=f"Meeting '{meeting.filename}' added",
-                    metadata={"meeting_id": meeting.id, "filename": meeting.filename},
+        for row in self.repository.get_recent_activity_rows(project_id, limit=limit):
+            if row.type == "meeting_added":
+                activities.append(
+                    schemas.ActivityItem(
+                        type="meeting_added",
+                        timestamp=row.timestamp,
+                        description=f"Meeting '{row.name}' added",
+                        metadata={"meeting_id": row.entity_id, "filename": row.name},
+                    )
                 )
-            )
-
-        # Recent milestones
-        milestones = self.milestone_repository.list_by_project(project_id)
-        for milestone in milestones:
-            if milestone.completed_at:
+            else:
                 activities.append(
                     schemas.ActivityItem(
                         type="milestone_completed",
-                        timestamp=milestone.completed_at,
-                        description=f"Milestone '{milestone.name}' completed",
-                        metadata={"milestone_id": milestone.id, "name": milestone.name},
+                        timestamp=row.timestamp,
+                        description=f"Milestone '{row.name}' completed",
+                        metadata={"milestone_id": row.entity_id, "name": row.name},
                     )
                 )
+        return activities
 
-        # Sort by timestamp
-        activities.sort(key=lambda x: x.timestamp, reverse=True)
-
-        return activities[:limit]
+    def get_project_export_data(self, project_id: int) -> dict[str, Any]:
+        """Build export data for a project report.
 
-    def get_project_export_data(self, project_id: int) -> dict:
-        """Build export data for a project report."""
+        Rows are plain typed dicts: the exporters read them with ``.get`` and
+        dump them to JSON directly, so no schema re-validates them.
+        """
         project = self.repository.get(project_id)
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
 
-        project_schema = self.get_project(project_id)
-        meetings = self.get_project_meetings(project_id)
-        action_items = self.get_project_action_items(project_id)
+        # The project is already loaded, so build its payload and read the collections
+        # straight from the repositories instead of through the public getters that re-fetch it.
+        project_schema = self._to_project_schema(
+            project, self._get_project_meeting_ids_list(project.id), self._compute_project_metrics(project.id)
+        )
+        meetings = [self._meeting_to_dict(m) for m in self.repository.get_meetings_by_project(project_id)]
+        action_items = [
+            self._action_item_to_dict(item) for item in self.repository.get_project_linked_action_items(project_id)
+        ]
         milestones = self.milestone_repository.list_by_project(project_id)
         members = self.member_repository.list_by_project(project_id)
-        notes = self.note_repository.list_by_project(project_id)
-        milestones_data = [
+        notes = self.note_repository.list_by_project_with_attachments(project_id)
+        milestones_data: list[MilestoneExport] = [
             {
                 "id": milestone.id,
                 "name": milestone.name,
@@ -971,7 +1084,7 @@ class ProjectService:
             for milestone in milestones
         ]
 
-        members_data = [
+        members_data: list[MemberExport] = [
             {
                 "id": member.id,
                 "name": member.name,
@@ -983,9 +1096,9 @@ class ProjectService:
             for member in members
         ]
 
-        notes_data = []
+        notes_data: list[NoteExport] = []
         for note in notes:
-            attachments = self.attachment_repository.list_by_note(note.id)
+            attachments = sorted(note.attachments, key=lambda a: a.uploaded_at, reverse=True)
             notes_data.append(
                 {
                     "id": note.id,
@@ -1080,40 +1193,28 @@ class ProjectService:
             if not project:
                 raise HTTPException(status_code=404, detail="Project not found")
 
-            settings = project.settings or {}
-            links_raw = settings.get("gantt_links", []) or []
-            normalized_links: list[dict] = []
-            settings_changed = False
-
-            for link in links_raw:
-                if not isinstance(link, dict):
-                    continue
-                source = link.get("source")
-                target = link.get("target")
-                if not source or not target:
-                    continue
-                link_id = link.get("id") or uuid4().hex
-                link_type = link.get("type") or "e2s"
-                if link_id != link.get("id") or link_type != link.get("type"):
-                    settings_changed = True
-                normalized_links.append(
-                    {"id": str(link_id), "source": str(source), "target": str(target), "type": link_type}
-                )
-
-            if settings_changed:
-                settings["gantt_links"] = normalized_links
-                project.settings = settings
-                self.db.commit()
-                self.db.refresh(project)
-
-            dependency_map: dict[str, list[str]] = {}
-            for link in normalized_links:
-                dependency_map.setdefault(link["target"], []).append(link["source"])
-
+            links_raw = (project.settings or {}).get("gantt_links", []) or []
+            # Item ids are unique, so each item pops its own dependency list off the map
+            normalized_links, dependency_map, links_changed = _normalize_gantt_links(links_raw)
+            if links_changed:
+                # Stored links are normalized by migration 008 and on every write, so this
+                # only fires for rows written behind the service's back. Keep the read
+                # path read-only and persist the fix from a worker.
+                try:
+                    from ...tasks import normalize_project_gantt_links
+
+                    normalize_project_gantt_links.delay(project.id)
+                except Exception:
+                    pass
+
+            # Items and links are assembled from DB rows and the normalized links
+            # above, so they are constructed without per-instance validation.
             gantt_items = []
+            # Earliest/latest item date, tracked while the items are built
+            date_bounds: tuple[datetime, datetime] | None = None
 
             # Add meetings to Gantt (only those with meeting_date set)
-            meetings = self.repository.get_dated_meetings_by_project(project.id)
+            meetings = self.repository.get_dated_meeting_rows_by_project(project.id)
 
             for meeting in meetings:
                 # Calculate end date based on duration (if available)
@@ -1122,16 +1223,18 @@ class ProjectService:
                     # estimated_duration is in MINUTES, convert to timedelta
                     # (Originally thought to be seconds, but metadata extraction divides by 60)
                     end_date = meeting.meeting_date + timedelta(minutes=meeting.estimated_duration)
+                date_bounds = _widen_date_range(date_bounds, meeting.meeting_date, end_date)
 
+                item_id = f"meeting-{meeting.id}"
                 gantt_items.append(
-                    schemas.GanttItem(
-                        id=f"meeting-{meeting.id}",
+                    schemas.GanttItem.model_construct(
+                        id=item_id,
                         name=meeting.filename or f"Meeting {meeting.id}",
                         type="meeting",
                         start_date=meeting.meeting_date,
                         end_date=end_date,
                         progress=1.0,  # Meetings are always complete
-                        dependencies=dependency_map.get(f"meeting-{meeting.id}", []),
+                        dependencies=dependency_map.pop(item_id, []),
                         color="#5C6BC0",  # Indigo — unique to meetings
                         metadata={"meeting_id": meeting.id, "folder": meeting.folder, "status": meeting.status},
                     )
@@ -1145,16 +1248,18 @@ class ProjectService:
 
                 # Use due_date or created_at
                 milestone_date = milestone.due_date or milestone.created_at
+                date_bounds = _widen_date_range(date_bounds, milestone_date, milestone_date)
 
+                item_id = f"milestone-{milestone.id}"
                 gantt_items.append(
-                    schemas.GanttItem(
-                        id=f"milestone-{milestone.id}",
+                    schemas.GanttItem.model_construct(
+                        id=item_id,
                         name=milestone.name,
                         type="milestone",
                         start_date=milestone_date,
                         end_date=milestone_date,
                         progress=progress,
-                        dependencies=dependency_map.get(f"milestone-{milestone.id}", []),
+                        dependencies=dependency_map.pop(item_id, []),
                         color=milestone.color or color,
                         metadata={
                             "milestone_id": milestone.id,
@@ -1165,125 +1270,71 @@ class ProjectService:
                 )
 
             # Add action items to Gantt
-            action_items = self.get_project_action_items(project_id)
-            # We need Meeting info for action items to set start_date correctly
-            # get_project_action_items returns dicts, check if it has meeting_date
-
-            for item in action_items:
-                # Determine start date
-                start_date = None
-
-                # Prefer explicit action item start_date
-                if item.get("start_date"):
-                    if isinstance(item["start_date"], datetime):
-                        start_date = item["start_date"]
-                    elif isinstance(item["start_date"], str):
-                        from dateutil.parser import parse
-
-                        try:
-                            start_date = parse(item["start_date"])
-                        except Exception:
-                            pass
-
-                # Fallback to meeting_date as start date
-                if not start_date and item.get("meeting_date"):
-                    if isinstance(item["meeting_date"], datetime):
-                        start_date = item["meeting_date"]
-                    elif isinstance(item["meeting_date"], str):
-                        from dateutil.parser import parse
-
-                        try:
-                            start_date = parse(item["meeting_date"])
-                        except Exception:
-                            pass
-
-                # Determine due date (end date)
-                due_date_raw = item.get("due_date")
-                due_date = None
-
-                if due_date_raw:
-                    if isinstance(due_date_raw, datetime):
-                        due_date = due_date_raw
-                    elif isinstance(due_date_raw, str):
-                        from dateutil.parser import parse
-
-                        try:
-                            due_date = parse(due_date_raw)
-                        except Exception:
-                            pass
+            # Action items are read as plain rows with their meeting columns joined in,
+            # so there is no ORM object or intermediate dict per item.
+            color_map = {
+                "completed": "#66BB6A",
+                "in_progress": "#26A69A",
+                "pending": "#FFA726",
+                "cancelled": "#78909C",
+            }
+            for row in self.repository.iter_gantt_action_item_rows(project_id):
+                # Undated items (the common case) are skipped before any parsing
+                if not (row.start_date or row.meeting_date or row.due_date):
+                    continue
+
+                # Prefer explicit action item start_date, falling back to the meeting date.
+                # _parse_datetime returns tz-aware values (UTC when naive).
+                start_date = self._parse_datetime(row.start_date) or self._parse_datetime(row.meeting_date)
+                due_date = self._parse_datetime(row.due_date)
 
                 # Skip if we have neither dates
                 if not start_date and not due_date:
                     continue
 
                 # Fill missing dates
-                from datetime import timezone
-
                 if start_date and not due_date:
                     # Default: 1 week duration if no due date
                     due_date = start_date + timedelta(days=7)
                 elif due_date and not start_date:
                     # Default: start 1 week before due date
                     start_date = due_date - timedelta(days=7)
+                date_bounds = _widen_date_range(date_bounds, start_date, due_date)
 
-                # Ensure timezone awareness
-                if start_date.tzinfo is None:
-                    start_date = start_date.replace(tzinfo=timezone.utc)
-                if due_date.tzinfo is None:
-                    due_date = due_date.replace(tzinfo=timezone.utc)
-
-                task_text = item.get("task") or item.get("description") or "Action Item"
-                progress = (
-                    1.0 if item.get("status") == "completed" else 0.5 if item.get("status") == "in_progress" else 0.0
-                )
-                color_map = {
-                    "completed": "#66BB6A",
-                    "in_progress": "#26A69A",
-                    "pending": "#FFA726",
-                    "cancelled": "#78909C",
-                }
+                task_text = row.task or "Action Item"
+                progress = 1.0 if row.status == "completed" else 0.5 if row.status == "in_progress" else 0.0
 
+                item_id = f"action-{row.id}"
                 gantt_items.append(
-                    schemas.GanttItem(
-                        id=f"action-{item.get('id')}",
+                    schemas.GanttItem.model_construct(
+                        id=item_id,
                         name=task_text,
                         type="action_item",
                         start_date=start_date,
                         end_date=due_date,
                         progress=progress,
-                        dependencies=dependency_map.get(f"action-{item.get('id')}", []),
-                        color=color_map.get(item.get("status", "pending"), "#FFA726"),
+                        dependencies=dependency_map.pop(item_id, []),
+                        color=color_map.get(row.status, "#FFA726"),
                         metadata={
-                            "action_item_id": item.get("id"),
-                            "meeting_id": item.get("meeting_id"),
-                            "status": item.get("status"),
-                            "priority": item.get("priority"),
-                            "owner": item.get("owner"),
+                            "action_item_id": row.id,
+                            "meeting_id": row.meeting_id,
+                            "status": row.status,
+                            "priority": row.priority,
+                            "owner": row.owner,
                             "task": task_text,
-                            "notes": item.get("notes"),
-                            "meeting_title": item.get("meeting_title") or item.get("meeting_filename"),
+                            "notes": row.notes,
+                            "meeting_title": row.meeting_title,
                         },
                     )
                 )
 
-            # Calculate date range
-            date_range = {}
-            if gantt_items:
-                all_dates = []
-                for item in gantt_items:
-                    if item.start_date:
-                        all_dates.append(item.start_date)
-                    if item.end_date:
-                        all_dates.append(item.end_date)
-
-                if all_dates:
-                    date_range = {"start": min(all_dates), "end": max(all_dates)}
+            date_range = {"start": date_bounds[0], "end": date_bounds[1]} if date_bounds else {}
 
             return schemas.GanttData(
                 items=gantt_items,
                 milestones=[schemas.ProjectMilestone.model_validate(m) for m in milestones],
                 date_range=date_range,
-                links=[schemas.GanttLink(**link) for link in normalized_links],
+                links=[schemas.GanttLink.model_construct(**link) for link in normalized_links],
             )
 
         except HTTPException:
@@ -1333,12 +1384,12 @@ class ProjectService:
             is_manual=True,
         )
         self.db.add(item)
+        # Flush for the id, then link in the same transaction: a new item cannot
+        # already be linked, and a single commit expires the item only once.
+        self.db.flush()
+        self.pai_repo.bulk_create([{"project_id": project_id, "action_item_id": item.id}])
         self.db.commit()
         self.db.refresh(item)
-        try:
-            self.link_action_item_to_project(project_id, item.id)
-        except ValueError:
-            pass
         return item
 
     def add_gantt_link(self, project_id: int, source: str, target: str, link_type: str = "e2s") -> schemas.GanttLink:
@@ -1347,14 +1398,13 @@ class ProjectService:
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
 
-        settings = project.settings or {}
-        links = settings.get("gantt_links", []) or []
+        links = list(project.settings.get("gantt_links", []) or [])
 
         for link in links:
             if link.get("source") == source and link.get("target") == target:
                 return schemas.GanttLink(
                     **{
-                        "id": str(link.get("id") or uuid4().hex),
+                        "id": str(link.get("id") or _legacy_gantt_link_id(str(source), str(target))),
                         "source": str(link.get("source")),
                         "target": str(link.get("target")),
                         "type": link.get("type") or "e2s",
@@ -1368,10 +1418,9 @@ class ProjectService:
             "type": link_type or "e2s",
         }
         links.append(new_link)
-        settings["gantt_links"] = links
-        project.settings = settings
+        # settings is a MutableDict, so assigning the key marks the column dirty
+        project.settings["gantt_links"] = links
         self.db.commit()
-        self.db.refresh(project)
         return schemas.GanttLink(**new_link)
 
     def delete_gantt_link(self, project_id: int, link_id: str) -> None:
@@ -1380,13 +1429,26 @@ class ProjectService:
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
 
-        settings = project.settings or {}
-        links = settings.get("gantt_links", []) or []
-        links = [link for link in links if str(link.get("id")) != str(link_id)]
-        settings["gantt_links"] = links
-        project.settings = settings
+        # Normalize first so links still awaiting their stored id match the id clients were given
+        links, _, _ = _normalize_gantt_links(project.settings.get("gantt_links", []) or [])
+        project.settings["gantt_links"] = [link for link in links if link["id"] != str(link_id)]
         self.db.commit()
 
+    def normalize_project_gantt_links(self, project_id: int) -> bool:
+        """Persist normalized gantt links for a project. Returns whether anything was written.
+
+        Idempotent: links that already have an id and type are left as they are.
+        """
+        project = self.repository.get(project_id)
+        if not project:
+            return False
+
+        links, _, changed = _normalize_gantt_links(project.settings.get("gantt_links", []) or [])
+        if changed:
+            project.settings["gantt_links"] = links
+            self.db.commit()
+        return changed
+
     def update_gantt_item(self, project_id: int, item_id: str, update: schemas.GanttItemUpdate) -> schemas.GanttItem:
         """Update a Gantt item."""
         try:
@@ -1,9 +1,33 @@
 """Repository layer for search database operations."""
-from sqlalchemy import or_
+from collections.abc import Collection, Iterator
+
+from sqlalchemy import (
+    CTE,
+    Float,
+    Integer,
+    Row,
+    Select,
+    String,
+    Text,
+    cast,
+    func,
+    literal,
+    literal_column,
+    null,
+    or_,
+    select,
+    union_all,
+)
 from sqlalchemy.orm import Session
 
 from ..meetings import models as meeting_models
 
+# Must match the expression of the GIN indexes created in migration 009
+_TS_CONFIG = literal_column("'english'::regconfig")
+# Plain-text snippets: the client renders them as text, so no <b> markers
+_HEADLINE_OPTIONS = 'MaxWords=30, MinWords=15, ShortWord=3, StartSel="", StopSel=""'
+_STREAM_BATCH_SIZE = 200
+
 
 class SearchRepository:
     """Repository for executing search queries against the database."""
@@ -11,136 +35,216 @@ class SearchRepository:
     def __init__(self, db: Session) -> None:
         self.db = db
 
+    def _uses_full_text_search(self) -> bool:
+        return self.db.bind.dialect.name == "postgresql"
+
+    def _text_match(self, column, query: str):
+        """Return ``(predicate, rank, snippet)`` for matching ``query`` against a text column.
+
+        On PostgreSQL this is an indexed full-text match, ``rank`` is
+        ``ts_rank_cd`` normalized to [0, 1) and ``snippet`` is a ``ts_headline``
+        excerpt. Other databases fall back to a substring match with neither.
+        """
+        if not self._uses_full_text_search():
+            return column.ilike(f"%{query}%"), None, None
+
+        document = func.to_tsvector(_TS_CONFIG, column)
+        tsquery = func.plainto_tsquery(_TS_CONFIG, query)
+        # Normalization 32 maps the rank to rank / (rank + 1)
+        rank = func.ts_rank_cd(document, tsquery, 32)
+        return document.op("@@")(tsquery), rank, func.ts_headline(_TS_CONFIG, column, tsquery, _HEADLINE_OPTIONS)
+
     # ------------------------------------------------------------------
-    # Meeting queries
+    # Unified search
     # ------------------------------------------------------------------
 
-    def get_completed_meetings(
-        self,
-        folder: str | None = None,
-        date_from=None,
-        date_to=None,
-    ) -> list[meeting_models.Meeting]:
-        """Fetch completed meetings with optional filters."""
-        query = self.db.query(meeting_models.Meeting).filter(meeting_models.Meeting.status == "completed")
+    def _allowed_meetings(self, folder: str | None, date_from, date_to, tags: list[str] | None) -> CTE:
+        """Completed meetings matching the filters, with the columns every result carries.
+
+        ``tags`` only narrows by substring of the comma-separated tags column
+        (served by the trigram index on ``lower(tags)``); exact tag matching is
+        left to the caller.
+        """
+        meeting = meeting_models.Meeting
+        query = select(meeting.id, meeting.filename, meeting.meeting_date, meeting.folder, meeting.tags).where(
+            meeting.status == "completed"
+        )
         if folder:
-            query = query.filter(meeting_models.Meeting.folder == folder)
+            query = query.where(meeting.folder == folder)
         if date_from:
-            query = query.filter(meeting_models.Meeting.meeting_date >= date_from)
+            query = query.where(meeting.meeting_date >= date_from)
         if date_to:
-            query = query.filter(meeting_models.Meeting.meeting_date <= date_to)
-        return query.all()
-
-    def get_meetings_by_ids(self, meeting_ids: list[int]) -> list[meeting_models.Meeting]:
-        """Return meetings for a given list of IDs."""
-        return self.db.query(meeting_models.Meeting).filter(meeting_models.Meeting.id.in_(meeting_ids)).all()
-
-    def search_meetings_by_title(self, meeting_ids: list[int], pattern: str) -> list[meeting_models.Meeting]:
-        """Search meeting titles within a set of meeting IDs."""
-        return (
-            self.db.query(meeting_models.Meeting)
-            .filter(
-                meeting_models.Meeting.id.in_(meeting_ids),
-                meeting_models.Meeting.filename.ilike(pattern),
-            )
-            .all()
+            query = query.where(meeting.meeting_date <= date_to)
+        if tags:
+            tags_lower = func.lower(meeting.tags)
+            query = query.where(or_(*(tags_lower.contains(tag.lower(), autoescape=True) for tag in tags)))
+        return query.cte("allowed")
+
+    @staticmethod
+    def _content_select(
+        allowed: CTE,
+        content_type: str,
+        item_id,
+        text,
+        owner=None,
+        notes=None,
+        rank=None,
+        snippet=None,
+        branch_total=None,
+    ) -> Select:
+        """Project one content type onto the shared result row shape."""
+        return select(
+            literal(content_type, String).label("content_type"),
+            item_id.label("id"),
+            allowed.c.id.label("meeting_id"),
+            allowed.c.filename.label("meeting_title"),
+            allowed.c.meeting_date,
+            allowed.c.folder,
+            allowed.c.tags,
+            cast(text, Text).label("text"),
+            (owner if owner is not None else cast(null(), String)).label("owner"),
+            (notes if notes is not None else cast(null(), Text)).label("notes"),
+            (rank if rank is not None else cast(null(), Float)).label("rank"),
+            (snippet if snippet is not None else cast(null(), Text)).label("snippet"),
+            (branch_total if branch_total is not None else cast(null(), Integer)).label("branch_total"),
         )
 
-    def search_meetings_by_notes(self, meeting_ids: list[int], pattern: str) -> list[meeting_models.Meeting]:
-        """Search meeting notes within a set of meeting IDs."""
-        return (
-            self.db.query(meeting_models.Meeting)
-            .filter(
-                meeting_models.Meeting.id.in_(meeting_ids),
-                meeting_models.Meeting.notes.ilike(pattern),
+    def search_content(
+        self,
+        query: str,
+        content_types: Collection[str],
+        folder: str | None = None,
+        date_from=None,
+        date_to=None,
+        tags: list[str] | None = None,
+        limit: int | None = None,
+    ) -> Iterator[Row]:
+        """Search every requested content type of completed meetings in one round-trip.
+
+        Rows are streamed from the database; consume them before the session closes.
+
+        Meeting titles are always searched. Each row carries ``content_type``,
+        ``id``, the meeting's ``meeting_id``/``meeting_title``/``meeting_date``/
+        ``folder``/``tags``, the matched ``text`` (plus ``owner`` and ``notes``
+        for action items) and, where the database provides them, a ``rank``
+        and ``snippet``. Rows with a database snippet carry no ``text``.
+
+        With ``limit`` and no ``tags``, each ranked (full-text) branch returns
+        only its top ``limit`` rows, each carrying the branch's full match
+        count as ``branch_total``. A meeting has one transcription, so those
+        branches already yield at most one row per meeting and their rank is
+        the final score. With ``tags`` every match is returned: tags are only
+        matched exactly by the caller, so a limit here could drop the rows of
+        the meetings that really carry them.
+        """
+        allowed = self._allowed_meetings(folder, date_from, date_to, tags)
+        pattern = f"%{query}%"
+        meeting = meeting_models.Meeting
+        transcription = meeting_models.Transcription
+        action_item = meeting_models.ActionItem
+        selects = []
+
+        for search_key, content_type, column in (
+            ("transcripts", "transcript", transcription.full_text),
+            ("summaries", "summary", transcription.summary),
+        ):
+            if search_key not in content_types:
+                continue
+            predicate, rank, snippet = self._text_match(column, query)
+            # With a database snippet and rank the full text is not needed in Python
+            text = column if snippet is None else cast(null(), Text)
+            capped = bool(limit and rank is not None and not tags)
+            branch = (
+                self._content_select(
+                    allowed,
+                    content_type,
+                    transcription.id,
+                    text,
+                    rank=rank,
+                    snippet=snippet,
+                    # The window count is taken before the LIMIT applies
+                    branch_total=func.count().over() if capped else None,
+                )
+                .select_from(transcription)
+                .join(allowed, allowed.c.id == transcription.meeting_id)
+                .where(predicate)
             )
-            .all()
-        )
-
-    def search_meeting_titles_quick(self, pattern: str, limit: int) -> list[meeting_models.Meeting]:
-        """Quick-search completed meeting titles for autocomplete."""
-        return (
-            self.db.query(meeting_models.Meeting)
-            .filter(
-                meeting_models.Meeting.status == "completed",
-                meeting_models.Meeting.filename.ilike(pattern),
+            if capped:
+                branch = branch.order_by(rank.desc()).limit(limit)
+            selects.append(branch)
+
+        if "action_items" in content_types:
+            selects.append(
+                self._content_select(
+                    allowed, "action_item", action_item.id, action_item.task, action_item.owner, action_item.notes
+                )
+                .select_from(action_item)
+                .join(transcription, transcription.id == action_item.transcription_id)
+                .join(allowed, allowed.c.id == transcription.meeting_id)
+                .where(
+                    or_(
+                        action_item.task.ilike(pattern),
+                        action_item.owner.ilike(pattern),
+                        action_item.notes.ilike(pattern),
+                    )
+                )
             )
-            .limit(limit)
-            .all()
-        )
-
-    # ------------------------------------------------------------------
-    # Transcription queries
-    # ------------------------------------------------------------------
 
-    def search_transcriptions_full_text(
-        self, meeting_ids: list[int], pattern: str
-    ) -> list[meeting_models.Transcription]:
-        """Search transcription full text within a set of meeting IDs."""
-        return (
-            self.db.query(meeting_models.Transcription)
-            .filter(
-                meeting_models.Transcription.meeting_id.in_(meeting_ids),
-                meeting_models.Transcription.full_text.ilike(pattern),
+        if "notes" in content_types:
+            selects.append(
+                self._content_select(allowed, "note", meeting.id, meeting.notes)
+                .select_from(meeting)
+                .join(allowed, allowed.c.id == meeting.id)
+                .where(meeting.notes.ilike(pattern))
             )
-            .all()
-        )
 
-    def search_transcriptions_summary(self, meeting_ids: list[int], pattern: str) -> list[meeting_models.Transcription]:
-        """Search transcription summaries within a set of meeting IDs."""
-        return (
-            self.db.query(meeting_models.Transcription)
-            .filter(
-                meeting_models.Transcription.meeting_id.in_(meeting_ids),
-                meeting_models.Transcription.summary.ilike(pattern),
+        selects.append(
+            self._content_select(allowed, "title", allowed.c.id, allowed.c.filename).where(
+                allowed.c.filename.ilike(pattern)
             )
-            .all()
         )
 
-    def get_transcription_ids_for_meetings(self, meeting_ids: list[int]) -> list[tuple[int, int]]:
-        """Return (transcription_id, meeting_id) pairs for a set of meeting IDs."""
-        rows = (
-            self.db.query(
-                meeting_models.Transcription.id,
-                meeting_models.Transcription.meeting_id,
-            )
-            .filter(meeting_models.Transcription.meeting_id.in_(meeting_ids))
-            .all()
-        )
-        return [(r.id, r.meeting_id) for r in rows]
-
-    def get_transcription_by_id(self, transcription_id: int) -> meeting_models.Transcription | None:
-        """Get a single transcription by its ID."""
-        return (
-            self.db.query(meeting_models.Transcription)
-            .filter(meeting_models.Transcription.id == transcription_id)
-            .first()
-        )
+        statement = selects[0] if len(selects) == 1 else union_all(*selects)
+        # Stream rows in batches: non-ranked rows may carry whole transcripts
+        return iter(self.db.execute(statement.execution_options(stream_results=True, yield_per=_STREAM_BATCH_SIZE)))
 
     # ------------------------------------------------------------------
-    # Action item queries
+    # Quick search
     # ------------------------------------------------------------------
 
-    def search_action_items(self, transcription_ids: list[int], pattern: str) -> list[meeting_models.ActionItem]:
-        """Search action items by task, owner, or notes within given transcription IDs."""
-        return (
-            self.db.query(meeting_models.ActionItem)
-            .filter(
-                meeting_models.ActionItem.transcription_id.in_(transcription_ids),
-                or_(
-                    meeting_models.ActionItem.task.ilike(pattern),
-                    meeting_models.ActionItem.owner.ilike(pattern),
-                    meeting_models.ActionItem.notes.ilike(pattern),
-                ),
-            )
-            .all()
-        )
+    def search_meeting_titles_quick(self, q: str, limit: int) -> list[Row]:
+        """Quick-search completed meeting titles for autocomplete.
 
-    def search_action_items_quick(self, pattern: str, limit: int) -> list[meeting_models.ActionItem]:
-        """Quick-search action item tasks for autocomplete."""
-        return (
-            self.db.query(meeting_models.ActionItem)
-            .filter(meeting_models.ActionItem.task.ilike(pattern))
-            .limit(limit)
-            .all()
+        Returns ``id``, ``filename``, ``folder`` and ``meeting_date`` rows only.
+        On PostgreSQL the closest titles (trigram ``similarity``) come first.
+        """
+        meeting = meeting_models.Meeting
+        query = self.db.query(meeting.id, meeting.filename, meeting.folder, meeting.meeting_date).filter(
+            meeting.status == "completed", meeting.filename.ilike(f"%{q}%")
+        )
+        if self._uses_full_text_search():
+            query = query.order_by(func.similarity(meeting.filename, q).desc())
+        return query.limit(limit).all()
+
+    def search_action_items_quick(self, q: str, limit: int) -> list[Row]:
+        """Quick-search action item tasks, with their meeting, for autocomplete.
+
+        On PostgreSQL the closest tasks (trigram ``similarity``) come first.
+        """
+        action_item = meeting_models.ActionItem
+        transcription = meeting_models.Transcription
+        meeting = meeting_models.Meeting
+        query = (
+            self.db.query(
+                action_item.id,
+                action_item.task,
+                meeting.id.label("meeting_id"),
+                meeting.filename.label("meeting_title"),
+            )
+            .join(transcription, transcription.id == action_item.transcription_id)
+            .join(meeting, meeting.id == transcription.meeting_id)
+            .filter(action_item.task.ilike(f"%{q}%"))
         )
+        if self._uses_full_text_search():
+            query = query.order_by(func.similarity(action_item.task, q).desc())
+        return query.limit(limit).all()
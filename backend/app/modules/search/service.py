@@ -1,23 +1,72 @@
 """Service layer for global search business logic."""
+import heapq
+import re
+import threading
 import time
+from collections.abc import Callable, Hashable
+from functools import lru_cache
+from typing import Any
 
+from cachetools import TTLCache
 from sqlalchemy.orm import Session
 
 from .repository import SearchRepository
 from .schemas import SearchQuery, SearchResponse, SearchResultItem
 
+_WORD_RE = re.compile(r"\w+")
+# Splits a comma-separated tag string, dropping whitespace around each tag
+_TAG_SPLIT_RE = re.compile(r"\s*,\s*")
 
-def highlight_text(text: str, query: str, context_chars: int = 100) -> str:
-    """Extract a snippet with the query highlighted."""
+# Short-lived response cache: typeahead repeats the same prefixes and dashboards
+# re-issue the same queries. New or edited meetings show up within the TTL.
+_SEARCH_CACHE_TTL_SECONDS = 30
+_search_cache: TTLCache = TTLCache(maxsize=1024, ttl=_SEARCH_CACHE_TTL_SECONDS)
+_search_cache_lock = threading.Lock()
+
+
+def clear_search_cache() -> None:
+    """Drop all cached search responses."""
+    with _search_cache_lock:
+        _search_cache.clear()
+
+
+def _cached(key: Hashable, compute: Callable[[], Any]) -> Any:
+    """Return the cached value for ``key``, computing and storing it on a miss."""
+    with _search_cache_lock:
+        value = _search_cache.get(key)
+    if value is None:
+        value = compute()
+        with _search_cache_lock:
+            _search_cache[key] = value
+    return value
+
+
+@lru_cache(maxsize=256)
+def _query_terms(query: str) -> tuple[str, tuple[str, ...], tuple[str, ...]]:
+    r"""Lowercased query, its whitespace-split words and its ``\w+`` words.
+
+    Every result of a request is scored against the same query, so this is
+    computed once per query rather than once per row.
+    """
+    query_lower = query.lower()
+    return query_lower, tuple(query_lower.split()), tuple(_WORD_RE.findall(query_lower))
+
+
+def highlight_text(text: str, query: str, context_chars: int = 100, text_lower: str | None = None) -> str:
+    """Extract a snippet with the query highlighted.
+
+    ``text_lower`` may be passed when the caller already lowercased ``text``.
+    """
     if not text or not query:
         return text[:200] if text else ""
 
-    text_lower = text.lower()
-    query_lower = query.lower()
+    if text_lower is None:
+        text_lower = text.lower()
+    query_lower, split_words, _ = _query_terms(query)
 
     pos = text_lower.find(query_lower)
     if pos == -1:
-        for word in query_lower.split():
+        for word in split_words:
             pos = text_lower.find(word)
             if pos != -1:
                 break
@@ -47,20 +96,70 @@ def highlight_text(text: str, query: str, context_chars: int = 100) -> str:
     return snippet
 
 
-def calculate_score(text: str, query: str) -> float:
-    """Calculate a simple relevance score."""
+def calculate_score(text: str, query: str, text_lower: str | None = None) -> float:
+    """Calculate a simple relevance score.
+
+    1.0 when the whole query occurs in the text, otherwise the fraction of
+    query words that appear as words of the text.
+    """
     if not text or not query:
         return 0.0
 
-    text_lower = text.lower()
-    query_lower = query.lower()
+    if text_lower is None:
+        text_lower = text.lower()
+    query_lower, _, words = _query_terms(query)
 
     if query_lower in text_lower:
         return 1.0
 
-    words = query_lower.split()
-    matched_words = sum(1 for word in words if word in text_lower)
-    return matched_words / len(words) if words else 0.0
+    if not words:
+        return 0.0
+    text_words = set(_WORD_RE.findall(text_lower))
+    return sum(1 for word in words if word in text_words) / len(words)
+
+
+def score_and_snippet(text: str, query: str) -> tuple[float, str]:
+    """Return ``calculate_score`` and ``highlight_text`` for ``text``, lowercasing it once."""
+    text_lower = text.lower() if text else None
+    return calculate_score(text, query, text_lower), highlight_text(text, query, text_lower=text_lower)
+
+
+def _result_tags(tags: str | None, wanted: set[str] | None) -> list[str] | None:
+    """Split a meeting's tags for a result, or None if it has none of the ``wanted`` tags."""
+    if wanted is not None:
+        if not tags or wanted.isdisjoint(_TAG_SPLIT_RE.split(tags.strip().lower())):
+            return None
+    return tags.split(",") if tags else []
+
+
+def _action_item_content(row) -> str:
+    """Text an action item row is scored and shown by."""
+    content = f"{row.text} - {row.owner or 'Unassigned'}"
+    if row.notes:
+        content += f" - {row.notes}"
+    return content
+
+
+def _score_row(row, query: str) -> float:
+    """Return the relevance score of one ``SearchRepository.search_content`` row."""
+    if row.content_type == "action_item":
+        return calculate_score(_action_item_content(row), query)
+    if row.content_type == "title":
+        return min(calculate_score(row.text, query) + 0.5, 1.0)
+    if row.snippet is not None:
+        return row.rank
+    return calculate_score(row.text, query)
+
+
+def _row_snippet(row, query: str) -> str:
+    """Return the snippet shown for one ``SearchRepository.search_content`` row."""
+    if row.content_type == "action_item":
+        return _action_item_content(row)[:200]
+    if row.content_type == "title":
+        return row.text
+    if row.snippet is not None:
+        return row.snippet
+    return highlight_text(row.text, query)
 
 
 class SearchService:
@@ -70,166 +169,98 @@ class SearchService:
         self.repository = SearchRepository(db)
 
     def unified_search(self, search_query: SearchQuery) -> SearchResponse:
-        """Perform a global search across all configured content types."""
+        """Perform a global search across all configured content types.
+
+        Responses are cached briefly per normalized query and filters.
+        """
         start_time = time.time()
 
         query = search_query.query.strip()
         if not query:
             return SearchResponse(results=[], total=0, query=query, search_time_ms=0)
 
-        results: list[SearchResultItem] = []
-        search_pattern = f"%{query}%"
-
-        # Fetch candidate meetings with filters
-        meetings = self.repository.get_completed_meetings(
+        # A set deduplicates repeated content types and gives the same cache key in any order
+        search_in = frozenset(search_query.search_in or ("transcripts", "summaries", "action_items", "notes"))
+        cache_key = (
+            "unified",
+            query,
+            search_in,
+            search_query.folder,
+            tuple(sorted(search_query.tags)) if search_query.tags else None,
+            search_query.date_from,
+            search_query.date_to,
+            search_query.limit or 20,
+        )
+        response = _cached(cache_key, lambda: self._unified_search(search_query, query, search_in))
+        return response.model_copy(update={"search_time_ms": round((time.time() - start_time) * 1000, 2)})
+
+    def _unified_search(self, search_query: SearchQuery, query: str, search_in: frozenset[str]) -> SearchResponse:
+        """Run the unified search against the database."""
+        rows = self.repository.search_content(
+            query,
+            search_in,
             folder=search_query.folder,
             date_from=search_query.date_from,
             date_to=search_query.date_to,
+            tags=search_query.tags,
+            limit=search_query.limit or 20,
         )
 
-        # Apply tag filter
-        if search_query.tags:
-            meetings = [
-                m
-                for m in meetings
-                if m.tags
-                and any(t.lower() in [tag.strip().lower() for tag in m.tags.split(",")] for t in search_query.tags)
-            ]
-
-        if not meetings:
-            return SearchResponse(
-                results=[],
-                total=0,
-                query=query,
-                search_time_ms=round((time.time() - start_time) * 1000, 2),
-            )
-
-        meeting_ids = [m.id for m in meetings]
-        meeting_map = {m.id: m for m in meetings}
-
-        search_in = search_query.search_in or ["transcripts", "summaries", "action_items", "notes"]
-
-        # --- Transcripts ---
-        if "transcripts" in search_in:
-            for t in self.repository.search_transcriptions_full_text(meeting_ids, search_pattern):
-                meeting = meeting_map.get(t.meeting_id)
-                if meeting:
-                    results.append(
-                        SearchResultItem(
-                            id=t.id,
-                            meeting_id=t.meeting_id,
-                            meeting_title=meeting.filename,
-                            meeting_date=meeting.meeting_date,
-                            content_type="transcript",
-                            snippet=highlight_text(t.full_text, query),
-                            score=calculate_score(t.full_text, query),
-                            folder=meeting.folder,
-                            tags=meeting.tags.split(",") if meeting.tags else [],
-                        )
-                    )
-
-        # --- Summaries ---
-        if "summaries" in search_in:
-            for t in self.repository.search_transcriptions_summary(meeting_ids, search_pattern):
-                meeting = meeting_map.get(t.meeting_id)
-                if meeting:
-                    results.append(
-                        SearchResultItem(
-                            id=t.id,
-                            meeting_id=t.meeting_id,
-                            meeting_title=meeting.filename,
-                            meeting_date=meeting.meeting_date,
-                            content_type="summary",
-                            snippet=highlight_text(t.summary, query),
-                            score=calculate_score(t.summary, query),
-                            folder=meeting.folder,
-                            tags=meeting.tags.split(",") if meeting.tags else [],
-                        )
-                    )
-
-        # --- Action items ---
-        if "action_items" in search_in:
-            trans_pairs = self.repository.get_transcription_ids_for_meetings(meeting_ids)
-            trans_map = dict(trans_pairs)
-            trans_ids = list(trans_map.keys())
-
-            if trans_ids:
-                for ai in self.repository.search_action_items(trans_ids, search_pattern):
-                    meeting_id = trans_map.get(ai.transcription_id)
-                    meeting = meeting_map.get(meeting_id)
-                    if meeting:
-                        content = f"{ai.task} - {ai.owner or 'Unassigned'}"
-                        if ai.notes:
-                            content += f" - {ai.notes}"
-                        results.append(
-                            SearchResultItem(
-                                id=ai.id,
-                                meeting_id=meeting_id,
-                                meeting_title=meeting.filename,
-                                meeting_date=meeting.meeting_date,
-                                content_type="action_item",
-                                snippet=content[:200],
-                                score=calculate_score(content, query),
-                                folder=meeting.folder,
-                                tags=meeting.tags.split(",") if meeting.tags else [],
-                            )
-                        )
-
-        # --- Notes ---
-        if "notes" in search_in:
-            for m in self.repository.search_meetings_by_notes(meeting_ids, search_pattern):
-                results.append(
-                    SearchResultItem(
-                        id=m.id,
-                        meeting_id=m.id,
-                        meeting_title=m.filename,
-                        meeting_date=m.meeting_date,
-                        content_type="note",
-                        snippet=highlight_text(m.notes, query),
-                        score=calculate_score(m.notes, query),
-                        folder=m.folder,
-                        tags=m.tags.split(",") if m.tags else [],
-                    )
-                )
-
-        # --- Titles (always searched) ---
-        for m in self.repository.search_meetings_by_title(meeting_ids, search_pattern):
-            score = min(calculate_score(m.filename, query) + 0.5, 1.0)
-            results.append(
-                SearchResultItem(
-                    id=m.id,
-                    meeting_id=m.id,
-                    meeting_title=m.filename,
-                    meeting_date=m.meeting_date,
-                    content_type="title",
-                    snippet=m.filename,
-                    score=score,
-                    folder=m.folder,
-                    tags=m.tags.split(",") if m.tags else [],
-                )
+        wanted_tags = {t.lower() for t in search_query.tags} if search_query.tags else None
+        # Rows of one meeting share its tags string, so tags are parsed once per meeting;
+        # None marks a meeting the exact tag filter rejects (the repository only
+        # narrows tags by substring).
+        tag_lists: dict[int, list[str] | None] = {}
+        # Best-scoring row per (meeting, content type). Snippets and result models are
+        # only built for the rows that survive the top-``limit`` cut.
+        best: dict[tuple[int, str], tuple[float, Any, list[str]]] = {}
+        # Full match counts of the content types the repository capped at ``limit`` rows
+        capped_totals: dict[str, int] = {}
+        for row in rows:
+            if row.branch_total is not None:
+                capped_totals[row.content_type] = row.branch_total
+            if row.meeting_id not in tag_lists:
+                tag_lists[row.meeting_id] = _result_tags(row.tags, wanted_tags)
+            tags = tag_lists[row.meeting_id]
+            if tags is None:
+                continue
+
+            score = _score_row(row, query)
+            key = (row.meeting_id, row.content_type)
+            current = best.get(key)
+            if current is not None and current[0] >= score:
+                continue
+            best[key] = (score, row, tags)
+
+        top = heapq.nlargest(search_query.limit or 20, best.values(), key=lambda hit: hit[0])
+        limited = [
+            SearchResultItem(
+                id=row.id,
+                meeting_id=row.meeting_id,
+                meeting_title=row.meeting_title,
+                meeting_date=row.meeting_date,
+                content_type=row.content_type,
+                snippet=_row_snippet(row, query),
+                score=score,
+                folder=row.folder,
+                tags=tags,
             )
-
-        # Deduplicate and sort by score
-        seen: set[tuple[int, str]] = set()
-        unique_results: list[SearchResultItem] = []
-        for r in sorted(results, key=lambda x: x.score, reverse=True):
-            key = (r.meeting_id, r.content_type)
-            if key not in seen:
-                seen.add(key)
-                unique_results.append(r)
-
-        limited = unique_results[: search_query.limit or 20]
-        search_time = round((time.time() - start_time) * 1000, 2)
-
-        return SearchResponse(results=limited, total=len(unique_results), query=query, search_time_ms=search_time)
+            for score, row, tags in top
+        ]
+        # search_time_ms is stamped by unified_search, for cache hits too
+        total = sum(content_type not in capped_totals for _, content_type in best) + sum(capped_totals.values())
+        return SearchResponse(results=limited, total=total, query=query, search_time_ms=0)
 
     def quick_search(self, q: str, limit: int) -> dict:
-        """Quick search for autocomplete/suggestions."""
-        pattern = f"%{q}%"
+        """Quick search for autocomplete/suggestions (cached briefly per query and limit)."""
+        return _cached(("quick", q, limit), lambda: self._quick_search(q, limit))
+
+    def _quick_search(self, q: str, limit: int) -> dict:
+        """Run the quick search against the database."""
         results = []
 
         # Meeting titles
-        meetings = self.repository.search_meeting_titles_quick(pattern, limit)
+        meetings = self.repository.search_meeting_titles_quick(q, limit)
         for m in meetings:
             results.append(
                 {
@@ -244,21 +275,15 @@ class SearchService:
         # Action items (fill remaining slots)
         remaining = limit - len(results)
         if remaining > 0:
-            action_items = self.repository.search_action_items_quick(pattern, remaining)
-            for ai in action_items:
-                trans = self.repository.get_transcription_by_id(ai.transcription_id)
-                if trans:
-                    meeting = self.repository.get_meetings_by_ids([trans.meeting_id])
-                    if meeting:
-                        m = meeting[0]
-                        results.append(
-                            {
-                                "id": ai.id,
-                                "title": ai.task[:50],
-                                "type": "action_item",
-                                "meeting_id": m.id,
-                                "meeting_title": m.filename,
-                            }
-                        )
+            for ai in self.repository.search_action_items_quick(q, remaining):
+                results.append(
+                    {
+                        "id": ai.id,
+                        "title": ai.task[:50],
+                        "type": "action_item",
+                        "meeting_id": ai.meeting_id,
+                        "meeting_title": ai.meeting_title,
+                    }
+                )
 
         return {"results": results, "query": q}
@@ -1,4 +1,5 @@
-from sqlalchemy import JSON, Boolean, Column, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy import JSON, Boolean, Column, DateTime, ForeignKey, Index, Integer, String, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -27,7 +28,7 @@ class ModelConfiguration(Base):
     whisper_model = Column(String, default="base")
     whisper_provider = Column(String, default="faster-whisper")
 
-    chat_provider = Column(String, default="openai", index=True)
+    chat_provider = Column(String, default="openai")
     chat_model = Column(String, default="gpt-4o-mini")
     chat_base_url = Column(String, nullable=True)
     chat_api_key_id = Column(Integer, ForeignKey("api_keys.id"), nullable=True, index=True)
@@ -40,26 +41,40 @@ class ModelConfiguration(Base):
     max_tokens = Column(Integer, default=4000)
     max_reasoning_depth = Column(Integer, default=3)
 
-    is_default = Column(Boolean, default=False, index=True)
+    is_default = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
-    chat_api_key = relationship("APIKey", foreign_keys=[chat_api_key_id])
-    analysis_api_key = relationship("APIKey", foreign_keys=[analysis_api_key_id])
-
-    __table_args__ = (Index("idx_model_config_provider_active", "chat_provider", "is_default"),)
+    # Both keys are serialized with every configuration (and read by the LLM
+    # clients), so load them in the same query
+    chat_api_key = relationship("APIKey", foreign_keys=[chat_api_key_id], lazy="joined")
+    analysis_api_key = relationship("APIKey", foreign_keys=[analysis_api_key_id], lazy="joined")
+
+    __table_args__ = (
+        # Leads with is_default: the default-configuration lookup filters on it alone
+        Index("idx_model_config_default_provider", "is_default", "chat_provider"),
+        # At most one default configuration
+        Index(
+            "uq_model_config_single_default",
+            "is_default",
+            unique=True,
+            postgresql_where=text("is_default"),
+            sqlite_where=text("is_default"),
+        ),
+    )
 
 
 class EmbeddingConfiguration(Base):
     __tablename__ = "embedding_configurations"
 
     id = Column(Integer, primary_key=True, index=True)
-    provider = Column(String, nullable=False, index=True)
+    provider = Column(String, nullable=False)
     model_name = Column(String, nullable=False)
     dimension = Column(Integer, nullable=False)
     base_url = Column(String, nullable=True)
     api_key_id = Column(Integer, ForeignKey("api_keys.id"), nullable=True, index=True)
-    settings = Column(JSON, nullable=True)
+    # Stored parsed on PostgreSQL; plain JSON keeps other databases working
+    settings = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
     is_active = Column(Boolean, default=True, nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
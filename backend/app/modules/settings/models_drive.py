@@ -13,7 +13,7 @@ class GoogleDriveCredentials(Base):
 
     __tablename__ = "google_drive_credentials"
 
-    user_id = Column(String, primary_key=True, index=True, default="default")
+    user_id = Column(String, primary_key=True, default="default")
     credentials_json = Column(String, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -25,7 +25,7 @@ class GoogleDriveSyncConfig(Base):
     __tablename__ = "google_drive_sync_config"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(String, index=True, default="default")
+    user_id = Column(String, default="default")
     sync_folder_id = Column(String, nullable=True)
     processed_folder_id = Column(String, nullable=True)
     enabled = Column(Boolean, default=False)
@@ -1,6 +1,7 @@
 """Repository layer for settings database operations."""
 from datetime import datetime
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from . import models, schemas
@@ -21,10 +22,11 @@ class SettingsRepository:
         return self.db.query(models.APIKey).filter(models.APIKey.is_active == True).all()
 
     def get_api_key_by_id(self, key_id: int) -> models.APIKey | None:
-        return self.db.query(models.APIKey).filter(models.APIKey.id == key_id).first()
+        return self.db.get(models.APIKey, key_id)
 
     def get_active_api_key_by_id(self, key_id: int) -> models.APIKey | None:
-        return self.db.query(models.APIKey).filter(models.APIKey.id == key_id, models.APIKey.is_active == True).first()
+        api_key = self.db.get(models.APIKey, key_id)
+        return api_key if api_key and api_key.is_active else None
 
     def get_api_key_by_name(self, name: str) -> models.APIKey | None:
         return self.db.query(models.APIKey).filter(models.APIKey.name == name).first()
@@ -71,7 +73,7 @@ class SettingsRepository:
         return self.db.query(models.ModelConfiguration).all()
 
     def get_model_configuration_by_id(self, config_id: int) -> models.ModelConfiguration | None:
-        return self.db.query(models.ModelConfiguration).filter(models.ModelConfiguration.id == config_id).first()
+        return self.db.get(models.ModelConfiguration, config_id)
 
     def get_model_configuration_by_name(self, name: str) -> models.ModelConfiguration | None:
         return self.db.query(models.ModelConfiguration).filter(models.ModelConfiguration.name == name).first()
@@ -114,12 +116,18 @@ class SettingsRepository:
         ):
             update_data["analysis_api_key_id"] = None
 
+        # Set last, once any other default is cleared (see set_default_model_configuration)
+        is_default = update_data.pop("is_default", None)
         for field, value in update_data.items():
             setattr(db_config, field, value)
 
-        if config_update.is_default:
-            self.db.query(models.ModelConfiguration).update({models.ModelConfiguration.is_default: False})
+        if is_default:
+            self.db.query(models.ModelConfiguration).filter(
+                models.ModelConfiguration.is_default == True, models.ModelConfiguration.id != config_id
+            ).update({models.ModelConfiguration.is_default: False}, synchronize_session=False)
             db_config.is_default = True
+        elif is_default is not None:
+            db_config.is_default = is_default
 
         self.db.commit()
         self.db.refresh(db_config)
@@ -133,9 +141,13 @@ class SettingsRepository:
         return db_config
 
     def set_default_model_configuration(self, config_id: int) -> models.ModelConfiguration | None:
-        self.db.query(models.ModelConfiguration).update({models.ModelConfiguration.is_default: False})
         db_config = self.get_model_configuration_by_id(config_id)
         if db_config:
+            # Clear the old default before setting the new one: the single-default
+            # unique index is checked row by row, not at the end of a statement
+            self.db.query(models.ModelConfiguration).filter(
+                models.ModelConfiguration.is_default == True, models.ModelConfiguration.id != config_id
+            ).update({models.ModelConfiguration.is_default: False}, synchronize_session=False)
             db_config.is_default = True
             self.db.commit()
             self.db.refresh(db_config)
@@ -151,9 +163,7 @@ class SettingsRepository:
         )
 
     def get_embedding_configuration(self, config_id: int) -> models.EmbeddingConfiguration | None:
-        return (
-            self.db.query(models.EmbeddingConfiguration).filter(models.EmbeddingConfiguration.id == config_id).first()
-        )
+        return self.db.get(models.EmbeddingConfiguration, config_id)
 
     def get_active_embedding_configuration(self) -> models.EmbeddingConfiguration | None:
         return (
@@ -233,7 +243,7 @@ class GoogleDriveRepository:
 
     def get_credentials(self, user_id: str = "default") -> GoogleDriveCredentials | None:
         """Retrieve Google Drive credentials for a user."""
-        return self.db.query(GoogleDriveCredentials).filter(GoogleDriveCredentials.user_id == user_id).first()
+        return self.db.get(GoogleDriveCredentials, user_id)
 
     def save_credentials(self, credentials_json: str, user_id: str = "default") -> GoogleDriveCredentials:
         """Save or update Google Drive credentials for a user."""
@@ -326,6 +336,30 @@ class GoogleDriveRepository:
             is not None
         )
 
+    def get_processed_file_ids(self, drive_file_ids: list[str]) -> set[str]:
+        """Return which of ``drive_file_ids`` have already been processed, in one query."""
+        if not drive_file_ids:
+            return set()
+        rows = (
+            self.db.query(GoogleDriveProcessedFile.drive_file_id)
+            .filter(GoogleDriveProcessedFile.drive_file_id.in_(drive_file_ids))
+            .all()
+        )
+        return {drive_file_id for (drive_file_id,) in rows}
+
+    def mark_files_as_processed(self, files: list[tuple[str, str]]) -> None:
+        """Mark many ``(drive_file_id, drive_file_name)`` files as processed in a single multi-row INSERT.
+
+        Callers must pass files that are not yet processed (see ``get_processed_file_ids``).
+        """
+        if not files:
+            return
+        self.db.execute(
+            insert(GoogleDriveProcessedFile),
+            [{"drive_file_id": file_id, "drive_file_name": file_name} for file_id, file_name in files],
+        )
+        self.db.commit()
+
     def mark_file_as_processed(
         self,
         drive_file_id: str,
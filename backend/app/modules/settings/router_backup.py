@@ -5,31 +5,40 @@ This module provides functionality to export all application data
 and import it into another instance.
 """
 
-import io
 import json
 import logging
 import os
+import shutil
 import zipfile
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cache
 from pathlib import Path
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
 from fastapi.responses import StreamingResponse
-from sqlalchemy import inspect
-from sqlalchemy.orm import Session
+from sqlalchemy import Date, DateTime, RowMapping, ScalarSelect, func, insert, inspect, select, update
+from sqlalchemy.orm import Session, selectinload
 
 from ...core.config import get_upload_config
 from ...database import get_db
 from ...models import (
     ActionItem,
+    APIKey,
+    EmbeddingConfiguration,
     GlobalChatSession,
     GoogleDriveProcessedFile,
     GoogleDriveSyncConfig,
     Meeting,
     MeetingLink,
+    ModelConfiguration,
     Speaker,
+    Transcription,
     UserMapping,
+    WorkerConfiguration,
 )
 from ..diary.models import DiaryEntry
 from ..projects.models import (
@@ -42,42 +51,447 @@ from ..projects.models import (
     ProjectNote,
     ProjectNoteAttachment,
 )
+from .service import clear_settings_cache
 
 router = APIRouter(prefix="/backup", tags=["backup"])
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round-trip while streaming an export. Meeting batches are
+# smaller: each meeting carries its full transcript.
+_EXPORT_BATCH_SIZE = 1000
+_EXPORT_MEETING_BATCH_SIZE = 100
+# Imported rows are committed in batches of this size, so large tables never
+# build one huge transaction and a failing batch only loses its own rows
+_IMPORT_BATCH_SIZE = 1000
+# Upload files are copied into and out of backup archives in blocks of this
+# size (read unbuffered straight into the block on export)
+_FILE_BLOCK_SIZE = 1024 * 1024
+# Column value types exported as they are (JSON columns keep their dicts and lists)
+_PASSTHROUGH_TYPES = frozenset({str, int, float, bool, type(None), datetime, dict, list})
+# Audio and video uploads are stored uncompressed in a ZIP export: they are
+# already compressed (or, for WAV, deflate poorly) and deflating them only
+# costs CPU
+_EXPORT_STORED_SUFFIXES = frozenset(
+    {".mp3", ".m4a", ".mp4", ".aac", ".ogg", ".opus", ".flac", ".wma", ".wav", ".mkv", ".avi", ".mov", ".webm"}
+)
+
+
+def _serialize_value(value: Any) -> Any:
+    """Convert a column value to its JSON form.
+
+    Datetimes are left to the encoder (see :func:`_dumps`), which writes them
+    in ISO 8601.
+    """
+    # Exact-type lookup first: it covers almost every value
+    if type(value) in _PASSTHROUGH_TYPES:
+        return value
+    elif isinstance(value, bytes):
+        # Skip binary data
+        return None
+    elif isinstance(value, datetime | str | int | float | dict | list):
+        # Subclasses, e.g. MutableDict for JSON columns
+        return value
+    else:
+        # Other types (Decimal, date, UUID, ...) are exported as strings
+        return str(value)
+
+
+@cache
+def _column_keys(model: type) -> tuple[str, ...]:
+    """Column attribute keys of a mapped class, resolved once per class."""
+    return tuple(column.key for column in inspect(model).column_attrs)
+
+
+@cache
+def _temporal_columns(model: type) -> tuple[tuple[str, bool], ...]:
+    """``(key, is_date)`` for the DateTime and Date columns of a mapped class, resolved once per class."""
+    columns = []
+    for attr in inspect(model).column_attrs:
+        column_type = attr.columns[0].type
+        if isinstance(column_type, DateTime):
+            columns.append((attr.key, False))
+        elif isinstance(column_type, Date):
+            columns.append((attr.key, True))
+    return tuple(columns)
+
+
+def _parse_temporal_fields(model: type, data: dict[str, Any]) -> None:
+    """Parse the ISO 8601 date and datetime columns of an imported ``model`` row in place.
+
+    Values that cannot be parsed become ``None``.
+    """
+    for key, is_date in _temporal_columns(model):
+        value = data.get(key)
+        if not value:
+            continue
+        try:
+            parsed = datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            data[key] = None
+        else:
+            data[key] = parsed.date() if is_date else parsed
+
+
+def _parse_json_field(value: str, default: Any) -> Any:
+    """Parse a JSON column exported as a string, or return ``default`` if it is not valid JSON."""
+    try:
+        return json.loads(value)
+    except ValueError:
+        return default
+
 
 def serialize_model(obj: Any) -> dict[str, Any]:
     """Convert SQLAlchemy model to dictionary."""
     if obj is None:
         return None
+    # Loaded values sit in __dict__; reading them there skips the attribute
+    # descriptors. getattr still covers expired or unloaded columns.
+    loaded = obj.__dict__
+    return {
+        key: _serialize_value(loaded[key] if key in loaded else getattr(obj, key)) for key in _column_keys(type(obj))
+    }
+
+
+def serialize_row(row: RowMapping) -> dict[str, Any]:
+    """Convert a Core result row (``Result.mappings()``) to the same dictionary as :func:`serialize_model`."""
+    return {key: _serialize_value(value) for key, value in row.items()}
+
+
+def _serialize_meeting(meeting: Meeting) -> dict[str, Any]:
+    """Serialize a meeting with its (eager-loaded) transcription, speakers and action items."""
+    meeting_dict = serialize_model(meeting)
+    transcription = meeting.transcription
+    meeting_dict["transcription"] = serialize_model(transcription) if transcription else None
+    meeting_dict["speakers"] = [serialize_model(s) for s in meeting.speakers]
+    # Action items hang off the transcription
+    meeting_dict["action_items"] = [serialize_model(a) for a in transcription.action_items] if transcription else []
+    return meeting_dict
+
 
-    result = {}
-    for column in inspect(obj).mapper.column_attrs:
-        value = getattr(obj, column.key)
-        if isinstance(value, datetime):
-            result[column.key] = value.isoformat()
-        elif value is None:
-            result[column.key] = None
-        elif isinstance(value, str | int | float | bool):
-            result[column.key] = value
-        elif isinstance(value, bytes):
-            # Skip binary data
-            result[column.key] = None
-        elif isinstance(value, dict | list):
-            # Preserve dict and list types (JSON columns)
-            result[column.key] = value
+def _count(model, *criteria) -> ScalarSelect:
+    return select(func.count()).select_from(model).where(*criteria).scalar_subquery()
+
+
+def _counts(db: Session, counts: dict[str, ScalarSelect]) -> dict[str, int]:
+    """Evaluate named :func:`_count` subqueries in a single round-trip."""
+    return dict(db.execute(select(*(count.label(key) for key, count in counts.items()))).one()._mapping)
+
+
+def _dumps(value: Any, pretty: bool = False) -> bytes:
+    """Encode ``value`` as UTF-8 JSON."""
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+
+@dataclass(frozen=True)
+class _TableSpec:
+    """A flat table section of the backup document.
+
+    ``count_key`` names the table in the export metadata counts and
+    ``criteria`` narrows its rows; a ``single`` section holds the first row
+    instead of a list. The remaining fields describe tables restored by
+    :func:`_import_table`: ``parents`` maps foreign keys to the id map of a
+    required parent, ``references`` to that of an optional one, and
+    ``dedupe`` names the columns that identify an existing row.
+    ``file_fields`` name columns holding stored upload paths.
+    """
+
+    key: str
+    model: type
+    count_key: str | None = None
+    criteria: tuple = ()
+    single: bool = False
+    label: str = ""
+    label_field: str | None = None
+    parents: dict[str, str] = field(default_factory=dict)
+    references: dict[str, str] = field(default_factory=dict)
+    dedupe: tuple[str, ...] = ()
+    file_fields: tuple[str, ...] = ()
+
+
+# Flat tables in document order. Meetings, which nest their transcription,
+# speakers and action items, come first and are handled separately.
+_TABLES = (
+    _TableSpec("user_mappings", UserMapping, "user_mappings"),
+    _TableSpec("meeting_links", MeetingLink, "links"),
+    _TableSpec("drive_sync_config", GoogleDriveSyncConfig, single=True),
+    _TableSpec("drive_processed_files", GoogleDriveProcessedFile, "processed_files"),
+    _TableSpec("global_chat_sessions", GlobalChatSession, "chat_sessions"),
+    _TableSpec("api_keys", APIKey, "api_keys"),
+    _TableSpec("model_configurations", ModelConfiguration, "model_configs"),
+    _TableSpec("embedding_configurations", EmbeddingConfiguration, "embedding_configs"),
+    _TableSpec("worker_configuration", WorkerConfiguration, single=True),
+    _TableSpec("diary_entries", DiaryEntry, "diary_entries"),
+    _TableSpec(
+        "standalone_action_items",
+        ActionItem,
+        "standalone_action_items",
+        criteria=(ActionItem.transcription_id.is_(None),),
+    ),
+    _TableSpec("projects", Project, "projects"),
+    _TableSpec(
+        "project_meetings",
+        ProjectMeeting,
+        "project_meetings",
+        label="Project meeting",
+        label_field="meeting_id",
+        parents={"project_id": "projects"},
+        dedupe=("project_id", "meeting_id"),
+    ),
+    _TableSpec(
+        "project_milestones",
+        ProjectMilestone,
+        "project_milestones",
+        label="Project milestone",
+        label_field="name",
+        parents={"project_id": "projects"},
+        dedupe=("project_id", "name"),
+    ),
+    _TableSpec(
+        "project_members",
+        ProjectMember,
+        "project_members",
+        label="Project member",
+        label_field="name",
+        parents={"project_id": "projects"},
+        references={"user_mapping_id": "user_mappings"},
+        dedupe=("project_id", "name"),
+    ),
+    _TableSpec("project_chat_sessions", ProjectChatSession, "project_chat_sessions"),
+    _TableSpec(
+        "project_chat_messages",
+        ProjectChatMessage,
+        "project_chat_messages",
+        label="Project chat message",
+        parents={"session_id": "project_chat_sessions"},
+    ),
+    _TableSpec("project_notes", ProjectNote, "project_notes"),
+    _TableSpec(
+        "project_note_attachments",
+        ProjectNoteAttachment,
+        "project_note_attachments",
+        label="Project note attachment",
+        label_field="filename",
+        parents={"project_id": "projects", "note_id": "project_notes"},
+        dedupe=("project_id", "note_id", "filename"),
+        file_fields=("filepath",),
+    ),
+)
+_TABLE_SPECS = {table.key: table for table in _TABLES}
+
+
+def _export_json_chunks(db: Session, pretty: bool = False, file_paths: set[str] | None = None) -> Iterator[bytes]:
+    """Yield the backup JSON document piece by piece.
+
+    Rows are serialized and emitted one at a time, so neither the document nor
+    a whole table is held in memory. ``pretty`` indents each object. If
+    ``file_paths`` is given, the stored upload paths of the exported meetings
+    and attachments are added to it as their rows are written; it is complete
+    once the document is.
+    """
+
+    def dumps(value: Any) -> bytes:
+        return _dumps(value, pretty)
+
+    def rows(model, *criteria) -> Iterator[dict[str, Any]]:
+        # Plain table rows through Core: no ORM instances, identity map or
+        # attribute instrumentation, streamed from a server-side cursor in batches
+        statement = select(model.__table__).where(*criteria).execution_options(yield_per=_EXPORT_BATCH_SIZE)
+        return (serialize_row(row) for row in db.execute(statement).mappings())
+
+    def first_row(model) -> dict[str, Any] | None:
+        row = db.execute(select(model.__table__).limit(1)).mappings().first()
+        return serialize_row(row) if row else None
+
+    # Meetings nest their relations, so they stay on the ORM; related rows are
+    # loaded per batch of meetings with one IN query each
+    meetings = (
+        db.query(Meeting)
+        .options(
+            selectinload(Meeting.transcription).selectinload(Transcription.action_items),
+            selectinload(Meeting.speakers),
+        )
+        .yield_per(_EXPORT_MEETING_BATCH_SIZE)
+    )
+    counts = {"meetings": _count(Meeting)}
+    counts.update((table.count_key, _count(table.model, *table.criteria)) for table in _TABLES if table.count_key)
+    metadata = {"version": "1.1", "exported_at": datetime.utcnow().isoformat(), "counts": _counts(db, counts)}
+
+    def list_section(key: str, items: Iterator[dict[str, Any]], file_fields: tuple[str, ...] = ()) -> Iterator[bytes]:
+        yield b", " + dumps(key) + b": ["
+        for index, row in enumerate(items):
+            if file_paths is not None:
+                file_paths.update(row[column] for column in file_fields if row[column])
+            yield (b"," if index else b"") + dumps(row)
+        yield b"]"
+
+    yield b'{"export_metadata": ' + dumps(metadata)
+    meeting_rows = (_serialize_meeting(meeting) for meeting in meetings)
+    yield from list_section("meetings", meeting_rows, ("filepath", "audio_filepath"))
+    # Drive sync config is exported without credentials; chat sessions without history
+    for table in _TABLES:
+        if table.single:
+            yield b", " + dumps(table.key) + b": " + dumps(first_row(table.model))
         else:
-            # Try to convert to string for other types
-            try:
-                result[column.key] = str(value)
-            except:
-                result[column.key] = None
-    return result
+            # Each table is queried only once the previous one has been written
+            yield from list_section(table.key, rows(table.model, *table.criteria), table.file_fields)
+    yield b"}"
+
+
+def _bulk_insert(db: Session, model, rows: list[dict[str, Any]], stats: dict[str, Any], stat_key: str, label: str):
+    """Insert imported ``rows`` of ``model`` and count them in ``stats``.
+
+    Rows are inserted with one executemany and committed per batch of
+    ``_IMPORT_BATCH_SIZE``. Keys that are not columns of ``model`` are
+    dropped. If a batch fails, its rows are rolled back and the error is
+    recorded instead.
+    """
+    keys = set(_column_keys(model))
+    for start in range(0, len(rows), _IMPORT_BATCH_SIZE):
+        batch = rows[start : start + _IMPORT_BATCH_SIZE]
+        try:
+            db.execute(insert(model), [{k: v for k, v in row.items() if k in keys} for row in batch])
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            stats["errors"].append(f"{label} {start + 1}-{start + len(batch)}: {str(e)}")
+        else:
+            stats[stat_key] += len(batch)
+
+
+def _import_table(
+    db: Session,
+    table: _TableSpec,
+    rows: list[dict[str, Any]],
+    id_maps: dict[str, dict],
+    stats: dict[str, Any],
+    merge_mode: bool,
+) -> None:
+    """Import the rows of a table that nothing else references, then commit.
+
+    Foreign keys are remapped through ``id_maps`` (old id -> new id, keyed by
+    the parent's section); rows whose required parent was not imported are
+    skipped, as are rows matching an existing ``dedupe`` key unless
+    ``merge_mode`` is set.
+    """
+    existing = set()
+    if table.dedupe:
+        existing = set(db.execute(select(*(getattr(table.model, column) for column in table.dedupe))).all())
+
+    new_rows = []
+    for row_data in rows:
+        try:
+            _parse_temporal_fields(table.model, row_data)
+            row = {k: v for k, v in row_data.items() if k != "id"}
+            for column, parent in table.parents.items():
+                row[column] = id_maps[parent].get(row_data.get(column))
+            if not all(row[column] for column in table.parents):
+                continue
+            for column, referenced in table.references.items():
+                if row.get(column):
+                    row[column] = id_maps[referenced].get(row[column])
+
+            if table.dedupe:
+                dedupe_key = tuple(row.get(column) for column in table.dedupe)
+                if dedupe_key in existing and not merge_mode:
+                    continue
+                existing.add(dedupe_key)
+            new_rows.append(row)
+        except Exception as e:
+            name = f" '{row_data.get(table.label_field)}'" if table.label_field else ""
+            stats["errors"].append(f"{table.label}{name}: {str(e)}")
+
+    _bulk_insert(db, table.model, new_rows, stats, f"{table.key}_imported", f"{table.label}s")
+    db.commit()
+
+
+def _stream_export(db: Session, pretty: bool) -> Iterator[bytes]:
+    """Stream the export document and release the session once it is written.
+
+    Streaming outlives the request's ``get_db`` dependency, so the session is
+    used (and its connection returned) from here.
+    """
+    try:
+        yield from _export_json_chunks(db, pretty=pretty)
+    except Exception:
+        # Headers are already sent; the client sees a truncated document
+        logger.error("Export stream failed", exc_info=True)
+        raise
+    finally:
+        db.close()
+
+
+class _ZipChunkWriter:
+    """Write-only file object that holds what ``zipfile`` writes until it is drained.
+
+    It has no ``tell``/``seek``, so ``zipfile`` writes a streamable archive
+    (sizes go in a data descriptor after each entry).
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _stream_export_zip(db: Session, pretty: bool, timestamp: str) -> Iterator[bytes]:
+    """Stream a ZIP with the export document and the stored upload files.
+
+    The archive is written as it is sent: only the pending compressed output
+    and one read block are held in memory. Like :func:`_stream_export`, this
+    closes the session when done.
+    """
+    writer = _ZipChunkWriter()
+    # Filled while the JSON entry is written, so the files can follow it
+    file_paths: set[str] = set()
+    try:
+        upload_dir = Path(get_upload_config().upload_dir).resolve()
+        with zipfile.ZipFile(writer, "w", compression=zipfile.ZIP_DEFLATED) as zip_file:
+            # Store JSON inside the archive. Its size is unknown up front, so
+            # allow it to grow past the 2 GiB ZIP32 limit.
+            with zip_file.open(f"meeting_assistant_backup_{timestamp}.json", "w", force_zip64=True) as entry:
+                for chunk in _export_json_chunks(db, pretty=pretty, file_paths=file_paths):
+                    entry.write(chunk)
+                    if data := writer.drain():
+                        yield data
+
+            for rel_path in sorted(file_paths):
+                normalized = rel_path.lstrip("/\\")
+                source_path = Path(rel_path) if os.path.isabs(rel_path) else upload_dir / normalized
+
+                if source_path.exists() and source_path.is_file():
+                    archive_name = str(Path("uploads") / normalized).replace("\\", "/")
+                    info = zipfile.ZipInfo.from_file(source_path, archive_name)
+                    info.compress_type = (
+                        zipfile.ZIP_STORED
+                        if source_path.suffix.lower() in _EXPORT_STORED_SUFFIXES
+                        else zip_file.compression
+                    )
+                    with open(source_path, "rb", buffering=0) as source, zip_file.open(info, "w") as entry:
+                        while block := source.read(_FILE_BLOCK_SIZE):
+                            entry.write(block)
+                            if data := writer.drain():
+                                yield data
+        # Closing the archive writes the central directory
+        yield writer.drain()
+    except Exception:
+        logger.error("Export stream failed", exc_info=True)
+        raise
+    finally:
+        db.close()
 
 
 @router.get("/export")
-async def export_data(include_audio: bool = False, db: Session = Depends(get_db)):
+async def export_data(include_audio: bool = False, pretty: bool = False, db: Session = Depends(get_db)):
     """
     Export all application data as JSON.
 
@@ -87,215 +501,26 @@ async def export_data(include_audio: bool = False, db: Session = Depends(get_db)
     - User mappings
     - Settings and configurations
     - Meeting relationships
-    """
-    try:
-        # Export meetings
-        meetings = db.query(Meeting).all()
-        meetings_data = []
-        for meeting in meetings:
-            meeting_dict = serialize_model(meeting)
-
-            # Include transcription
-            from ...models import Transcription
-
-            transcription = db.query(Transcription).filter(Transcription.meeting_id == meeting.id).first()
-            if transcription:
-                meeting_dict["transcription"] = serialize_model(transcription)
-            else:
-                meeting_dict["transcription"] = None
-
-            # Include speakers
-            speakers = db.query(Speaker).filter(Speaker.meeting_id == meeting.id).all()
-            meeting_dict["speakers"] = [serialize_model(s) for s in speakers]
-
-            # Include action items (through transcription relationship)
-            if transcription:
-                action_items = db.query(ActionItem).filter(ActionItem.transcription_id == transcription.id).all()
-                meeting_dict["action_items"] = [serialize_model(a) for a in action_items]
-            else:
-                meeting_dict["action_items"] = []
-
-            meetings_data.append(meeting_dict)
-
-        # Export user mappings
-        user_mappings = db.query(UserMapping).all()
-        user_mappings_data = [serialize_model(um) for um in user_mappings]
-
-        # Export meeting links (relationships)
-        links = db.query(MeetingLink).all()
-        links_data = [serialize_model(link) for link in links]
-
-        # Export Drive sync config (without credentials)
-        drive_config = db.query(GoogleDriveSyncConfig).first()
-        drive_config_data = serialize_model(drive_config) if drive_config else None
-
-        # Export processed files tracking
-        processed_files = db.query(GoogleDriveProcessedFile).all()
-        processed_files_data = [serialize_model(pf) for pf in processed_files]
-
-        # Export global chat sessions (metadata only, no conversation history)
-        chat_sessions = db.query(GlobalChatSession).all()
-        chat_sessions_data = [serialize_model(cs) for cs in chat_sessions]
-
-        # Export settings - API Keys (without sensitive data)
-        from ...models import APIKey, EmbeddingConfiguration, ModelConfiguration, WorkerConfiguration
 
-        api_keys = db.query(APIKey).all()
-        api_keys_data = [serialize_model(ak) for ak in api_keys]
-
-        # Export model configurations
-        model_configs = db.query(ModelConfiguration).all()
-        model_configs_data = [serialize_model(mc) for mc in model_configs]
-
-        # Export embedding configurations
-        embedding_configs = db.query(EmbeddingConfiguration).all()
-        embedding_configs_data = [serialize_model(ec) for ec in embedding_configs]
-
-        # Export worker configuration
-        worker_config = db.query(WorkerConfiguration).first()
-        worker_config_data = serialize_model(worker_config) if worker_config else None
-
-        # Export diary entries
-        diary_entries = db.query(DiaryEntry).all()
-        diary_entries_data = [serialize_model(de) for de in diary_entries]
-
-        # Export projects data
-        projects = db.query(Project).all()
-        projects_data = [serialize_model(project) for project in projects]
-
-        project_meetings = db.query(ProjectMeeting).all()
-        project_meetings_data = [serialize_model(meeting) for meeting in project_meetings]
-
-        project_milestones = db.query(ProjectMilestone).all()
-        project_milestones_data = [serialize_model(milestone) for milestone in project_milestones]
-
-        project_members = db.query(ProjectMember).all()
-        project_members_data = [serialize_model(member) for member in project_members]
-
-        project_chat_sessions = db.query(ProjectChatSession).all()
-        project_chat_sessions_data = [serialize_model(session) for session in project_chat_sessions]
-
-        project_chat_messages = db.query(ProjectChatMessage).all()
-        project_chat_messages_data = [serialize_model(message) for message in project_chat_messages]
-
-        project_notes = db.query(ProjectNote).all()
-        project_notes_data = [serialize_model(note) for note in project_notes]
-
-        project_note_attachments = db.query(ProjectNoteAttachment).all()
-        project_note_attachments_data = [serialize_model(attachment) for attachment in project_note_attachments]
-
-        # Export standalone action items (those not attached to any meeting/transcription)
-        standalone_action_items = db.query(ActionItem).filter(ActionItem.transcription_id.is_(None)).all()
-        standalone_action_items_data = [serialize_model(ai) for ai in standalone_action_items]
-
-        # Compile export data
-        export_data = {
-            "export_metadata": {
-                "version": "1.1",
-                "exported_at": datetime.utcnow().isoformat(),
-                "counts": {
-                    "meetings": len(meetings_data),
-                    "user_mappings": len(user_mappings_data),
-                    "links": len(links_data),
-                    "processed_files": len(processed_files_data),
-                    "chat_sessions": len(chat_sessions_data),
-                    "api_keys": len(api_keys_data),
-                    "model_configs": len(model_configs_data),
-                    "embedding_configs": len(embedding_configs_data),
-                    "diary_entries": len(diary_entries_data),
-                    "standalone_action_items": len(standalone_action_items_data),
-                    "projects": len(projects_data),
-                    "project_meetings": len(project_meetings_data),
-                    "project_milestones": len(project_milestones_data),
-                    "project_members": len(project_members_data),
-                    "project_chat_sessions": len(project_chat_sessions_data),
-                    "project_chat_messages": len(project_chat_messages_data),
-                    "project_notes": len(project_notes_data),
-                    "project_note_attachments": len(project_note_attachments_data),
-                },
-            },
-            "meetings": meetings_data,
-            "user_mappings": user_mappings_data,
-            "meeting_links": links_data,
-            "drive_sync_config": drive_config_data,
-            "drive_processed_files": processed_files_data,
-            "global_chat_sessions": chat_sessions_data,
-            "api_keys": api_keys_data,
-            "model_configurations": model_configs_data,
-            "embedding_configurations": embedding_configs_data,
-            "worker_configuration": worker_config_data,
-            "diary_entries": diary_entries_data,
-            "standalone_action_items": standalone_action_items_data,
-            "projects": projects_data,
-            "project_meetings": project_meetings_data,
-            "project_milestones": project_milestones_data,
-            "project_members": project_members_data,
-            "project_chat_sessions": project_chat_sessions_data,
-            "project_chat_messages": project_chat_messages_data,
-            "project_notes": project_notes_data,
-            "project_note_attachments": project_note_attachments_data,
-        }
-
-        # Create JSON file
-        json_str = json.dumps(export_data, indent=2, ensure_ascii=False)
-        json_bytes = json_str.encode("utf-8")
-
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-
-        if include_audio:
-            upload_config = get_upload_config()
-            upload_dir = Path(upload_config.upload_dir).resolve()
-
-            zip_buffer = io.BytesIO()
-            with zipfile.ZipFile(zip_buffer, "w", compression=zipfile.ZIP_DEFLATED) as zip_file:
-                # Store JSON inside the archive
-                zip_file.writestr(f"meeting_assistant_backup_{timestamp}.json", json_bytes)
-
-                # Collect audio file paths from meetings and project note attachments
-                audio_paths: set[str] = set()
-                for meeting in meetings_data:
-                    for path_key in ["filepath", "audio_filepath"]:
-                        path_value = meeting.get(path_key)
-                        if not path_value:
-                            continue
-                        audio_paths.add(path_value)
-
-                for attachment in project_note_attachments_data:
-                    path_value = attachment.get("filepath")
-                    if path_value:
-                        audio_paths.add(path_value)
-
-                for rel_path in sorted(audio_paths):
-                    normalized = rel_path.lstrip("/\\")
-                    source_path = Path(rel_path) if os.path.isabs(rel_path) else upload_dir / normalized
-
-                    if source_path.exists() and source_path.is_file():
-                        archive_name = str(Path("uploads") / normalized).replace("\\", "/")
-                        zip_file.write(source_path, archive_name)
-
-            zip_bytes = zip_buffer.getvalue()
-            filename = f"meeting_assistant_backup_{timestamp}.zip"
-            return StreamingResponse(
-                io.BytesIO(zip_bytes),
-                media_type="application/zip",
-                headers={
-                    "Content-Disposition": f"attachment; filename={filename}",
-                    "Content-Length": str(len(zip_bytes)),
-                },
-            )
+    The JSON (or, with ``include_audio``, the ZIP archive) is streamed as it
+    is generated. ``pretty`` indents each object.
+    """
+    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
 
-        # Return as downloadable JSON file
+    if not include_audio:
         filename = f"meeting_assistant_backup_{timestamp}.json"
-
         return StreamingResponse(
-            io.BytesIO(json_bytes),
+            _stream_export(db, pretty),
             media_type="application/json",
-            headers={"Content-Disposition": f"attachment; filename={filename}", "Content-Length": str(len(json_bytes))},
+            headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
 
-    except Exception as e:
-        logger.error(f"Export error: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
+    filename = f"meeting_assistant_backup_{timestamp}.zip"
+    return StreamingResponse(
+        _stream_export_zip(db, pretty, timestamp),
+        media_type="application/zip",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
 
 
 @router.post("/import")
@@ -312,14 +537,19 @@ async def import_data(file: UploadFile = File(...), merge_mode: bool = False, db
     """
     try:
         # Read and parse JSON (supports ZIP archives with audio files)
-        content = await file.read()
+        # Read from the spooled upload (spilled to disk when large) rather than
+        # copying the whole payload into memory
+        upload = file.file
+        upload.seek(0)
+        is_zip = zipfile.is_zipfile(upload)
+        upload.seek(0)
         data = None
 
-        if zipfile.is_zipfile(io.BytesIO(content)):
+        if is_zip:
             upload_config = get_upload_config()
             upload_dir = Path(upload_config.upload_dir).resolve()
 
-            with zipfile.ZipFile(io.BytesIO(content)) as zip_file:
+            with zipfile.ZipFile(upload) as zip_file:
                 json_name = next(
                     (name for name in zip_file.namelist() if name.endswith(".json")),
                     None,
@@ -337,14 +567,15 @@ async def import_data(file: UploadFile = File(...), merge_mode: bool = False, db
 
                     relative_path = Path(member.filename).relative_to("uploads")
                     target_path = (upload_dir / relative_path).resolve()
-                    if not str(target_path).startswith(str(upload_dir)):
+                    # A path check, not a string prefix: "/uploads_evil" is not under "/uploads"
+                    if not target_path.is_relative_to(upload_dir):
                         continue
 
                     target_path.parent.mkdir(parents=True, exist_ok=True)
                     with zip_file.open(member, "r") as source, open(target_path, "wb") as dest:
-                        dest.write(source.read())
+                        shutil.copyfileobj(source, dest, _FILE_BLOCK_SIZE)
         else:
-            data = json.loads(content)
+            data = json.loads(upload.read())
 
         stats = {
             "meetings_imported": 0,
@@ -358,6 +589,7 @@ async def import_data(file: UploadFile = File(...), merge_mode: bool = False, db
             "embedding_configs_imported": 0,
             "worker_config_imported": 0,
             "diary_entries_imported": 0,
+            "standalone_action_items_imported": 0,
             "projects_imported": 0,
             "project_meetings_imported": 0,
             "project_milestones_imported": 0,
@@ -377,30 +609,26 @@ async def import_data(file: UploadFile = File(...), merge_mode: bool = False, db
         from ...models import APIKey, EmbeddingConfiguration, ModelConfiguration, WorkerConfiguration
 
         api_key_id_map = {}  # old_id -> new_id
+        # Existing rows by their dedup key, loaded once per table
+        existing_api_keys = dict(db.execute(select(APIKey.name, APIKey.id)).all())
 
         for ak_data in data.get("api_keys", []):
             try:
-                # Convert datetime fields
-                for field in ["created_at", "updated_at"]:
-                    if field in ak_data and ak_data[field]:
-                        try:
-                            ak_data[field] = datetime.fromisoformat(ak_data[field])
-                        except:
-                            ak_data[field] = None
+                _parse_temporal_fields(APIKey, ak_data)
 
                 old_id = ak_data.get("id")
 
                 # Check if already exists by name
-                existing = db.query(APIKey).filter(APIKey.name == ak_data.get("name")).first()
+                existing_id = existing_api_keys.get(ak_data.get("name"))
 
-                if existing:
-                    api_key_id_map[old_id] = existing.id
+                if existing_id:
+                    api_key_id_map[old_id] = existing_id
                 else:
                     ak_dict = {k: v for k, v in ak_data.items() if k != "id"}
                     api_key = APIKey(**ak_dict)
                     db.add(api_key)
                     db.flush()
-                    api_key_id_map[old_id] = api_key.id
+                    api_key_id_map[old_id] = existing_api_keys[api_key.name] = api_key.id
                     stats["api_keys_imported"] += 1
             except Exception as e:
                 stats["errors"].append(f"API Key '{ak_data.get('name')}': {str(e)}")
@@ -409,16 +637,15 @@ async def import_data(file: UploadFile = File(...), merge_mode: bool = False, db
 
         # Import model configurations
         model_config_id_map = {}  # old_id -> new_id
+        existing_model_configs = dict(db.execute(select(ModelConfiguration.name, ModelConfiguration.id)).all())
+        # Only one configuration may be the default; an imported default never replaces the current one
+        has_default = (
+            db.scalar(select(ModelConfiguration.id).where(ModelConfiguration.is_default == True).limit(1)) is not None
+        )
 
         for mc_data in data.get("model_configurations", []):
             try:
-                # Convert datetime fields
-                for field in ["created_at", "updated_at"]:
-                    if field in mc_data and mc_data[field]:
-                        try:
-                            mc_data[field] = datetime.fromisoformat(mc_data[field])
-                        except:
-                            mc_data[field] = None
+                _parse_temporal_fields(ModelConfiguration, mc_data)
 
                 old_id = mc_data.get("id")
 
@@ -429,16 +656,21 @@ async def import_data(file: UploadFile = File(...), merge_mode: bool = False, db
                     mc_data["analysis_api_key_id"] = api_key_id_map.get(mc_data["analysis_api_key_id"])
 
                 # Check if already exists by name
-                existing = db.query(ModelConfiguration).filter(ModelConfiguration.name == mc_data.get("name")).first()
+                existing_id = existing_model_configs.get(mc_data.get("name"))
 
-                if existing and not merge_mode:
-                    model_config_id_map[old_id] = existing.id
+                if existing_id and not merge_mode:
+                    model_config_id_map[old_id] = existing_id
                 else:
                     mc_dict = {k: v for k, v in mc_data.items() if k != "id"}
+                    if has_default:
+                        mc_dict["is_default"] = False
                     model_config = ModelConfiguration(**mc_dict)
-                    db.add(model_config)
-                    db.flush()
-                    model_config_id_map[old_id] = model_config.id
+                    # A failing row is rolled back on its own (see the meetings import)
+                    with db.begin_nested():
+                        db.add(model_config)
+                        db.flush()
+                    has_default = has_default or model_config.is_default
+                    model_config_id_map[old_id] = existing_model_configs[model_config.name] = model_config.id
                     stats["model_configs_imported"] += 1
             except Exception as e:
                 stats["errors"].append(f"Model Config '{mc_data.get('name')}': {str(e)}")
@@ -447,23 +679,20 @@ async def import_data(file: UploadFile = File(...), merge_mode: bool = False, db
 
         # Import embedding configurations
         embedding_config_id_map = {}  # old_id -> new_id
+        existing_embedding_configs = {
+            (provider, model_name): config_id
+            for provider, model_name, config_id in db.execute(
+                select(EmbeddingConfiguration.provider, EmbeddingConfiguration.model_name, EmbeddingConfiguration.id)
+            )
+        }
 
         for ec_data in data.get("embedding_configurations", []):
             try:
-                # Convert datetime fields
-                for field in ["created_at", "updated_at"]:
-                    if field in ec_data and ec_data[field]:
-                        try:
-                            ec_data[field] = datetime.fromisoformat(ec_data[field])
-                        except:
-                            ec_data[field] = None
+                _parse_temporal_fields(EmbeddingConfiguration, ec_data)
 
                 # Parse JSON string fields back to dict if needed
-                if "settings" in ec_data and isinstance(ec_data["settings"], str):
-                    try:
-                        ec_data["settings"] = json.loads(ec_data["settings"])
-                    except:
-                        ec_data["settings"] = None
+                if isinstance(ec_data.get("settings"), str):
+                    ec_data["settings"] = _parse_json_field(ec_data["settings"], None)
 
                 old_id = ec_data.get("id")
 
@@ -472,23 +701,17 @@ async def import_data(file: UploadFile = File(...), merge_mode: bool = False, db
                     ec_data["api_key_id"] = api_key_id_map.get(ec_data["api_key_id"])
 
                 # Check if already exists by provider+model_name
-                existing = (
-                    db.query(EmbeddingConfiguration)
-                    .filter(
-                        EmbeddingConfiguration.provider == ec_data.get("provider"),
-                        EmbeddingConfiguration.model_name == ec_data.get("model_name"),
-                    )
-                    .first()
-                )
+                embedding_key = (ec_data.get("provider"), ec_data.get("model_name"))
+                existing_id = existing_embedding_configs.get(embedding_key)
 
-                if existing and not merge_mode:
-                    embedding_config_id_map[old_id] = existing.id
+                if existing_id and not merge_mode:
+                    embedding_config_id_map[old_id] = existing_id
                 else:
                     ec_dict = {k: v for k, v in ec_data.items() if k != "id"}
                     embedding_config = EmbeddingConfiguration(**ec_dict)
                     db.add(embedding_config)
                     db.flush()
-                    embedding_config_id_map[old_id] = embedding_config.id
+                    embedding_config_id_map[old_id] = existing_embedding_configs[embedding_key] = embedding_config.id
                     stats["embedding_configs_imported"] += 1
             except Exception as e:
                 stats["errors"].append(
@@ -501,13 +724,7 @@ async def import_data(file: UploadFile = File(...), merge_mode: bool = False, db
         worker_data = data.get("worker_configuration")
         if worker_data:
             try:
-                # Convert datetime fields
-                for field in ["created_at", "updated_at"]:
-                    if field in worker_data and worker_data[field]:
-                        try:
-                            worker_data[field] = datetime.fromisoformat(worker_data[field])
-                        except:
-                            worker_data[field] = None
+                _parse_temporal_fields(WorkerConfiguration, worker_data)
 
                 # Check if worker config exists
                 existing = db.query(WorkerConfiguration).first()
@@ -531,28 +748,23 @@ async def import_data(file: UploadFile = File(...), merge_mode: bool = False, db
 
         # Import user mappings (they may be referenced by other data)
         user_mapping_id_map = {}
+        existing_user_mappings = dict(db.execute(select(UserMapping.name, UserMapping.id)).all())
         for um_data in data.get("user_mappings", []):
             try:
-                # Convert datetime fields
-                for field in ["created_at", "updated_at"]:
-                    if field in um_data and um_data[field]:
-                        try:
-                            um_data[field] = datetime.fromisoformat(um_data[field])
-                        except:
-                            um_data[field] = None
+                _parse_temporal_fields(UserMapping, um_data)
 
                 # Check if already exists by name
-                existing = db.query(UserMapping).filter(UserMapping.name == um_data.get("name")).first()
+                existing_id = existing_user_mappings.get(um_data.get("name"))
 
                 old_id = um_data.get("id")
 
-                if existing:
-                    user_mapping_id_map[old_id] = existing.id
+                if existing_id:
+                    user_mapping_id_map[old_id] = existing_id
                 else:
                     user_mapping = UserMapping(**{k: v for k, v in um_data.items() if k != "id"})
                     db.add(user_mapping)
                     db.flush()
-                    user_mapping_id_map[old_id] = user_mapping.id
+                    user_mapping_id_map[old_id] = existing_user_mappings[user_mapping.name] = user_mapping.id
                     stats["user_mappings_imported"] += 1
             except Exception as e:
                 stats["errors"].append(f"User mapping '{um_data.get('name')}': {str(e)}")
@@ -561,194 +773,73 @@ async def import_data(file: UploadFile = File(...), merge_mode: bool = False, db
 
         # Import projects
         project_id_map = {}
+        existing_projects = dict(db.execute(select(Project.name, Project.id)).all())
         for project_data in data.get("projects", []):
             try:
-                for field in [
-                    "start_date",
-                    "target_end_date",
-                    "actual_end_date",
-                    "created_at",
-                    "updated_at",
-                ]:
-                    if field in project_data and project_data[field]:
-                        try:
-                            project_data[field] = datetime.fromisoformat(project_data[field])
-                        except:
-                            project_data[field] = None
-
-                if "settings" in project_data and isinstance(project_data["settings"], str):
-                    try:
-                        project_data["settings"] = json.loads(project_data["settings"])
-                    except:
-                        project_data["settings"] = {}
+                _parse_temporal_fields(Project, project_data)
+
+                if isinstance(project_data.get("settings"), str):
+                    project_data["settings"] = _parse_json_field(project_data["settings"], {})
 
                 old_id = project_data.get("id")
 
-                existing = db.query(Project).filter(Project.name == project_data.get("name")).first()
+                existing_id = existing_projects.get(project_data.get("name"))
 
-                if existing and not merge_mode:
-                    project_id_map[old_id] = existing.id
+                if existing_id and not merge_mode:
+                    project_id_map[old_id] = existing_id
                 else:
                     project_dict = {k: v for k, v in project_data.items() if k != "id"}
                     project = Project(**project_dict)
                     db.add(project)
                     db.flush()
-                    project_id_map[old_id] = project.id
+                    project_id_map[old_id] = existing_projects[project.name] = project.id
                     stats["projects_imported"] += 1
             except Exception as e:
                 stats["errors"].append(f"Project '{project_data.get('name')}': {str(e)}")
 
         db.commit()
 
-        # Import project meetings
-        for meeting_data in data.get("project_meetings", []):
-            try:
-                if "created_at" in meeting_data and meeting_data["created_at"]:
-                    try:
-                        meeting_data["created_at"] = datetime.fromisoformat(meeting_data["created_at"])
-                    except:
-                        meeting_data["created_at"] = None
-
-                old_project_id = meeting_data.get("project_id")
-                project_id = project_id_map.get(old_project_id)
-                if not project_id:
-                    continue
-
-                existing = (
-                    db.query(ProjectMeeting)
-                    .filter(
-                        ProjectMeeting.project_id == project_id,
-                        ProjectMeeting.meeting_id == meeting_data.get("meeting_id"),
-                    )
-                    .first()
-                )
-
-                if existing and not merge_mode:
-                    continue
-
-                meeting_dict = {k: v for k, v in meeting_data.items() if k != "id"}
-                meeting_dict["project_id"] = project_id
-                meeting = ProjectMeeting(**meeting_dict)
-                db.add(meeting)
-                stats["project_meetings_imported"] += 1
-            except Exception as e:
-                stats["errors"].append(f"Project meeting '{meeting_data.get('meeting_id')}': {str(e)}")
-
-        db.commit()
-
-        # Import project milestones
-        for milestone_data in data.get("project_milestones", []):
-            try:
-                for field in ["due_date", "completed_at", "created_at", "updated_at"]:
-                    if field in milestone_data and milestone_data[field]:
-                        try:
-                            milestone_data[field] = datetime.fromisoformat(milestone_data[field])
-                        except:
-                            milestone_data[field] = None
-
-                old_project_id = milestone_data.get("project_id")
-                project_id = project_id_map.get(old_project_id)
-                if not project_id:
-                    continue
-
-                existing = (
-                    db.query(ProjectMilestone)
-                    .filter(
-                        ProjectMilestone.project_id == project_id,
-                        ProjectMilestone.name == milestone_data.get("name"),
-                    )
-                    .first()
-                )
-
-                if existing and not merge_mode:
-                    continue
-
-                milestone_dict = {k: v for k, v in milestone_data.items() if k != "id"}
-                milestone_dict["project_id"] = project_id
-                milestone = ProjectMilestone(**milestone_dict)
-                db.add(milestone)
-                stats["project_milestones_imported"] += 1
-            except Exception as e:
-                stats["errors"].append(f"Project milestone '{milestone_data.get('name')}': {str(e)}")
-
-        db.commit()
-
-        # Import project members
-        for member_data in data.get("project_members", []):
-            try:
-                if "added_at" in member_data and member_data["added_at"]:
-                    try:
-                        member_data["added_at"] = datetime.fromisoformat(member_data["added_at"])
-                    except:
-                        member_data["added_at"] = None
-
-                old_project_id = member_data.get("project_id")
-                project_id = project_id_map.get(old_project_id)
-                if not project_id:
-                    continue
-
-                if member_data.get("user_mapping_id"):
-                    member_data["user_mapping_id"] = user_mapping_id_map.get(member_data["user_mapping_id"])
-
-                existing = (
-                    db.query(ProjectMember)
-                    .filter(
-                        ProjectMember.project_id == project_id,
-                        ProjectMember.name == member_data.get("name"),
-                    )
-                    .first()
-                )
-
-                if existing and not merge_mode:
-                    continue
-
-                member_dict = {k: v for k, v in member_data.items() if k != "id"}
-                member_dict["project_id"] = project_id
-                member = ProjectMember(**member_dict)
-                db.add(member)
-                stats["project_members_imported"] += 1
-            except Exception as e:
-                stats["errors"].append(f"Project member '{member_data.get('name')}': {str(e)}")
-
-        db.commit()
+        # Import project meetings, milestones and members
+        id_maps = {"projects": project_id_map, "user_mappings": user_mapping_id_map}
+        for key in ("project_meetings", "project_milestones", "project_members"):
+            _import_table(db, _TABLE_SPECS[key], data.get(key, []), id_maps, stats, merge_mode)
 
         # Import project chat sessions
         project_chat_session_id_map = {}
+        existing_project_chat_sessions = {
+            (project_id, title, created_at): session_id
+            for project_id, title, created_at, session_id in db.execute(
+                select(
+                    ProjectChatSession.project_id,
+                    ProjectChatSession.title,
+                    ProjectChatSession.created_at,
+                    ProjectChatSession.id,
+                )
+            )
+        }
         for session_data in data.get("project_chat_sessions", []):
             try:
-                for field in ["created_at", "updated_at"]:
-                    if field in session_data and session_data[field]:
-                        try:
-                            session_data[field] = datetime.fromisoformat(session_data[field])
-                        except:
-                            session_data[field] = None
+                _parse_temporal_fields(ProjectChatSession, session_data)
 
                 old_project_id = session_data.get("project_id")
                 project_id = project_id_map.get(old_project_id)
                 if not project_id:
                     continue
 
-                existing = (
-                    db.query(ProjectChatSession)
-                    .filter(
-                        ProjectChatSession.project_id == project_id,
-                        ProjectChatSession.title == session_data.get("title"),
-                        ProjectChatSession.created_at == session_data.get("created_at"),
-                    )
-                    .first()
-                )
+                session_key = (project_id, session_data.get("title"), session_data.get("created_at"))
+                existing_id = existing_project_chat_sessions.get(session_key)
 
                 old_id = session_data.get("id")
 
-                if existing and not merge_mode:
-                    project_chat_session_id_map[old_id] = existing.id
+                if existing_id and not merge_mode:
+                    project_chat_session_id_map[old_id] = existing_id
                 else:
                     session_dict = {k: v for k, v in session_data.items() if k != "id"}
                     session_dict["project_id"] = project_id
                     session = ProjectChatSession(**session_dict)
                     db.add(session)
                     db.flush()
-                    project_chat_session_id_map[old_id] = session.id
+                    project_chat_session_id_map[old_id] = existing_project_chat_sessions[session_key] = session.id
                     stats["project_chat_sessions_imported"] += 1
             except Exception as e:
                 stats["errors"].append(f"Project chat session '{session_data.get('title')}': {str(e)}")
@@ -756,66 +847,41 @@ async def import_data(file: UploadFile = File(...), merge_mode: bool = False, db
         db.commit()
 
         # Import project chat messages
-        for message_data in data.get("project_chat_messages", []):
-            try:
-                if "created_at" in message_data and message_data["created_at"]:
-                    try:
-                        message_data["created_at"] = datetime.fromisoformat(message_data["created_at"])
-                    except:
-                        message_data["created_at"] = None
-
-                old_session_id = message_data.get("session_id")
-                session_id = project_chat_session_id_map.get(old_session_id)
-                if not session_id:
-                    continue
-
-                message_dict = {k: v for k, v in message_data.items() if k != "id"}
-                message_dict["session_id"] = session_id
-                message = ProjectChatMessage(**message_dict)
-                db.add(message)
-                stats["project_chat_messages_imported"] += 1
-            except Exception as e:
-                stats["errors"].append("Project chat message: " + str(e))
-
-        db.commit()
+        id_maps["project_chat_sessions"] = project_chat_session_id_map
+        table = _TABLE_SPECS["project_chat_messages"]
+        _import_table(db, table, data.get(table.key, []), id_maps, stats, merge_mode)
 
         # Import project notes
         project_note_id_map = {}
+        existing_notes = {
+            (project_id, title, created_at): note_id
+            for project_id, title, created_at, note_id in db.execute(
+                select(ProjectNote.project_id, ProjectNote.title, ProjectNote.created_at, ProjectNote.id)
+            )
+        }
         for note_data in data.get("project_notes", []):
             try:
-                for field in ["created_at", "updated_at"]:
-                    if field in note_data and note_data[field]:
-                        try:
-                            note_data[field] = datetime.fromisoformat(note_data[field])
-                        except:
-                            note_data[field] = None
+                _parse_temporal_fields(ProjectNote, note_data)
 
                 old_project_id = note_data.get("project_id")
                 project_id = project_id_map.get(old_project_id)
                 if not project_id:
                     continue
 
-                existing = (
-                    db.query(ProjectNote)
-                    .filter(
-                        ProjectNote.project_id == project_id,
-                        ProjectNote.title == note_data.get("title"),
-                        ProjectNote.created_at == note_data.get("created_at"),
-                    )
-                    .first()
-                )
+                note_key = (project_id, note_data.get("title"), note_data.get("created_at"))
+                existing_id = existing_notes.get(note_key)
 
                 old_id = note_data.get("id")
 
-                if existing and not merge_mode:
-                    project_note_id_map[old_id] = existing.id
+                if existing_id and not merge_mode:
+                    project_note_id_map[old_id] = existing_id
                 else:
                     note_dict = {k: v for k, v in note_data.items() if k != "id"}
                     note_dict["project_id"] = project_id
                     note = ProjectNote(**note_dict)
                     db.add(note)
                     db.flush()
-                    project_note_id_map[old_id] = note.id
+                    project_note_id_map[old_id] = existing_notes[note_key] = note.id
                     stats["project_notes_imported"] += 1
             except Exception as e:
                 stats["errors"].append(f"Project note '{note_data.get('title')}': {str(e)}")
@@ -823,63 +889,30 @@ async def import_data(file: UploadFile = File(...), merge_mode: bool = False, db
         db.commit()
 
         # Import project note attachments
-        for attachment_data in data.get("project_note_attachments", []):
-            try:
-                if "uploaded_at" in attachment_data and attachment_data["uploaded_at"]:
-                    try:
-                        attachment_data["uploaded_at"] = datetime.fromisoformat(attachment_data["uploaded_at"])
-                    except:
-                        attachment_data["uploaded_at"] = None
-
-                old_project_id = attachment_data.get("project_id")
-                project_id = project_id_map.get(old_project_id)
-                if not project_id:
-                    continue
-
-                old_note_id = attachment_data.get("note_id")
-                note_id = project_note_id_map.get(old_note_id)
-                if not note_id:
-                    continue
-
-                existing = (
-                    db.query(ProjectNoteAttachment)
-                    .filter(
-                        ProjectNoteAttachment.project_id == project_id,
-                        ProjectNoteAttachment.note_id == note_id,
-                        ProjectNoteAttachment.filename == attachment_data.get("filename"),
-                    )
-                    .first()
-                )
-
-                if existing and not merge_mode:
-                    continue
-
-                attachment_dict = {k: v for k, v in attachment_data.items() if k != "id"}
-                attachment_dict["project_id"] = project_id
-                attachment_dict["note_id"] = note_id
-                attachment = ProjectNoteAttachment(**attachment_dict)
-                db.add(attachment)
-                stats["project_note_attachments_imported"] += 1
-            except Exception as e:
-                stats["errors"].append(f"Project note attachment '{attachment_data.get('filename')}': {str(e)}")
-
-        db.commit()
+        id_maps["project_notes"] = project_note_id_map
+        table = _TABLE_SPECS["project_note_attachments"]
+        _import_table(db, table, data.get(table.key, []), id_maps, stats, merge_mode)
 
         # Import meetings
         meeting_id_map = {}  # old_id -> new_id mapping for relationships
+        existing_meetings = dict(db.execute(select(Meeting.filename, Meeting.id)).all())
+        model_config_ids = set(db.scalars(select(ModelConfiguration.id)))
+        embedding_config_ids = set(db.scalars(select(EmbeddingConfiguration.id)))
 
-        for meeting_data in data.get("meetings", []):
+        for index, meeting_data in enumerate(data.get("meetings", []), 1):
+            if index % _IMPORT_BATCH_SIZE == 0:
+                db.commit()
             try:
                 old_id = meeting_data["id"]
 
                 # Check if meeting already exists (by filename or date+title)
-                existing = None
+                existing_id = None
                 if "filename" in meeting_data:
-                    existing = db.query(Meeting).filter(Meeting.filename == meeting_data["filename"]).first()
+                    existing_id = existing_meetings.get(meeting_data["filename"])
 
-                if existing and not merge_mode:
+                if existing_id and not merge_mode:
                     stats["meetings_skipped"] += 1
-                    meeting_id_map[old_id] = existing.id
+                    meeting_id_map[old_id] = existing_id
                     continue
 
                 # Extract nested data
@@ -887,20 +920,7 @@ async def import_data(file: UploadFile = File(...), merge_mode: bool = False, db
                 speakers_data = meeting_data.pop("speakers", [])
                 action_items_data = meeting_data.pop("action_items", [])
 
-                # Convert datetime strings back to datetime objects
-                for field in [
-                    "meeting_date",
-                    "upload_date",
-                    "created_at",
-                    "processing_start_time",
-                    "stage_start_time",
-                    "embeddings_updated_at",
-                ]:
-                    if field in meeting_data and meeting_data[field]:
-                        try:
-                            meeting_data[field] = datetime.fromisoformat(meeting_data[field])
-                        except:
-                            meeting_data[field] = None
+                _parse_temporal_fields(Meeting, meeting_data)
 
                 # Handle foreign key references - map to new IDs or set to NULL
                 if "model_configuration_id" in meeting_data and meeting_data["model_configuration_id"]:
@@ -911,12 +931,7 @@ async def import_data(file: UploadFile = File(...), merge_mode: bool = False, db
                         meeting_data["model_configuration_id"] = new_config_id
                     else:
                         # Check if it exists in database
-                        model_exists = (
-                            db.query(ModelConfiguration)
-                            .filter(ModelConfiguration.id == meeting_data["model_configuration_id"])
-                            .first()
-                        )
-                        if not model_exists:
+                        if old_config_id not in model_config_ids:
                             meeting_data["model_configuration_id"] = None
 
                 if "embedding_config_id" in meeting_data and meeting_data["embedding_config_id"]:
@@ -927,67 +942,51 @@ async def import_data(file: UploadFile = File(...), merge_mode: bool = False, db
                         meeting_data["embedding_config_id"] = new_embed_id
                     else:
                         # Check if it exists in database
-                        embed_exists = (
-                            db.query(EmbeddingConfiguration)
-                            .filter(EmbeddingConfiguration.id == meeting_data["embedding_config_id"])
-                            .first()
-                        )
-                        if not embed_exists:
+                        if old_embed_id not in embedding_config_ids:
                             meeting_data["embedding_config_id"] = None
 
-                # Create meeting (without old ID)
-                meeting_dict = {k: v for k, v in meeting_data.items() if k not in ["id", "transcription"]}
-                meeting = Meeting(**meeting_dict)
-                db.add(meeting)
-                db.flush()  # Get new ID
-
-                meeting_id_map[old_id] = meeting.id
-
-                # Import transcription
-                from ...models import Transcription
-
-                transcription = None
-                if transcription_data:
-                    trans_dict = {k: v for k, v in transcription_data.items() if k not in ["id", "meeting_id"]}
-                    transcription = Transcription(meeting_id=meeting.id, **trans_dict)
-                    db.add(transcription)
-                    db.flush()
-
-                # Import speakers
-                for speaker_data in speakers_data:
-                    speaker_dict = {k: v for k, v in speaker_data.items() if k not in ["id", "meeting_id"]}
-                    speaker = Speaker(meeting_id=meeting.id, **speaker_dict)
-                    db.add(speaker)
-
-                # Import action items (link to transcription, not meeting)
-                # First, get or create transcription for this meeting
-                from ...models import Transcription
-
-                if not transcription:
-                    transcription = db.query(Transcription).filter(Transcription.meeting_id == meeting.id).first()
-
-                if not transcription and action_items_data:
-                    # Create a basic transcription record if needed
-                    transcription = Transcription(meeting_id=meeting.id, summary="", full_text="")
-                    db.add(transcription)
-                    db.flush()
-
-                if transcription:
-                    for ai_data in action_items_data:
-                        # Convert datetime fields
-                        for field in ["due_date", "last_synced_at"]:
-                            if field in ai_data and ai_data[field]:
-                                try:
-                                    ai_data[field] = datetime.fromisoformat(ai_data[field])
-                                except:
-                                    ai_data[field] = None
-
-                        ai_dict = {
-                            k: v for k, v in ai_data.items() if k not in ["id", "meeting_id", "transcription_id"]
-                        }
-                        action_item = ActionItem(transcription_id=transcription.id, **ai_dict)
-                        db.add(action_item)
-
+                # Each meeting gets a savepoint: a failing row is rolled back on its
+                # own and leaves the session usable for the rest of the batch
+                with db.begin_nested():
+                    # Create meeting (without old ID)
+                    meeting_dict = {k: v for k, v in meeting_data.items() if k not in ["id", "transcription"]}
+                    meeting = Meeting(**meeting_dict)
+                    db.add(meeting)
+                    db.flush()  # Get new ID
+
+                    # Import transcription
+                    transcription = None
+                    if transcription_data:
+                        trans_dict = {k: v for k, v in transcription_data.items() if k not in ["id", "meeting_id"]}
+                        transcription = Transcription(meeting_id=meeting.id, **trans_dict)
+                        db.add(transcription)
+                        db.flush()
+
+                    # Import speakers
+                    for speaker_data in speakers_data:
+                        speaker_dict = {k: v for k, v in speaker_data.items() if k not in ["id", "meeting_id"]}
+                        speaker = Speaker(meeting_id=meeting.id, **speaker_dict)
+                        db.add(speaker)
+
+                    # Import action items (link to transcription, not meeting)
+                    # The meeting is new, so without imported data it has no transcription yet
+                    if not transcription and action_items_data:
+                        # Create a basic transcription record if needed
+                        transcription = Transcription(meeting_id=meeting.id, summary="", full_text="")
+                        db.add(transcription)
+                        db.flush()
+
+                    if transcription:
+                        for ai_data in action_items_data:
+                            _parse_temporal_fields(ActionItem, ai_data)
+
+                            ai_dict = {
+                                k: v for k, v in ai_data.items() if k not in ["id", "meeting_id", "transcription_id"]
+                            }
+                            action_item = ActionItem(transcription_id=transcription.id, **ai_dict)
+                            db.add(action_item)
+
+                meeting_id_map[old_id] = existing_meetings[meeting.filename] = meeting.id
                 stats["meetings_imported"] += 1
 
             except Exception as e:
@@ -996,14 +995,11 @@ async def import_data(file: UploadFile = File(...), merge_mode: bool = False, db
         db.commit()
 
         # Import meeting links (after all meetings are imported)
+        link_rows = []
+        existing_links = set(db.execute(select(MeetingLink.source_meeting_id, MeetingLink.target_meeting_id)).all())
         for link_data in data.get("meeting_links", []):
             try:
-                # Convert datetime if present
-                if "created_at" in link_data and link_data["created_at"]:
-                    try:
-                        link_data["created_at"] = datetime.fromisoformat(link_data["created_at"])
-                    except:
-                        link_data["created_at"] = None
+                _parse_temporal_fields(MeetingLink, link_data)
 
                 old_source_id = link_data.get("source_meeting_id")
                 old_target_id = link_data.get("target_meeting_id")
@@ -1014,35 +1010,23 @@ async def import_data(file: UploadFile = File(...), merge_mode: bool = False, db
 
                 if new_source_id and new_target_id:
                     # Check if link already exists
-                    existing_link = (
-                        db.query(MeetingLink)
-                        .filter(
-                            MeetingLink.source_meeting_id == new_source_id,
-                            MeetingLink.target_meeting_id == new_target_id,
-                        )
-                        .first()
-                    )
-
-                    if not existing_link:
+                    if (new_source_id, new_target_id) not in existing_links:
                         # MeetingLink only has source and target IDs, no other fields
-                        link = MeetingLink(source_meeting_id=new_source_id, target_meeting_id=new_target_id)
-                        db.add(link)
-                        stats["links_imported"] += 1
+                        link_rows.append({"source_meeting_id": new_source_id, "target_meeting_id": new_target_id})
+                        existing_links.add((new_source_id, new_target_id))
 
             except Exception as e:
                 stats["errors"].append(f"Link {old_source_id}->{old_target_id}: {str(e)}")
 
+        _bulk_insert(db, MeetingLink, link_rows, stats, "links_imported", "Meeting links")
         db.commit()
 
         # Import Drive processed files
+        processed_file_rows = []
+        existing_processed_files = set(db.scalars(select(GoogleDriveProcessedFile.drive_file_id)))
         for pf_data in data.get("drive_processed_files", []):
             try:
-                # Convert datetime
-                if "processed_at" in pf_data and pf_data["processed_at"]:
-                    try:
-                        pf_data["processed_at"] = datetime.fromisoformat(pf_data["processed_at"])
-                    except:
-                        pf_data["processed_at"] = None
+                _parse_temporal_fields(GoogleDriveProcessedFile, pf_data)
 
                 # Map old meeting_id to new one
                 if "meeting_id" in pf_data and pf_data["meeting_id"]:
@@ -1050,110 +1034,98 @@ async def import_data(file: UploadFile = File(...), merge_mode: bool = False, db
                     pf_data["meeting_id"] = meeting_id_map.get(old_meeting_id)
 
                 # Check if already exists
-                existing_pf = (
-                    db.query(GoogleDriveProcessedFile)
-                    .filter(GoogleDriveProcessedFile.drive_file_id == pf_data.get("drive_file_id"))
-                    .first()
-                )
-
-                if not existing_pf:
+                if pf_data.get("drive_file_id") not in existing_processed_files:
                     # Align field names with model: drive_file_id, drive_file_name
-                    pf_dict = {k: v for k, v in pf_data.items() if k != "id"}
-                    processed_file = GoogleDriveProcessedFile(**pf_dict)
-                    db.add(processed_file)
-                    stats["processed_files_imported"] += 1
+                    processed_file_rows.append({k: v for k, v in pf_data.items() if k != "id"})
+                    existing_processed_files.add(pf_data.get("drive_file_id"))
 
             except Exception as e:
                 stats["errors"].append(f"Processed file '{pf_data.get('drive_file_name')}': {str(e)}")
 
+        _bulk_insert(
+            db, GoogleDriveProcessedFile, processed_file_rows, stats, "processed_files_imported", "Processed files"
+        )
         db.commit()
 
         # Import global chat sessions (metadata only)
+        chat_session_rows = []
+        existing_chat_session_titles = set(db.scalars(select(GlobalChatSession.title)))
         for cs_data in data.get("global_chat_sessions", []):
             try:
-                # Convert datetime
-                for field in ["created_at", "updated_at"]:
-                    if field in cs_data and cs_data[field]:
-                        cs_data[field] = datetime.fromisoformat(cs_data[field])
+                _parse_temporal_fields(GlobalChatSession, cs_data)
 
                 # Check if already exists
                 # Use title + created_at as a simple uniqueness heuristic
-                existing_cs = None
-                if cs_data.get("title"):
-                    existing_cs = (
-                        db.query(GlobalChatSession).filter(GlobalChatSession.title == cs_data.get("title")).first()
-                    )
-
-                if not existing_cs:
+                if not cs_data.get("title") or cs_data["title"] not in existing_chat_session_titles:
                     # Align to model fields: title, tags, filter_folder, filter_tags, created_at, updated_at
                     cs_dict = {
                         k: v
                         for k, v in cs_data.items()
                         if k in ["title", "tags", "filter_folder", "filter_tags", "created_at", "updated_at"]
                     }
-                    chat_session = GlobalChatSession(**cs_dict)
-                    db.add(chat_session)
-                    stats["chat_sessions_imported"] += 1
+                    chat_session_rows.append(cs_dict)
+                    if cs_data.get("title"):
+                        existing_chat_session_titles.add(cs_data["title"])
 
             except Exception as e:
                 stats["errors"].append(f"Chat session '{cs_data.get('title')}': {str(e)}")
 
+        _bulk_insert(db, GlobalChatSession, chat_session_rows, stats, "chat_sessions_imported", "Chat sessions")
         db.commit()
 
         # Import diary entries
+        diary_rows = []
+        diary_updates = []
+        new_diary_dates = set()
+        existing_diary_entries = dict(db.execute(select(DiaryEntry.date, DiaryEntry.id)).all())
         for de_data in data.get("diary_entries", []):
             try:
-                # Convert datetime fields
-                for field in ["created_at", "updated_at", "date"]:
-                    if field in de_data and de_data[field]:
-                        try:
-                            if field == "date":
-                                # date field is date type, not datetime
-                                de_data[field] = datetime.fromisoformat(de_data[field]).date()
-                            else:
-                                de_data[field] = datetime.fromisoformat(de_data[field])
-                        except:
-                            de_data[field] = None
+                _parse_temporal_fields(DiaryEntry, de_data)
 
                 # Check if already exists by date
-                existing_de = db.query(DiaryEntry).filter(DiaryEntry.date == de_data.get("date")).first()
+                existing_id = existing_diary_entries.get(de_data.get("date"))
 
-                if not existing_de:
+                if not existing_id:
+                    if de_data.get("date") in new_diary_dates:
+                        continue
                     # Create new diary entry
-                    de_dict = {k: v for k, v in de_data.items() if k != "id"}
-                    diary_entry = DiaryEntry(**de_dict)
-                    db.add(diary_entry)
-                    stats["diary_entries_imported"] += 1
+                    diary_rows.append({k: v for k, v in de_data.items() if k != "id"})
+                    new_diary_dates.add(de_data.get("date"))
                 elif merge_mode:
                     # Update existing entry if merge mode
-                    for key, value in de_data.items():
-                        if key not in ["id", "date", "created_at"]:
-                            setattr(existing_de, key, value)
-                    stats["diary_entries_imported"] += 1
+                    diary_updates.append(
+                        {k: v for k, v in de_data.items() if k not in ["id", "date", "created_at"]}
+                        | {"id": existing_id}
+                    )
 
             except Exception as e:
                 stats["errors"].append(f"Diary entry '{de_data.get('date')}': {str(e)}")
 
+        _bulk_insert(db, DiaryEntry, diary_rows, stats, "diary_entries_imported", "Diary entries")
+        if diary_updates:
+            # Bulk UPDATE by primary key
+            keys = set(_column_keys(DiaryEntry))
+            db.execute(update(DiaryEntry), [{k: v for k, v in row.items() if k in keys} for row in diary_updates])
+            stats["diary_entries_imported"] += len(diary_updates)
+        db.commit()
+
         # Import standalone action items (those not attached to meetings)
+        standalone_rows = []
         for ai_data in data.get("standalone_action_items", []):
             try:
-                # Convert datetime fields
-                for field in ["due_date", "last_synced_at"]:
-                    if field in ai_data and ai_data[field]:
-                        try:
-                            ai_data[field] = datetime.fromisoformat(ai_data[field])
-                        except:
-                            ai_data[field] = None
+                _parse_temporal_fields(ActionItem, ai_data)
 
                 # Remove id and transcription_id (should be None anyway)
-                ai_dict = {k: v for k, v in ai_data.items() if k not in ["id", "transcription_id"]}
-                action_item = ActionItem(**ai_dict)
-                db.add(action_item)
-                stats["standalone_action_items_imported"] = stats.get("standalone_action_items_imported", 0) + 1
+                standalone_rows.append({k: v for k, v in ai_data.items() if k not in ["id", "transcription_id"]})
             except Exception as e:
                 stats["errors"].append(f"Standalone action item '{ai_data.get('task')}': {str(e)}")
 
+        _bulk_insert(
+            db, ActionItem, standalone_rows, stats, "standalone_action_items_imported", "Standalone action items"
+        )
         db.commit()
+        # Imported model configurations and API keys replace cached settings snapshots
+        clear_settings_cache()
 
         return {"success": True, "message": "Import completed", "statistics": stats}
 
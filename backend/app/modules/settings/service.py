@@ -1,8 +1,10 @@
 """Service layer for settings business logic."""
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 
+from cachetools import TTLCache
 from sqlalchemy.orm import Session
 
 from ...core.storage.embeddings import validate_embedding_model
@@ -24,6 +26,20 @@ _ENV_KEY_PATTERNS: dict[str, dict[str, str]] = {
     "GROQ_API_KEY": {"provider": "groq", "name": "Groq (Environment)"},
 }
 
+# The default model configuration is read on every chat request but changes rarely.
+# Writes through SettingsService clear the snapshot; other processes (Celery workers,
+# other API workers) see changes within the TTL.
+_DEFAULT_MODEL_CONFIG_TTL_SECONDS = 60
+_DEFAULT_MODEL_CONFIG_KEY = "default_model_configuration"
+_settings_cache: TTLCache = TTLCache(maxsize=1, ttl=_DEFAULT_MODEL_CONFIG_TTL_SECONDS)
+_settings_cache_lock = threading.Lock()
+
+
+def clear_settings_cache() -> None:
+    """Drop cached settings snapshots, e.g. after changing configurations."""
+    with _settings_cache_lock:
+        _settings_cache.clear()
+
 
 # ------------------------------------------------------------------
 # .env file helpers (module-level, no DB required)
@@ -310,6 +326,7 @@ class SettingsService:
                 raise RuntimeError("Failed to save API key to environment file")
 
         created = self.repository.create_api_key(api_key)
+        clear_settings_cache()
         env_value = read_env_file().get(created.environment_variable, "")
         return _build_api_key_response(
             created.id,
@@ -340,6 +357,7 @@ class SettingsService:
         updated = self.repository.update_api_key(key_id, api_key_update)
         if not updated:
             raise ValueError(f"API key {key_id} not found")
+        clear_settings_cache()
 
         env_value = read_env_file().get(updated.environment_variable, "")
         return _build_api_key_response(
@@ -361,13 +379,24 @@ class SettingsService:
         api_key = self.repository.deactivate_api_key(key_id)
         if not api_key:
             raise ValueError(f"API key {key_id} not found")
+        clear_settings_cache()
         return {"message": "API key deactivated successfully"}
 
     # --- Model Configurations ---
 
-    def get_default_model_configuration(self):
-        """Exposed for cross-module consumption (e.g. projects/service.py)."""
-        return self.repository.get_default_model_configuration()
+    def get_default_model_configuration(self) -> schemas.ModelConfiguration | None:
+        """Exposed for cross-module consumption (e.g. projects/service.py).
+
+        Returns a read-only snapshot, cached briefly in process, rather than the ORM row.
+        """
+        with _settings_cache_lock:
+            if _DEFAULT_MODEL_CONFIG_KEY in _settings_cache:
+                return _settings_cache[_DEFAULT_MODEL_CONFIG_KEY]
+        db_config = self.repository.get_default_model_configuration()
+        snapshot = schemas.ModelConfiguration.model_validate(db_config) if db_config else None
+        with _settings_cache_lock:
+            _settings_cache[_DEFAULT_MODEL_CONFIG_KEY] = snapshot
+        return snapshot
 
     def get_model_configuration(self, config_id: int):
         return self.repository.get_model_configuration_by_id(config_id)
@@ -379,13 +408,17 @@ class SettingsService:
         existing = self.repository.get_model_configuration_by_name(config.name)
         if existing:
             raise ValueError("Configuration name already exists")
-        return self.repository.create_model_configuration(config)
+        created = self.repository.create_model_configuration(config)
+        clear_settings_cache()
+        return created
 
     def update_model_configuration(self, config_id: int, config_update: schemas.ModelConfigurationUpdate):
         config = self.repository.get_model_configuration_by_id(config_id)
         if not config:
             raise ValueError(f"Model configuration {config_id} not found")
-        return self.repository.update_model_configuration(config_id, config_update)
+        updated = self.repository.update_model_configuration(config_id, config_update)
+        clear_settings_cache()
+        return updated
 
     def delete_model_configuration(self, config_id: int) -> dict:
         config = self.repository.get_model_configuration_by_id(config_id)
@@ -394,6 +427,7 @@ class SettingsService:
         if config.is_default:
             raise ValueError("Cannot delete the default configuration")
         self.repository.delete_model_configuration(config_id)
+        clear_settings_cache()
         return {"message": "Model configuration deleted successfully"}
 
     def set_default_model_configuration(self, config_id: int) -> dict:
@@ -401,6 +435,7 @@ class SettingsService:
         if not config:
             raise ValueError(f"Model configuration {config_id} not found")
         self.repository.set_default_model_configuration(config_id)
+        clear_settings_cache()
         return {"message": "Default model configuration updated successfully"}
 
     # --- Embedding Configurations ---
@@ -360,22 +360,36 @@ def sync_google_drive_folder(self, force: bool = False):
         processed_count = 0
         error_count = 0
 
+        drive_repo = GoogleDriveRepository(db)
+        already_processed = drive_repo.get_processed_file_ids([file_info["id"] for file_info in files])
+        to_download = []
+        skipped = {}
         for file_info in files:
             file_id = file_info["id"]
             file_name = file_info["name"]
 
-            # Skip if already processed
-            if GoogleDriveRepository(db).is_file_processed(file_id):
+            # Skip if already processed (or already queued in this run)
+            if file_id in already_processed:
                 logger.debug(f"File {file_name} already processed, skipping")
                 continue
+            already_processed.add(file_id)
 
             # Check if file extension is allowed
             file_ext = Path(file_name).suffix.lower()
             if file_ext not in config.upload.allowed_extensions:
                 logger.info(f"Skipping {file_name}: extension {file_ext} not allowed")
-                GoogleDriveRepository(db).mark_file_as_processed(file_id, file_name)
+                skipped[file_id] = file_name
                 continue
 
+            to_download.append(file_info)
+
+        # Files that are never downloaded are recorded together in one INSERT
+        drive_repo.mark_files_as_processed(list(skipped.items()))
+
+        for file_info in to_download:
+            file_id = file_info["id"]
+            file_name = file_info["name"]
+
             try:
                 logger.info(f"Processing file: {file_name}")
 
@@ -852,6 +866,29 @@ def remove_project_note_embeddings(self, note_id: int):
         db.close()
 
 
+@celery_app.task(
+    bind=True,
+    autoretry_for=(ConnectionError, TimeoutError),
+    retry_backoff=True,
+    retry_backoff_max=120,
+    retry_jitter=True,
+    max_retries=3,
+)
+def normalize_project_gantt_links(self, project_id: int):
+    """Persist normalized gantt links (ids and types) found by a Gantt read."""
+    from .modules.projects.service import ProjectService
+
+    db = SessionLocal()
+    try:
+        changed = ProjectService(db).normalize_project_gantt_links(project_id)
+        return {"status": "completed", "project_id": project_id, "changed": changed}
+    except Exception as e:
+        logger.error(f"Error normalizing gantt links for project {project_id}: {e}", exc_info=True)
+        return {"status": "error", "project_id": project_id, "error": str(e)}
+    finally:
+        db.close()
+
+
 @celery_app.task(
     bind=True,
     autoretry_for=(ConnectionError, TimeoutError),
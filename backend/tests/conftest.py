@@ -38,6 +38,8 @@ from app.core.storage import rag
 from app.database import Base, get_db
 from app.main import app
 from app.models import ActionItem, DiaryEntry, Meeting, Transcription, UserMapping
+from app.modules.search.service import clear_search_cache
+from app.modules.settings.service import clear_settings_cache
 
 
 @compiles(JSONB, "sqlite")
@@ -85,6 +87,13 @@ def test_engine(test_database_url):
             cursor = dbapi_conn.cursor()
             cursor.execute("PRAGMA foreign_keys=ON")
             cursor.close()
+            # Let SQLAlchemy emit BEGIN itself (below): pysqlite's lazy BEGIN
+            # would let the first SAVEPOINT's release commit the test transaction
+            dbapi_conn.isolation_level = None
+
+        @event.listens_for(engine, "begin")
+        def do_begin(conn):
+            conn.exec_driver_sql("BEGIN")
 
     # Create all tables
     Base.metadata.create_all(bind=engine)
@@ -384,6 +393,16 @@ def sample_transcript():
 # ============================================================================
 
 
+@pytest.fixture(autouse=True)
+def reset_process_caches():
+    """Keep cached search responses and settings snapshots from leaking between tests."""
+    clear_search_cache()
+    clear_settings_cache()
+    yield
+    clear_search_cache()
+    clear_settings_cache()
+
+
 @pytest.fixture(autouse=True)
 def test_config():
     """Override configuration for testing."""
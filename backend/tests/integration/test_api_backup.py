@@ -2,10 +2,27 @@
 Integration tests for Backup API endpoints.
 """
 
+import io
 import json
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 from fastapi import status
+from sqlalchemy import event
+
+from app.models import ActionItem, Meeting, ModelConfiguration, Transcription
+from app.modules.diary.models import DiaryEntry
+from app.modules.projects.models import (
+    Project,
+    ProjectChatMessage,
+    ProjectChatSession,
+    ProjectNote,
+    ProjectNoteAttachment,
+)
+from app.modules.settings import router_backup
 
 
 @pytest.mark.integration
@@ -23,6 +40,43 @@ class TestBackupAPI:
         assert "export_metadata" in data
         assert "meetings" in data
         assert any(m["id"] == sample_meeting.id for m in data["meetings"])
+        [meeting] = data["meetings"]
+        assert meeting["meeting_date"] == sample_meeting.meeting_date.isoformat()
+
+    def test_export_backup_json_is_streamed_without_length(self, client, sample_action_item):
+        response = client.get("/api/v1/backup/export", params={"pretty": True})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "content-length" not in response.headers
+        data = response.json()
+        assert data["export_metadata"]["counts"]["meetings"] == len(data["meetings"]) == 1
+        [meeting] = data["meetings"]
+        assert meeting["transcription"]["full_text"] == "Test transcript content"
+        assert [item["id"] for item in meeting["action_items"]] == [sample_action_item.id]
+        assert data["worker_configuration"] is None
+        assert data["standalone_action_items"] == []
+
+    def test_export_backup_query_count_does_not_grow_with_meetings(self, client, db_session, sample_meeting):
+        def count_export_queries():
+            statements = []
+            engine = db_session.get_bind().engine
+            listener = lambda *args: statements.append(args[2])  # noqa: E731
+            event.listen(engine, "before_cursor_execute", listener)
+            try:
+                assert client.get("/api/v1/backup/export").status_code == status.HTTP_200_OK
+            finally:
+                event.remove(engine, "before_cursor_execute", listener)
+            return len(statements)
+
+        baseline = count_export_queries()
+        for index in range(3):
+            meeting = Meeting(filename=f"extra_{index}.wav", filepath=f"/tmp/extra_{index}.wav", status="completed")
+            db_session.add(meeting)
+            db_session.flush()
+            db_session.add(Transcription(meeting_id=meeting.id, summary="", full_text="extra"))
+        db_session.commit()
+
+        assert count_export_queries() == baseline
 
     def test_export_backup_zip(self, client, sample_meeting):
         response = client.get("/api/v1/backup/export", params={"include_audio": True})
@@ -30,6 +84,61 @@ class TestBackupAPI:
         assert response.status_code == status.HTTP_200_OK
         assert "application/zip" in response.headers.get("content-type", "")
         assert response.content[:2] == b"PK"
+        assert "content-length" not in response.headers
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            [name] = [n for n in archive.namelist() if n.endswith(".json")]
+            data = json.loads(archive.read(name))
+        assert [m["id"] for m in data["meetings"]] == [sample_meeting.id]
+
+    def test_export_backup_zip_stores_media_uncompressed(self, client, db_session, sample_meeting, tmp_path):
+        audio = tmp_path / "meeting.mp3"
+        audio.write_bytes(b"ID3" + bytes(4096))
+        notes = tmp_path / "meeting.txt"
+        notes.write_text("notes " * 500)
+        sample_meeting.filepath = str(audio)
+        sample_meeting.audio_filepath = str(notes)
+        db_session.commit()
+
+        response = client.get("/api/v1/backup/export", params={"include_audio": True})
+
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            entries = {Path(info.filename).name: info for info in archive.infolist()}
+            assert archive.read(entries["meeting.mp3"]) == audio.read_bytes()
+        assert entries["meeting.mp3"].compress_type == zipfile.ZIP_STORED
+        assert entries["meeting.txt"].compress_type == zipfile.ZIP_DEFLATED
+
+    def test_export_json_chunks_collects_file_paths_while_streaming(self, db_session, sample_meeting):
+        project = Project(name="Files")
+        note = ProjectNote(project=project, title="Note")
+        db_session.add(ProjectNoteAttachment(project=project, note=note, filename="a.pdf", filepath="notes/a.pdf"))
+        sample_meeting.audio_filepath = "audio/test.wav"
+        db_session.commit()
+        file_paths = set()
+
+        document = json.loads(b"".join(router_backup._export_json_chunks(db_session, file_paths=file_paths)))
+
+        assert file_paths == {sample_meeting.filepath, "audio/test.wav", "notes/a.pdf"}
+        assert document["project_note_attachments"][0]["filepath"] == "notes/a.pdf"
+
+    def test_import_backup_zip_extracts_uploads_inside_upload_dir(self, client, tmp_path, monkeypatch):
+        upload_dir = tmp_path / "uploads"
+        monkeypatch.setattr(router_backup, "get_upload_config", lambda: SimpleNamespace(upload_dir=str(upload_dir)))
+        payload = {"export_metadata": {"version": "1.1", "exported_at": "2026-03-16T00:00:00", "counts": {}}}
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zip_file:
+            zip_file.writestr("backup.json", json.dumps(payload))
+            zip_file.writestr("uploads/audio/meeting.mp3", b"audio")
+            # Resolves to a sibling of the upload dir that shares its name as a prefix
+            zip_file.writestr("uploads/../uploads_evil/payload.sh", b"evil")
+
+        response = client.post(
+            "/api/v1/backup/import",
+            files={"file": ("backup.zip", archive.getvalue(), "application/zip")},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert (upload_dir / "audio" / "meeting.mp3").read_bytes() == b"audio"
+        assert not (tmp_path / "uploads_evil").exists()
 
     def test_import_backup_json_minimal(self, client):
         payload = {
@@ -51,3 +160,162 @@ class TestBackupAPI:
         data = response.json()
         assert data["success"] is True
         assert "statistics" in data
+
+    def test_import_backup_bulk_inserts_leaf_tables(self, client, db_session):
+        payload = {
+            "export_metadata": {"version": "1.1", "exported_at": "2026-03-16T00:00:00", "counts": {}},
+            "projects": [
+                {"id": 7, "name": "Imported project", "status": "active", "settings": '{"color": "blue"}', "tags": []}
+            ],
+            "project_chat_sessions": [{"id": 3, "project_id": 7, "title": "Chat"}],
+            "project_chat_messages": [
+                {"id": 1, "session_id": 3, "role": "user", "content": "hi", "created_at": "2026-03-16T10:00:00"},
+                # Columns the model no longer has are ignored
+                {"id": 2, "session_id": 3, "role": "assistant", "content": "hello", "legacy_field": 1},
+                {"id": 9, "session_id": 99, "role": "user", "content": "orphaned"},
+            ],
+            "project_notes": [{"id": 4, "project_id": 7, "title": "Note"}],
+            "project_note_attachments": [
+                {"id": 1, "project_id": 7, "note_id": 4, "filename": "a.txt", "filepath": "/uploads/a.txt"}
+            ],
+            "diary_entries": [{"id": 1, "date": "2026-03-16", "content": "Imported"}],
+            "standalone_action_items": [
+                {
+                    "id": 5,
+                    "task": "Standalone task",
+                    "transcription_id": None,
+                    "due_date": "2026-03-20",
+                    "start_date": "2026-03-18T09:00:00",
+                    "last_synced_at": "not a date",
+                }
+            ],
+        }
+
+        response = client.post(
+            "/api/v1/backup/import",
+            files={"file": ("backup.json", json.dumps(payload), "application/json")},
+        )
+
+        stats = response.json()["statistics"]
+        assert stats["errors"] == []
+        assert stats["project_chat_messages_imported"] == 2
+        assert stats["project_note_attachments_imported"] == 1
+        assert stats["diary_entries_imported"] == stats["standalone_action_items_imported"] == 1
+        [session] = db_session.query(ProjectChatSession).all()
+        assert session.project.settings == {"color": "blue"}
+        assert sorted(m.content for m in db_session.query(ProjectChatMessage)) == ["hello", "hi"]
+        assert {m.session_id for m in db_session.query(ProjectChatMessage)} == {session.id}
+        attachment = db_session.query(ProjectNoteAttachment).one()
+        assert (attachment.project_id, attachment.note.title) == (session.project_id, "Note")
+        assert db_session.query(DiaryEntry).one().content == "Imported"
+        standalone = db_session.query(ActionItem).filter(ActionItem.transcription_id.is_(None)).one()
+        assert standalone.task == "Standalone task"
+        # Only date and datetime columns are parsed; unparseable values are dropped
+        assert standalone.due_date == "2026-03-20"
+        assert standalone.start_date.replace(tzinfo=None) == datetime(2026, 3, 18, 9, 0)
+        assert standalone.last_synced_at is None
+
+    def test_bulk_insert_commits_each_batch(self, monkeypatch):
+        monkeypatch.setattr(router_backup, "_IMPORT_BATCH_SIZE", 2)
+        calls = []
+
+        def execute(statement, rows):
+            if any(row["role"] is None for row in rows):
+                raise ValueError("role is required")
+            calls.append([row["content"] for row in rows])
+
+        db = SimpleNamespace(
+            execute=execute, commit=lambda: calls.append("commit"), rollback=lambda: calls.append("rollback")
+        )
+        rows = [{"role": "user", "content": content} for content in "abc"]
+        rows += [{"role": None, "content": "d"}, {"role": "user", "content": "e", "legacy_field": 1}]
+        stats = {"errors": [], "messages_imported": 0}
+
+        router_backup._bulk_insert(db, ProjectChatMessage, rows, stats, "messages_imported", "Messages")
+
+        # Only the failing batch is rolled back
+        assert calls == [["a", "b"], "commit", "rollback", ["e"], "commit"]
+        assert stats == {"errors": ["Messages 3-4: role is required"], "messages_imported": 3}
+
+    def test_import_backup_skips_a_failing_meeting(self, client, db_session, monkeypatch):
+        monkeypatch.setattr(router_backup, "_IMPORT_BATCH_SIZE", 2)
+        payload = {
+            "export_metadata": {"version": "1.1", "exported_at": "2026-03-16T00:00:00", "counts": {}},
+            "meetings": [
+                {"id": 1, "filename": "first.wav", "speakers": [{"name": "Alice"}]},
+                # Speaker names are required, so this meeting fails on flush
+                {"id": 2, "filename": "broken.wav", "speakers": [{"name": None}]},
+                {"id": 3, "filename": "third.wav", "action_items": [{"task": "Follow up"}]},
+            ],
+            "meeting_links": [{"source_meeting_id": 1, "target_meeting_id": 3}],
+        }
+
+        response = client.post(
+            "/api/v1/backup/import",
+            files={"file": ("backup.json", json.dumps(payload), "application/json")},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        stats = response.json()["statistics"]
+        assert (stats["meetings_imported"], stats["links_imported"]) == (2, 1)
+        assert len(stats["errors"]) == 1 and stats["errors"][0].startswith("Meeting ")
+        assert sorted(m.filename for m in db_session.query(Meeting)) == ["first.wav", "third.wav"]
+        assert db_session.query(ActionItem).one().task == "Follow up"
+
+    def test_import_backup_keeps_the_existing_default_model_configuration(self, client, db_session):
+        db_session.add(ModelConfiguration(name="local", is_default=True))
+        db_session.commit()
+        payload = {
+            "export_metadata": {"version": "1.1", "exported_at": "2026-03-16T00:00:00", "counts": {}},
+            "model_configurations": [
+                # Merge mode re-inserts by name, so this row hits the unique name
+                {"id": 1, "name": "local", "is_default": True},
+                {"id": 2, "name": "imported", "is_default": True},
+            ],
+        }
+
+        response = client.post(
+            "/api/v1/backup/import",
+            files={"file": ("backup.json", json.dumps(payload), "application/json")},
+            params={"merge_mode": True},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        stats = response.json()["statistics"]
+        assert stats["model_configs_imported"] == 1
+        assert len(stats["errors"]) == 1 and stats["errors"][0].startswith("Model Config 'local'")
+        configs = {c.name: c.is_default for c in db_session.query(ModelConfiguration)}
+        assert configs == {"local": True, "imported": False}
+
+    def test_import_backup_twice_skips_existing_rows(self, client, db_session):
+        payload = {
+            "export_metadata": {"version": "1.1", "exported_at": "2026-03-16T00:00:00", "counts": {}},
+            "user_mappings": [
+                {"id": 1, "name": "Alice", "email": "alice@example.com"},
+                {"id": 2, "name": "Alice", "email": "alice@example.com"},
+            ],
+            "projects": [{"id": 7, "name": "Imported project", "status": "active", "settings": {}, "tags": []}],
+            "project_members": [{"id": 1, "project_id": 7, "name": "Alice", "role": "member"}],
+            "diary_entries": [{"id": 1, "date": "2026-03-16", "content": "First"}],
+        }
+
+        def import_backup(merge_mode):
+            response = client.post(
+                "/api/v1/backup/import",
+                files={"file": ("backup.json", json.dumps(payload), "application/json")},
+                params={"merge_mode": merge_mode},
+            )
+            return response.json()["statistics"]
+
+        first = import_backup(False)
+        payload["diary_entries"][0]["content"] = "Updated"
+        second = import_backup(False)
+        merged = import_backup(True)
+
+        assert first["errors"] == []
+        assert (first["user_mappings_imported"], first["project_members_imported"]) == (1, 1)
+        assert second["user_mappings_imported"] == second["projects_imported"] == 0
+        assert second["project_members_imported"] == second["diary_entries_imported"] == 0
+        assert merged["errors"] == []
+        assert merged["diary_entries_imported"] == 1
+        assert db_session.query(DiaryEntry).one().content == "Updated"
@@ -30,6 +30,14 @@ class TestProjectsCRUD:
         assert data["id"] is not None
         assert data["status"] == "active"
 
+    def test_create_project_with_unknown_meetings(self, client, sample_meeting):
+        response = client.post(
+            "/api/v1/projects/",
+            json={"name": "Broken", "meeting_ids": [sample_meeting.id, 99999, 99998]},
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json()["detail"] == "Meetings not found: [99998, 99999]"
+
     def test_get_project(self, client):
         created = self._create_project(client).json()
         response = client.get(f"/api/v1/projects/{created['id']}")
@@ -85,6 +93,37 @@ class TestProjectMeetings:
         response = client.post(f"/api/v1/projects/{project['id']}/meetings/{sample_meeting.id}")
         assert response.status_code == status.HTTP_201_CREATED
 
+    def test_get_project_details_include_linked_meetings(self, client, sample_meeting):
+        project = self._create_project(client)
+        client.post(f"/api/v1/projects/{project['id']}/meetings/{sample_meeting.id}")
+        response = client.get(f"/api/v1/projects/{project['id']}")
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["meeting_ids"] == [sample_meeting.id]
+        assert data["meeting_count"] == 1
+        assert data["tags"] == []
+        assert data["settings"] == {}
+
+    def test_add_meeting_to_project_twice_conflicts(self, client, sample_meeting):
+        project = self._create_project(client)
+        client.post(f"/api/v1/projects/{project['id']}/meetings/{sample_meeting.id}")
+        response = client.post(f"/api/v1/projects/{project['id']}/meetings/{sample_meeting.id}")
+        assert response.status_code == status.HTTP_409_CONFLICT
+
+    def test_add_missing_meeting_to_project(self, client):
+        project = self._create_project(client)
+        response = client.post(f"/api/v1/projects/{project['id']}/meetings/99999")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_link_and_unlink_action_item(self, client, sample_action_item):
+        project = self._create_project(client)
+        url = f"/api/v1/projects/{project['id']}/action-items/{sample_action_item.id}"
+
+        assert client.post(url).status_code == status.HTTP_201_CREATED
+        assert client.post(url).status_code == status.HTTP_409_CONFLICT
+        assert client.delete(url).status_code == status.HTTP_204_NO_CONTENT
+        assert client.delete(url).status_code == status.HTTP_404_NOT_FOUND
+
     def test_remove_meeting_from_project(self, client, sample_meeting):
         project = self._create_project(client)
         client.post(f"/api/v1/projects/{project['id']}/meetings/{sample_meeting.id}")
@@ -168,6 +207,10 @@ class TestProjectMilestones:
         assert response.status_code == status.HTTP_200_OK
         assert response.json() == []
 
+    def test_get_milestones_project_not_found(self, client):
+        response = client.get("/api/v1/projects/99999/milestones")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
     def test_create_milestone(self, client):
         project = self._create_project(client)
         response = client.post(
@@ -287,3 +330,18 @@ class TestProjectAnalytics:
         project = self._create_project(client)
         response = client.get(f"/api/v1/projects/{project['id']}/activity")
         assert response.status_code == status.HTTP_200_OK
+
+    def test_get_gantt(self, client):
+        project = self._create_project(client)
+        client.post(
+            f"/api/v1/projects/{project['id']}/milestones",
+            json={"name": "Launch", "due_date": "2024-03-01T00:00:00"},
+        )
+        response = client.get(f"/api/v1/projects/{project['id']}/gantt")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+        assert [(item["type"], item["name"]) for item in data["items"]] == [("milestone", "Launch")]
+        assert data["items"][0]["start_date"].startswith("2024-03-01T00:00:00")
+        assert [m["name"] for m in data["milestones"]] == ["Launch"]
+        assert data["links"] == []
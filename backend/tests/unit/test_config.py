@@ -3,6 +3,7 @@
 import importlib
 
 from app.core.config import APIConfig
+from app.database import _engine_options
 
 config_module = importlib.import_module("app.core.config")
 
@@ -56,3 +57,25 @@ def test_api_config_get_normalizes_quoted_values(monkeypatch):
     api_config = APIConfig()
 
     assert api_config.get("OLLAMA_SERVER_API_KEY") == "proxy-secret"
+
+
+def test_database_config_reads_pool_settings(monkeypatch):
+    """Pool sizing should be configurable from the environment."""
+
+    monkeypatch.setenv("DATABASE_POOL_SIZE", "5")
+    monkeypatch.setenv("DATABASE_POOL_RECYCLE", "600")
+
+    database = config_module.get_database_config()
+
+    assert (database.pool_size, database.max_overflow, database.pool_recycle) == (5, 20, 600)
+
+
+def test_engine_options_skip_pool_sizing_for_sqlite():
+    """Pool sizing only applies to server databases; every engine pings on checkout."""
+
+    sqlite = _engine_options(config_module.DatabaseConfig(url="sqlite:///./app.db"))
+    postgres = _engine_options(config_module.DatabaseConfig(url="postgresql://db/app", pool_size=4))
+
+    assert sqlite == {"echo": False, "pool_pre_ping": True}
+    assert postgres["pool_pre_ping"] is True
+    assert (postgres["pool_size"], postgres["max_overflow"], postgres["pool_recycle"]) == (4, 20, 1800)
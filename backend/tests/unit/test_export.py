@@ -0,0 +1,25 @@
+"""Unit tests for file export helpers."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.integrations import export
+
+
+@pytest.mark.unit
+class TestExportToJson:
+    DATA = {
+        "project": {"name": "Café", "created_at": datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)},
+        "metrics": {1: 2.5, "count": 3},
+        "notes": [{"title": "Plan", "attachments": []}],
+        "empty": None,
+    }
+
+    def _stdlib_dump(self):
+        return json.dumps(self.DATA, indent=2, ensure_ascii=False, default=str)
+
+    def test_output_matches_json_module(self, tmp_path):
+        path = export.export_to_json(self.DATA, str(tmp_path / "out.json"))
+        assert path.read_text(encoding="utf-8") == self._stdlib_dump()
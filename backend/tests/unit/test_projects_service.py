@@ -0,0 +1,474 @@
+"""Unit tests for projects service orchestration."""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from app.models import ActionItem, Meeting, Speaker
+from app.modules.projects import schemas
+from app.modules.projects.models import (
+    Project,
+    ProjectActionItem,
+    ProjectMeeting,
+    ProjectMilestone,
+    ProjectNote,
+    ProjectNoteAttachment,
+)
+from app.modules.projects.service import ProjectService
+
+
+@pytest.mark.unit
+class TestProjectTagSync:
+    def test_sync_links_matching_projects_and_action_items(self, db_session, sample_action_item):
+        meeting_id = sample_action_item.meeting_id
+        matching = Project(name="Demo", status="active", tags=["Demo"])
+        other = Project(name="Other", status="active", tags=["unrelated"])
+        db_session.add_all([matching, other])
+        db_session.commit()
+
+        ProjectService(db_session).sync_meeting_to_projects_by_tags(meeting_id)
+
+        linked = {row.project_id for row in db_session.query(ProjectMeeting).filter_by(meeting_id=meeting_id)}
+        linked_items = {
+            (row.project_id, row.action_item_id)
+            for row in db_session.query(ProjectActionItem).filter_by(action_item_id=sample_action_item.id)
+        }
+        assert linked == {matching.id}
+        assert linked_items == {(matching.id, sample_action_item.id)}
+
+    def test_sync_skips_existing_action_item_links(self, db_session, sample_action_item):
+        project = Project(name="Demo", status="active", tags=["demo"])
+        db_session.add(project)
+        db_session.commit()
+        db_session.add(ProjectActionItem(project_id=project.id, action_item_id=sample_action_item.id))
+        db_session.commit()
+
+        ProjectService(db_session).sync_meeting_to_projects_by_tags(sample_action_item.meeting_id)
+
+        assert db_session.query(ProjectMeeting).filter_by(project_id=project.id).count() == 1
+        assert db_session.query(ProjectActionItem).filter_by(project_id=project.id).count() == 1
+
+    def test_sync_removes_stale_links(self, db_session, sample_action_item):
+        meeting_id = sample_action_item.meeting_id
+        stale = Project(name="Stale", status="active", tags=["gone"])
+        db_session.add(stale)
+        db_session.commit()
+        db_session.add_all(
+            [
+                ProjectMeeting(project_id=stale.id, meeting_id=meeting_id),
+                ProjectActionItem(project_id=stale.id, action_item_id=sample_action_item.id),
+            ]
+        )
+        db_session.commit()
+
+        ProjectService(db_session).sync_meeting_to_projects_by_tags(meeting_id)
+
+        assert db_session.query(ProjectMeeting).filter_by(project_id=stale.id).count() == 0
+        assert db_session.query(ProjectActionItem).filter_by(project_id=stale.id).count() == 0
+
+
+@pytest.mark.unit
+class TestProjectActionItems:
+    def test_create_project_action_item_links_item(self, db_session, sample_meeting):
+        project = Project(name="Manual", status="active", settings={"default_action_item_owner": "Dana"})
+        db_session.add(project)
+        db_session.commit()
+        db_session.add(ProjectMeeting(project_id=project.id, meeting_id=sample_meeting.id))
+        db_session.commit()
+
+        item = ProjectService(db_session).create_project_action_item(
+            project.id, schemas.ProjectActionItemCreate(task="Write summary")
+        )
+
+        assert item.id is not None and item.owner == "Dana" and item.is_manual
+        assert db_session.query(ProjectActionItem).filter_by(project_id=project.id).one().action_item_id == item.id
+
+
+@pytest.mark.unit
+class TestProjectDateParsing:
+    @pytest.mark.parametrize(
+        "value",
+        ["2024-02-01T10:00:00Z", "2024-02-01T10:00:00+00:00", "2024-02-01 10:00:00", "Feb 1 2024 10:00"],
+    )
+    def test_parse_datetime_returns_utc_aware(self, db_session, value):
+        parsed = ProjectService(db_session)._parse_datetime(value)
+        assert parsed == datetime(2024, 2, 1, 10, tzinfo=timezone.utc)
+
+    def test_parse_datetime_rejects_garbage(self, db_session):
+        assert ProjectService(db_session)._parse_datetime("not a date") is None
+
+
+@pytest.mark.unit
+class TestProjectAnalytics:
+    def test_analytics_aggregates(self, db_session, sample_action_item):
+        meeting = db_session.get(Meeting, sample_action_item.meeting_id)
+        meeting.estimated_duration = 90
+        db_session.add_all(
+            [
+                ActionItem(transcription_id=sample_action_item.transcription_id, task="Done", status="completed"),
+                ActionItem(transcription_id=sample_action_item.transcription_id, task="No owner", owner="  "),
+            ]
+        )
+        project = Project(name="Analytics", status="active")
+        db_session.add(project)
+        db_session.commit()
+        db_session.add_all(
+            [
+                ProjectMeeting(project_id=project.id, meeting_id=meeting.id),
+                ProjectMilestone(project_id=project.id, name="Kickoff", status="completed"),
+                ProjectMilestone(project_id=project.id, name="Beta", due_date=datetime(2024, 3, 1)),
+                ProjectMilestone(project_id=project.id, name="GA"),
+            ]
+        )
+        db_session.commit()
+
+        analytics = ProjectService(db_session).get_project_analytics(project.id)
+
+        assert analytics.total_meetings == 1
+        assert analytics.total_duration_hours == 1.5
+        assert analytics.total_action_items == 3
+        assert analytics.completed_action_items == 1
+        assert analytics.pending_action_items == 2
+        assert analytics.overdue_action_items == 1
+        assert analytics.action_items_by_status == {"pending": 2, "completed": 1}
+        assert analytics.action_items_by_owner == [
+            {"owner": "Unassigned", "count": 2},
+            {"owner": "Test User", "count": 1},
+        ]
+        assert analytics.meetings_by_month == [{"month": "2024-01", "count": 1}]
+        assert analytics.milestone_progress == {
+            "total": 3,
+            "completed": 1,
+            "pending": 2,
+            "missed": 1,
+            "completion_rate": 33.33,
+        }
+
+
+@pytest.mark.unit
+class TestProjectMeetingSync:
+    def test_update_project_syncs_meetings_and_applies_tags(self, db_session, sample_meeting):
+        service = ProjectService(db_session)
+        project = service.create_project(schemas.ProjectCreate(name="Synced", tags=["roadmap"]))
+
+        updated = service.update_project(project.id, schemas.ProjectUpdate(meeting_ids=[sample_meeting.id]))
+
+        assert updated.meeting_ids == [sample_meeting.id]
+        db_session.refresh(sample_meeting)
+        assert "roadmap" in sample_meeting.tags
+
+        cleared = service.update_project(project.id, schemas.ProjectUpdate(meeting_ids=[]))
+        assert cleared.meeting_ids == []
+
+
+@pytest.mark.unit
+class TestProjectMemberSync:
+    def test_sync_members_replaces_auto_detected_and_skips_manual(self, db_session, sample_meeting):
+        db_session.add_all([Speaker(meeting_id=sample_meeting.id, name=name) for name in ("Alice", "Bob", "Bob")])
+        db_session.commit()
+        service = ProjectService(db_session)
+        project = service.create_project(schemas.ProjectCreate(name="Team"))
+        service.add_project_member(project.id, schemas.ProjectMemberCreate(name="Alice"))
+        service.update_project(project.id, schemas.ProjectUpdate(meeting_ids=[sample_meeting.id]))
+
+        synced = service.sync_project_members(project.id)
+
+        assert [m.name for m in synced] == ["Bob"]
+        assert all(m.is_auto_detected for m in synced)
+        members = service.get_project_members(project.id)
+        assert sorted((m.name, m.is_auto_detected) for m in members) == [("Alice", False), ("Bob", True)]
+
+
+@pytest.mark.unit
+class TestProjectActivity:
+    def test_activity_merges_meetings_and_completed_milestones(self, db_session, sample_meeting):
+        project = Project(name="Activity", status="active")
+        db_session.add(project)
+        db_session.commit()
+        db_session.add_all(
+            [
+                ProjectMeeting(project_id=project.id, meeting_id=sample_meeting.id),
+                ProjectMilestone(project_id=project.id, name="Done", completed_at=datetime(2099, 1, 1)),
+                ProjectMilestone(project_id=project.id, name="Open"),
+            ]
+        )
+        db_session.commit()
+
+        activity = ProjectService(db_session).get_project_activity(project.id, limit=10)
+
+        assert [item.type for item in activity] == ["milestone_completed", "meeting_added"]
+        assert activity[0].metadata["name"] == "Done"
+        assert activity[1].metadata == {"meeting_id": sample_meeting.id, "filename": sample_meeting.filename}
+
+        assert len(ProjectService(db_session).get_project_activity(project.id, limit=1)) == 1
+
+
+@pytest.mark.unit
+class TestProjectCreateResponse:
+    def test_create_project_metrics_match_get_project(self, db_session, sample_action_item):
+        db_session.add(Speaker(meeting_id=sample_action_item.meeting_id, name="Alice"))
+        db_session.commit()
+        service = ProjectService(db_session)
+
+        created = service.create_project(
+            schemas.ProjectCreate(name="Metrics", meeting_ids=[sample_action_item.meeting_id])
+        )
+
+        assert created == service.get_project(created.id)
+        assert created.meeting_count == 1
+        assert created.action_item_count == 1
+        assert created.member_count == 1
+
+
+@pytest.mark.unit
+class TestProjectChat:
+    async def test_chat_looks_up_default_model_config_once(self, db_session, monkeypatch):
+        from app.core.storage import rag
+        from app.modules.settings.service import SettingsService
+
+        calls = []
+
+        def _fake_default_config(_self):
+            calls.append(1)
+            return None
+
+        async def _fake_project_rag_response(*_args, **_kwargs):
+            return "Answer", [], []
+
+        async def _fake_title(*_args, **_kwargs):
+            raise RuntimeError("no provider")
+
+        monkeypatch.setattr(SettingsService, "get_default_model_configuration", _fake_default_config)
+        monkeypatch.setattr(rag, "generate_project_rag_response", _fake_project_rag_response)
+        monkeypatch.setattr(
+            "app.modules.projects.service.ProviderFactory.create_provider",
+            lambda _config: type("P", (), {"chat_completion": _fake_title})(),
+        )
+        project = Project(name="Chatty", status="active")
+        db_session.add(project)
+        db_session.commit()
+
+        response = await ProjectService(db_session).chat_with_project(
+            project.id, schemas.ProjectChatRequest(message="What is the status?")
+        )
+
+        assert response.message == "Answer"
+        assert len(calls) == 1
+
+    async def test_chat_titles_new_session_alongside_rag(self, db_session, monkeypatch):
+        from app.core.storage import rag
+
+        async def _fake_project_rag_response(*_args, **_kwargs):
+            return "Answer", [], []
+
+        async def _fake_title(*_args, **_kwargs):
+            return "Status Check"
+
+        monkeypatch.setattr(rag, "generate_project_rag_response", _fake_project_rag_response)
+        monkeypatch.setattr(
+            "app.modules.projects.service.ProviderFactory.create_provider",
+            lambda _config: type("P", (), {"chat_completion": _fake_title})(),
+        )
+        project = Project(name="Titled", status="active")
+        db_session.add(project)
+        db_session.commit()
+        service = ProjectService(db_session)
+        session = service.create_chat_session(project.id, schemas.ProjectChatSessionCreate())
+
+        await service.chat_with_project(
+            project.id, schemas.ProjectChatRequest(message="What is the status?", session_id=session.id)
+        )
+
+        assert [s.title for s in service.get_chat_sessions(project.id)] == ["Status Check"]
+
+    async def test_chat_does_not_start_title_task_when_setup_fails(self, db_session, monkeypatch):
+        titles = []
+
+        async def _fake_title(_self, message):
+            titles.append(message)
+            return "Title"
+
+        def _failing_meeting_ids(_self, _project):
+            raise RuntimeError("database unavailable")
+
+        monkeypatch.setattr(ProjectService, "_generate_chat_title", _fake_title)
+        monkeypatch.setattr(ProjectService, "_get_project_meeting_ids", _failing_meeting_ids)
+        project = Project(name="Broken", status="active")
+        db_session.add(project)
+        db_session.commit()
+        service = ProjectService(db_session)
+        session = service.create_chat_session(project.id, schemas.ProjectChatSessionCreate())
+
+        with pytest.raises(RuntimeError):
+            await service.chat_with_project(project.id, schemas.ProjectChatRequest(message="Hi", session_id=session.id))
+
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+        assert titles == []
+
+
+@pytest.mark.unit
+class TestProjectGantt:
+    def test_gantt_action_items_carry_meeting_info(self, db_session, sample_action_item):
+        # SQLite returns naive datetimes, so keep every Gantt date derived from
+        # the (tz-normalized) action item due date.
+        meeting = db_session.get(Meeting, sample_action_item.meeting_id)
+        meeting.meeting_date = None
+        undated = ActionItem(transcription_id=sample_action_item.transcription_id, task="Someday")
+        project = Project(name="Gantt", status="active")
+        db_session.add_all([project, undated])
+        db_session.commit()
+        db_session.add_all(
+            [
+                ProjectMeeting(project_id=project.id, meeting_id=meeting.id),
+                ProjectActionItem(project_id=project.id, action_item_id=sample_action_item.id),
+                ProjectActionItem(project_id=project.id, action_item_id=undated.id),
+            ]
+        )
+        db_session.commit()
+
+        gantt = ProjectService(db_session).get_gantt_data(project.id)
+
+        assert [item.type for item in gantt.items] == ["action_item"]
+        action = gantt.items[0]
+        assert action.metadata["meeting_id"] == meeting.id
+        assert action.metadata["meeting_title"] == meeting.filename
+        assert action.end_date.date().isoformat() == "2024-02-01"
+        assert gantt.date_range == {"start": action.start_date, "end": action.end_date}
+        assert schemas.GanttData.model_validate_json(gantt.model_dump_json()).items == gantt.items
+
+    def test_gantt_meeting_spans_estimated_duration(self, db_session, sample_meeting):
+        sample_meeting.estimated_duration = 30
+        project = Project(name="Meetings", status="active")
+        db_session.add(project)
+        db_session.commit()
+        db_session.add(ProjectMeeting(project_id=project.id, meeting_id=sample_meeting.id))
+        db_session.commit()
+
+        gantt = ProjectService(db_session).get_gantt_data(project.id)
+
+        [item] = gantt.items
+        assert item.id == f"meeting-{sample_meeting.id}"
+        assert item.name == sample_meeting.filename
+        assert (item.end_date - item.start_date).total_seconds() == 30 * 60
+        assert gantt.date_range == {"start": item.start_date, "end": item.end_date}
+        assert item.metadata == {
+            "meeting_id": sample_meeting.id,
+            "folder": sample_meeting.folder,
+            "status": "completed",
+        }
+
+    def test_add_gantt_link_persists_into_existing_settings(self, db_session):
+        project = Project(name="Links", status="active", settings={"theme": "dark", "gantt_links": []})
+        db_session.add(project)
+        db_session.commit()
+        service = ProjectService(db_session)
+
+        link = service.add_gantt_link(project.id, "meeting-1", "milestone-2")
+        assert service.add_gantt_link(project.id, "meeting-1", "milestone-2").id == link.id
+
+        db_session.expire_all()
+        stored = db_session.get(Project, project.id).settings
+        assert stored["theme"] == "dark"
+        assert [(s["id"], s["source"], s["target"]) for s in stored["gantt_links"]] == [
+            (link.id, "meeting-1", "milestone-2")
+        ]
+
+    def test_update_project_normalizes_gantt_links(self, db_session):
+        project = Project(name="Links", status="active")
+        db_session.add(project)
+        db_session.commit()
+
+        updated = ProjectService(db_session).update_project(
+            project.id,
+            schemas.ProjectUpdate(settings={"gantt_links": [{"source": "meeting-1", "target": "milestone-2"}, {}]}),
+        )
+
+        [link] = updated.settings["gantt_links"]
+        assert link["type"] == "e2s" and link["id"]
+        db_session.expire_all()
+        assert db_session.get(Project, project.id).settings["gantt_links"] == [link]
+
+    def test_gantt_normalizes_links_and_maps_dependencies(self, db_session, sample_action_item, monkeypatch):
+        from app import tasks
+
+        queued = []
+        monkeypatch.setattr(
+            tasks, "normalize_project_gantt_links", type("T", (), {"delay": staticmethod(queued.append)})
+        )
+        meeting = db_session.get(Meeting, sample_action_item.meeting_id)
+        meeting.meeting_date = None
+        target = f"action-{sample_action_item.id}"
+        project = Project(
+            name="Linked",
+            status="active",
+            settings={
+                "gantt_links": [
+                    {"source": "milestone-1", "target": target},
+                    {"source": "x"},
+                    {"id": "l2", "source": "meeting-2", "target": target, "type": "s2s"},
+                ]
+            },
+        )
+        db_session.add(project)
+        db_session.commit()
+        db_session.add(ProjectActionItem(project_id=project.id, action_item_id=sample_action_item.id))
+        db_session.commit()
+
+        gantt = ProjectService(db_session).get_gantt_data(project.id)
+
+        assert gantt.items[0].dependencies == ["milestone-1", "meeting-2"]
+        assert [(link.source, link.type) for link in gantt.links] == [("milestone-1", "e2s"), ("meeting-2", "s2s")]
+        assert gantt.links[0].id and gantt.links[1].id == "l2"
+
+        # The read only queues the write; the worker persists the same ids the client saw.
+        assert queued == [project.id]
+        db_session.refresh(project)
+        assert "id" not in project.settings["gantt_links"][0]
+        service = ProjectService(db_session)
+        assert service.normalize_project_gantt_links(project.id) is True
+        assert service.normalize_project_gantt_links(project.id) is False
+        db_session.refresh(project)
+        assert [link["id"] for link in project.settings["gantt_links"]] == [gantt.links[0].id, "l2"]
+
+        service.delete_gantt_link(project.id, gantt.links[0].id)
+        db_session.refresh(project)
+        assert [link["id"] for link in project.settings["gantt_links"]] == ["l2"]
+
+
+@pytest.mark.unit
+class TestProjectExport:
+    def test_export_data_includes_meetings_and_note_attachments(self, db_session, sample_action_item):
+        project = Project(name="Export", status="active")
+        db_session.add(project)
+        db_session.commit()
+        note = ProjectNote(project_id=project.id, title="Plan", content="Ship it")
+        db_session.add_all(
+            [
+                note,
+                ProjectMeeting(project_id=project.id, meeting_id=sample_action_item.meeting_id),
+                ProjectActionItem(project_id=project.id, action_item_id=sample_action_item.id),
+            ]
+        )
+        db_session.commit()
+        db_session.add_all(
+            [
+                ProjectNoteAttachment(
+                    project_id=project.id,
+                    note_id=note.id,
+                    filename=name,
+                    filepath=f"/tmp/{name}",
+                    uploaded_at=datetime(2024, 1, day),
+                )
+                for name, day in (("old.txt", 1), ("new.txt", 2))
+            ]
+        )
+        db_session.commit()
+
+        data = ProjectService(db_session).get_project_export_data(project.id)
+
+        assert [m["id"] for m in data["meetings"]] == [sample_action_item.meeting_id]
+        assert data["meetings"][0]["action_items_count"] == 1
+        assert [a["id"] for a in data["action_items"]] == [sample_action_item.id]
+        assert [a["filename"] for a in data["notes"][0]["attachments"]] == ["new.txt", "old.txt"]
+        assert data["metrics"]["meeting_count"] == 1
@@ -2,9 +2,22 @@
 Unit tests for the Search service and helper functions.
 """
 
+from types import SimpleNamespace
+
 import pytest
+from sqlalchemy.dialects import postgresql
 
-from app.modules.search.service import calculate_score, highlight_text
+from app.models import ActionItem
+from app.modules.search import service as search_service
+from app.modules.search.repository import SearchRepository
+from app.modules.search.schemas import SearchQuery
+from app.modules.search.service import (
+    SearchService,
+    calculate_score,
+    clear_search_cache,
+    highlight_text,
+    score_and_snippet,
+)
 
 
 @pytest.mark.unit
@@ -83,3 +96,193 @@ class TestCalculateScore:
     def test_some_words_match(self):
         score = calculate_score("alpha beta gamma", "alpha delta gamma")
         assert 0.5 < score < 1.0
+
+    def test_words_match_whole_words_ignoring_punctuation(self):
+        assert calculate_score("Budget review, then planning.", "planning budget") == 1.0
+        assert calculate_score("projects overview", "project plan") == 0.0
+
+    def test_score_and_snippet_matches_separate_helpers(self):
+        text = "The meeting discussed project deadlines and team allocation."
+        assert score_and_snippet(text, "team deadlines") == (
+            calculate_score(text, "team deadlines"),
+            highlight_text(text, "team deadlines"),
+        )
+        assert score_and_snippet(None, "query") == (0.0, "")
+
+
+@pytest.mark.unit
+class TestSearchRepository:
+    """Tests for the single-query content search."""
+
+    def test_search_content_returns_every_content_type(self, db_session, sample_action_item):
+        rows = list(
+            SearchRepository(db_session).search_content("test", ["transcripts", "summaries", "action_items", "notes"])
+        )
+
+        by_type = {row.content_type: row for row in rows}
+        assert sorted(by_type) == ["action_item", "note", "title", "transcript"]
+        assert by_type["action_item"].id == sample_action_item.id
+        assert by_type["action_item"].owner == "Test User"
+        assert by_type["transcript"].text == "Test transcript content"
+        assert {row.meeting_id for row in rows} == {sample_action_item.meeting_id}
+        # Substring fallback outside PostgreSQL carries no database rank or snippet
+        assert all(row.rank is None and row.snippet is None for row in rows)
+
+    def test_search_content_applies_meeting_filters(self, db_session, sample_meeting):
+        repository = SearchRepository(db_session)
+
+        assert list(repository.search_content("test", ["transcripts"], folder="other")) == []
+        assert [row.content_type for row in repository.search_content("test", [])] == ["title"]
+
+    def test_search_content_prefilters_tags_in_sql(self, db_session, sample_meeting):
+        repository = SearchRepository(db_session)
+
+        assert {r.meeting_id for r in repository.search_content("test", ["notes"], tags=["DEMO", "x"])} == {
+            sample_meeting.id
+        }
+        assert list(repository.search_content("test", ["notes"], tags=["d_mo"])) == []
+
+    def test_search_content_matches_summaries(self, db_session, sample_meeting):
+        [row] = SearchRepository(db_session).search_content("summary", ["summaries"])
+
+        assert (row.content_type, row.id) == ("summary", sample_meeting.transcription.id)
+        assert row.text == "Meeting summary"
+
+    @pytest.mark.parametrize("tags", [None, ["ai"]])
+    def test_search_content_caps_ranked_branches_only_without_tags(self, monkeypatch, tags):
+        statements = []
+        db = SimpleNamespace(execute=lambda statement: statements.append(statement) or [])
+        repository = SearchRepository(db)
+        monkeypatch.setattr(repository, "_uses_full_text_search", lambda: True)
+
+        list(repository.search_content("test", ["transcripts"], tags=tags, limit=5))
+
+        sql = str(statements[0].compile(dialect=postgresql.dialect()))
+        # Tags are matched exactly after the query, so a LIMIT could drop tagged meetings
+        assert ("LIMIT" in sql) is (tags is None)
+        assert ("count(*) OVER ()" in sql) is (tags is None)
+
+
+@pytest.mark.unit
+class TestSearchServiceQueries:
+    def test_unified_search_filters_tags(self, db_session, sample_meeting):
+        service = SearchService(db_session)
+
+        matched = service.unified_search(SearchQuery(query="test", tags=["Demo"]))
+        missed = service.unified_search(SearchQuery(query="test", tags=["other"]))
+
+        assert {r.content_type for r in matched.results} == {"transcript", "note", "title"}
+        assert all(r.tags == ["test", "demo"] for r in matched.results)
+        assert missed.results == []
+
+    def test_unified_search_tag_filter_ignores_spacing_and_case(self, db_session, sample_meeting):
+        sample_meeting.tags = " Alpha ,  Demo Day,beta "
+        db_session.commit()
+        service = SearchService(db_session)
+
+        assert service.unified_search(SearchQuery(query="test", tags=["demo day"])).total == 3
+        assert service.unified_search(SearchQuery(query="test", tags=["BETA"])).total == 3
+        assert service.unified_search(SearchQuery(query="test", tags=["demo"])).total == 0
+
+    def test_unified_search_keeps_one_result_per_meeting_and_type(self, db_session, sample_action_item):
+        db_session.add(ActionItem(transcription_id=sample_action_item.transcription_id, task="Test review"))
+        db_session.commit()
+        service = SearchService(db_session)
+
+        response = service.unified_search(SearchQuery(query="test", search_in=["action_items"]))
+        limited = service.unified_search(SearchQuery(query="test", search_in=["action_items"], limit=1))
+
+        assert sorted(r.content_type for r in response.results) == ["action_item", "title"]
+        assert response.total == limited.total == 2
+        assert len(limited.results) == 1
+
+    def test_unified_search_builds_snippets_for_returned_results_only(self, db_session, sample_meeting, monkeypatch):
+        calls = []
+        monkeypatch.setattr(search_service, "_row_snippet", lambda row, query: calls.append(row) or "")
+
+        response = SearchService(db_session).unified_search(SearchQuery(query="test", limit=1))
+
+        assert response.total == 3
+        assert len(response.results) == len(calls) == 1
+
+    def test_unified_search_total_counts_matches_beyond_capped_branches(self, db_session, monkeypatch):
+        def row(content_type, meeting_id, branch_total=None):
+            return SimpleNamespace(
+                content_type=content_type,
+                id=meeting_id,
+                meeting_id=meeting_id,
+                meeting_title=f"meeting {meeting_id}",
+                meeting_date=None,
+                folder=None,
+                tags=None,
+                text=None,
+                owner=None,
+                notes=None,
+                rank=0.5,
+                snippet="...",
+                branch_total=branch_total,
+            )
+
+        service = SearchService(db_session)
+        # Two of 40 ranked transcript matches come back, plus one uncapped note
+        rows = [row("transcript", 1, 40), row("transcript", 2, 40), row("note", 3)]
+        monkeypatch.setattr(service.repository, "search_content", lambda *args, **kwargs: iter(rows))
+
+        response = service.unified_search(SearchQuery(query="capped", search_in=["transcripts", "notes"], limit=2))
+
+        assert len(response.results) == 2
+        assert response.total == 41
+
+    def test_quick_search_lists_meeting_titles(self, db_session, sample_meeting):
+        [result] = SearchService(db_session).quick_search("test_meet", 5)["results"]
+
+        assert result == {
+            "id": sample_meeting.id,
+            "title": "test_meeting.wav",
+            "type": "meeting",
+            "folder": "test-folder",
+            "date": sample_meeting.meeting_date.isoformat(),
+        }
+
+    def test_quick_search_includes_action_item_meeting(self, db_session, sample_action_item):
+        results = SearchService(db_session).quick_search("action", 5)["results"]
+
+        assert results == [
+            {
+                "id": sample_action_item.id,
+                "title": "Test action item",
+                "type": "action_item",
+                "meeting_id": sample_action_item.meeting_id,
+                "meeting_title": "test_meeting.wav",
+            }
+        ]
+
+
+@pytest.mark.unit
+class TestSearchCache:
+    def test_repeated_search_is_served_from_cache(self, db_session, sample_meeting, monkeypatch):
+        service = SearchService(db_session)
+        first = service.unified_search(SearchQuery(query="test", search_in=["notes", "transcripts"]))
+
+        def _fail(*_args, **_kwargs):
+            raise AssertionError("expected a cache hit")
+
+        monkeypatch.setattr(service.repository, "search_content", _fail)
+        monkeypatch.setattr(service.repository, "search_meeting_titles_quick", _fail)
+        # Same filters in another order hit the cache; the quick search is cached separately
+        again = service.unified_search(SearchQuery(query=" test ", search_in=["transcripts", "notes"]))
+        assert again.results == first.results and again.total == first.total
+
+        with pytest.raises(AssertionError):
+            service.quick_search("test", 5)
+
+    def test_clear_search_cache_forces_a_fresh_query(self, db_session, sample_meeting):
+        service = SearchService(db_session)
+        assert service.quick_search("test_meet", 5)["results"]
+
+        sample_meeting.filename = "renamed.wav"
+        db_session.commit()
+        assert service.quick_search("test_meet", 5)["results"]
+
+        clear_search_cache()
+        assert service.quick_search("test_meet", 5)["results"] == []
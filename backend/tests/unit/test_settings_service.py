@@ -3,8 +3,12 @@ Unit tests for the Settings service helper functions.
 """
 
 import pytest
+from sqlalchemy.exc import IntegrityError
 
-from app.modules.settings.service import mask_api_key
+from app.modules.settings import schemas
+from app.modules.settings.models import ModelConfiguration
+from app.modules.settings.repository import GoogleDriveRepository
+from app.modules.settings.service import SettingsService, mask_api_key
 
 
 @pytest.mark.unit
@@ -44,3 +48,83 @@ class TestSettingsServiceHelpers:
         result = mask_api_key("sk-proj-12345678901234567890")
         # Should contain some visible characters
         assert len(result) > 0
+
+
+@pytest.mark.unit
+class TestDefaultModelConfigurationCache:
+    """The default model configuration is served from a short-lived snapshot."""
+
+    def test_default_configuration_is_cached(self, db_session):
+        service = SettingsService(db_session)
+        created = service.create_model_configuration(schemas.ModelConfigurationCreate(name="Default"))
+
+        first = service.get_default_model_configuration()
+        db_session.query(ModelConfiguration).update({ModelConfiguration.chat_model: "changed-elsewhere"})
+        db_session.commit()
+
+        assert first.id == created.id
+        assert service.get_default_model_configuration().chat_model == "gpt-4o-mini"
+
+    def test_writes_through_service_refresh_the_snapshot(self, db_session):
+        service = SettingsService(db_session)
+        created = service.create_model_configuration(schemas.ModelConfigurationCreate(name="Default"))
+        service.get_default_model_configuration()
+
+        service.update_model_configuration(created.id, schemas.ModelConfigurationUpdate(chat_model="gpt-4o"))
+
+        assert service.get_default_model_configuration().chat_model == "gpt-4o"
+
+
+@pytest.mark.unit
+class TestSingleDefaultModelConfiguration:
+    """Only one model configuration can be the default."""
+
+    def test_set_default_moves_the_flag(self, db_session):
+        service = SettingsService(db_session)
+        service.create_model_configuration(schemas.ModelConfigurationCreate(name="First"))
+        second = service.create_model_configuration(schemas.ModelConfigurationCreate(name="Second"))
+
+        service.set_default_model_configuration(second.id)
+
+        defaults = db_session.query(ModelConfiguration).filter(ModelConfiguration.is_default == True).all()  # noqa: E712
+        assert [c.id for c in defaults] == [second.id]
+        assert service.get_default_model_configuration().id == second.id
+
+    def test_default_moves_back_to_an_older_configuration(self, db_session):
+        service = SettingsService(db_session)
+        first = service.create_model_configuration(schemas.ModelConfigurationCreate(name="First"))
+        second = service.create_model_configuration(schemas.ModelConfigurationCreate(name="Second"))
+        service.set_default_model_configuration(second.id)
+
+        service.set_default_model_configuration(first.id)
+
+        defaults = db_session.query(ModelConfiguration).filter(ModelConfiguration.is_default == True).all()  # noqa: E712
+        assert [c.id for c in defaults] == [first.id]
+
+        service.update_model_configuration(second.id, schemas.ModelConfigurationUpdate(is_default=True))
+        service.update_model_configuration(first.id, schemas.ModelConfigurationUpdate(is_default=True))
+
+        defaults = db_session.query(ModelConfiguration).filter(ModelConfiguration.is_default == True).all()  # noqa: E712
+        assert [c.id for c in defaults] == [first.id]
+
+    def test_database_rejects_a_second_default(self, db_session):
+        service = SettingsService(db_session)
+        service.create_model_configuration(schemas.ModelConfigurationCreate(name="First"))
+
+        with pytest.raises(IntegrityError), db_session.begin_nested():
+            db_session.add(ModelConfiguration(name="Rogue", is_default=True))
+
+
+@pytest.mark.unit
+class TestGoogleDriveProcessedFiles:
+    """Processed Drive files are checked and recorded in batches during sync."""
+
+    def test_mark_files_as_processed_and_lookup(self, db_session):
+        repository = GoogleDriveRepository(db_session)
+        repository.mark_file_as_processed("a", "a.wav")
+
+        repository.mark_files_as_processed([("b", "b.txt"), ("c", "c.pdf")])
+
+        assert repository.get_processed_file_ids(["a", "b", "c", "d"]) == {"a", "b", "c"}
+        assert repository.get_processed_file_ids([]) == set()
+        assert {f.drive_file_name for f in repository.get_processed_files()} == {"a.wav", "b.txt", "c.pdf"}